@@ -0,0 +1,175 @@
+"""
+Coffee Bros - Platform Index Benchmark
+Measures per-frame physics time for Player, Polocho and CorruptionBoss updates on
+synthetic levels of growing width, comparing a full platform scan against the
+static PlatformIndex built by Level.load_from_file.
+
+Run from the project root:
+    python benchmarks/bench_platform_index.py
+"""
+
+import collections
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+# Run without opening a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.entities import Player, Platform, Polocho, CorruptionBoss
+from src.optimization import PlatformIndex
+
+LEVEL_WIDTHS = [5000, 20000, 50000]  # Synthetic level widths in pixels
+PLATFORMS_PER_1000PX = 60  # Platform density - 50,000px level gets 3,000 platforms
+NUM_POLOCHOS = 300  # Enemies patrolling the level
+FRAMES = 120  # Simulated frames per measurement
+
+
+def build_platform_data(level_width, seed=1234):
+    """
+    Generate platform rectangles for a synthetic level.
+
+    Args:
+        level_width (int): Level width in pixels
+        seed (int): Random seed so every run builds the same level
+
+    Returns:
+        list: List of (x, y, width, height) tuples
+    """
+    rng = random.Random(seed)
+    data = []
+
+    # Ground segments with small gaps along the whole level
+    x = 0
+    while x < level_width:
+        width = rng.randint(300, 800)
+        data.append((x, 550, width, 50))
+        x += width + rng.choice([0, 0, 60, 100])
+
+    # Floating platforms to reach the requested density
+    target = level_width * PLATFORMS_PER_1000PX // 1000
+    while len(data) < target:
+        data.append((rng.randint(0, level_width - 100), rng.randint(150, 480),
+                     rng.randint(50, 250), 20))
+
+    return data
+
+
+def build_entities(platform_data, level_width, seed=99):
+    """
+    Create platforms, enemies, a player and a boss for a synthetic level.
+
+    Args:
+        platform_data (list): Platform rectangles from build_platform_data()
+        level_width (int): Level width in pixels
+        seed (int): Random seed for enemy placement
+
+    Returns:
+        tuple: (platforms group, list of Polochos, Player, CorruptionBoss)
+    """
+    rng = random.Random(seed)
+    platforms = pygame.sprite.Group()
+    for x, y, width, height in platform_data:
+        platforms.add(Platform(x, y, width, height))
+
+    # Entity constructors log to stdout - keep benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        enemies = [Polocho(rng.randint(0, level_width - 40), 500, rng.randint(80, 200))
+                   for _ in range(NUM_POLOCHOS)]
+        player = Player(100, 400)
+    boss = CorruptionBoss(level_width // 2, 550)
+
+    return platforms, enemies, player, boss
+
+
+def run_physics(platforms, enemies, player, boss, level_width):
+    """
+    Step the physics for FRAMES frames.
+
+    Args:
+        platforms (pygame.sprite.Group or PlatformIndex): Platforms passed to update()
+        enemies (list): Polocho enemies
+        player (Player): Player holding the right arrow key
+        boss (CorruptionBoss): Boss patrolling the level
+        level_width (int): Level width in pixels
+
+    Returns:
+        float: Average physics time per frame in milliseconds
+    """
+    # Key codes like K_RIGHT are too large for a list, use a dict-backed key state
+    keys = collections.defaultdict(bool, {pygame.K_RIGHT: True})
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        player.update(keys, platforms, level_width)
+        for enemy in enemies:
+            enemy.update(platforms)
+        boss.update(platforms)
+    elapsed = time.perf_counter() - start
+
+    return elapsed * 1000 / FRAMES
+
+
+def snapshot(enemies, player, boss):
+    """Capture entity positions and state so both runs can be compared."""
+    state = [(e.rect.topleft, e.direction, e.velocity_y, e.is_grounded) for e in enemies]
+    state.append((player.rect.topleft, player.velocity_y, player.is_grounded))
+    state.append((boss.rect.topleft, boss.vel_y, boss.on_ground))
+    return state
+
+
+def main():
+    """Run the benchmark for every level width and print a comparison table."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print("\n" + "=" * 70)
+    print("COFFEE BROS - PLATFORM INDEX BENCHMARK")
+    print(f"{NUM_POLOCHOS} Polochos + player + boss, {FRAMES} frames per run")
+    print("=" * 70)
+    print(f"{'Width':>8} {'Platforms':>10} {'Full scan':>12} {'Indexed':>12} {'Speedup':>9} {'Same':>6}")
+
+    all_identical = True
+    for level_width in LEVEL_WIDTHS:
+        platform_data = build_platform_data(level_width)
+
+        # Full scan of the platform group (previous behaviour)
+        platforms, enemies, player, boss = build_entities(platform_data, level_width)
+        scan_ms = run_physics(platforms, enemies, player, boss, level_width)
+        scan_state = snapshot(enemies, player, boss)
+
+        # Broad-phase platform index (Level.load_from_file behaviour)
+        platforms, enemies, player, boss = build_entities(platform_data, level_width)
+        platform_index = PlatformIndex(platforms)
+        index_ms = run_physics(platform_index, enemies, player, boss, level_width)
+        index_state = snapshot(enemies, player, boss)
+
+        identical = scan_state == index_state
+        all_identical = all_identical and identical
+        speedup = scan_ms / index_ms if index_ms > 0 else 0
+        print(f"{level_width:>8} {len(platform_data):>10} {scan_ms:>10.2f}ms {index_ms:>10.2f}ms "
+              f"{speedup:>8.1f}x {'yes' if identical else 'NO':>6}")
+
+    print("=" * 70)
+    if all_identical:
+        print("Collision results identical between full scan and platform index")
+    else:
+        print("WARNING: platform index produced different collision results!")
+    print("=" * 70 + "\n")
+
+    pygame.quit()
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Coffee Bros - Player Powerup Expiry Benchmark
+Measures Player.update frame time during the last 3 seconds of a powerup, when
+the expiry warning calls _update_appearance every frame. Compares the shared
+frame atlas against the previous behaviour of redrawing every animation frame.
+
+Run from the project root:
+    python benchmarks/bench_player_powerup_expiry.py
+"""
+
+import collections
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+# Run without opening a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.entities import Player, Platform
+
+EXPIRY_WINDOW = 180  # Frames of powerup expiry warning (powerup_timer < 180)
+RUNS = 5  # Repeat the window to smooth out noise
+
+
+class RegeneratingPlayer(Player):
+    """Player that redraws every animation frame on each appearance update (previous behaviour)"""
+
+    def _update_appearance(self):
+        self.walk_frames = self._generate_walk_frames()
+        self.jump_frame = self._generate_jump_frame()
+        self.fall_frame = self._generate_fall_frame()
+        self.idle_frames = self._generate_idle_frames()
+        self.shoot_frames = self._generate_shoot_frames()
+        super()._update_appearance()
+
+
+def measure(player_class):
+    """
+    Time Player.update through the powerup expiry window.
+
+    Args:
+        player_class (type): Player class to benchmark
+
+    Returns:
+        list: Per-frame update times in milliseconds
+    """
+    platforms = pygame.sprite.Group(Platform(0, 550, 100000, 50))
+    keys = collections.defaultdict(bool, {pygame.K_RIGHT: True})
+    frame_times = []
+
+    for _ in range(RUNS):
+        with contextlib.redirect_stdout(io.StringIO()):
+            player = player_class(100, 490)
+        player.collect_powerup()
+        player.powerup_timer = EXPIRY_WINDOW - 1
+
+        for _ in range(EXPIRY_WINDOW):
+            start = time.perf_counter()
+            player.update(keys, platforms, 100000)
+            frame_times.append((time.perf_counter() - start) * 1000)
+
+    return frame_times
+
+
+def main():
+    """Run the benchmark and print before/after frame times."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    # Build the shared atlas up front so its one-time cost is not counted
+    with contextlib.redirect_stdout(io.StringIO()):
+        Player(0, 0)
+
+    before = measure(RegeneratingPlayer)
+    after = measure(Player)
+
+    print("\n" + "=" * 70)
+    print("COFFEE BROS - PLAYER POWERUP EXPIRY BENCHMARK")
+    print(f"{EXPIRY_WINDOW} frames x {RUNS} runs with powerup_timer < {EXPIRY_WINDOW}")
+    print("=" * 70)
+    print(f"{'':<22} {'mean':>10} {'median':>10} {'max':>10}")
+    for label, times in (("Redraw frames", before), ("Shared frame atlas", after)):
+        print(f"{label:<22} {statistics.mean(times):>8.3f}ms {statistics.median(times):>8.3f}ms "
+              f"{max(times):>8.3f}ms")
+    speedup = statistics.mean(before) / statistics.mean(after)
+    print("=" * 70)
+    print(f"Speedup: {speedup:.1f}x")
+    print("=" * 70 + "\n")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
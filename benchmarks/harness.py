@@ -0,0 +1,151 @@
+"""
+Coffee Bros - Benchmark Harness
+Timing, statistics and JSON result helpers shared by the benchmark suite.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+
+def time_samples(fn, samples, warmup=0, setup=None):
+    """
+    Time repeated calls of a function.
+
+    Args:
+        fn (callable): Function to time (called with setup's return value if setup is given)
+        samples (int): Number of timed calls
+        warmup (int): Untimed calls before measuring (fills caches)
+        setup (callable): Optional untimed function run before every call
+
+    Returns:
+        list: Call durations in milliseconds
+    """
+    def call():
+        if setup is None:
+            start = time.perf_counter()
+            fn()
+        else:
+            arg = setup()
+            start = time.perf_counter()
+            fn(arg)
+        return (time.perf_counter() - start) * 1000
+
+    for _ in range(warmup):
+        call()
+    return [call() for _ in range(samples)]
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile.
+
+    Args:
+        samples (list): Measured values
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: Value at the given percentile
+    """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """
+    Summarize timing samples.
+
+    Args:
+        samples (list): Durations in milliseconds
+
+    Returns:
+        dict: median_ms, p95_ms, mean_ms, min_ms, max_ms and sample count
+    """
+    return {
+        'median_ms': statistics.median(samples),
+        'p95_ms': percentile(samples, 95),
+        'mean_ms': statistics.mean(samples),
+        'min_ms': min(samples),
+        'max_ms': max(samples),
+        'samples': len(samples),
+    }
+
+
+def environment_info():
+    """Describe the machine and code version the results were measured on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    import pygame
+    return {
+        'commit': commit,
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': sys.version.split()[0],
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+    }
+
+
+def save_results(path, results):
+    """
+    Write benchmark results to a JSON file.
+
+    Args:
+        path (str): Output file path
+        results (dict): Benchmark name -> summary from summarize()
+    """
+    with open(path, 'w') as f:
+        json.dump({'environment': environment_info(), 'results': results}, f, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """
+    Read benchmark results written by save_results().
+
+    Args:
+        path (str): JSON file path
+
+    Returns:
+        dict: Benchmark name -> summary
+    """
+    with open(path, 'r') as f:
+        return json.load(f)['results']
+
+
+def compare_results(current, baseline, threshold, metric='median_ms', min_delta_ms=0.01):
+    """
+    Compare results against a baseline run.
+
+    Args:
+        current (dict): Benchmark name -> summary for this run
+        baseline (dict): Benchmark name -> summary for the baseline run
+        threshold (float): Allowed slowdown as a fraction (0.10 = 10% slower)
+        metric (str): Summary field to compare
+        min_delta_ms (float): Slowdowns smaller than this are timer noise, never regressions
+
+    Returns:
+        list: (name, baseline value, current value, relative change, regressed) tuples
+            for every benchmark present in both runs
+    """
+    rows = []
+    for name in sorted(current):
+        if name not in baseline:
+            continue
+        before = baseline[name][metric]
+        after = current[name][metric]
+        change = (after - before) / before if before > 0 else 0.0
+        regressed = change > threshold and after - before > min_delta_ms
+        rows.append((name, before, after, change, regressed))
+    return rows
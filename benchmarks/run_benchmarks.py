@@ -0,0 +1,643 @@
+"""
+Coffee Bros - Benchmark Suite
+Times the hot paths of the game at several level scales and reports median / p95
+frame costs. Results can be written to JSON and compared against a previous run
+to catch performance regressions between commits.
+
+Scales:
+    stock  - the shipped level (level 1; level load/reset also cover levels 1-5)
+    10x    - level 1 tiled 10 times horizontally
+    100x   - level 1 tiled 100 times horizontally
+    100x_streaming - the 100x level with chunk streaming enabled (load and session step only)
+
+level_data_load[json|compiled] compares reading a level's data from its JSON file
+and from its compiled file (see src/compiled_level.py).
+
+Run from the project root:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json --threshold 0.10
+"""
+
+import argparse
+import collections
+import contextlib
+import copy
+import io
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+
+# Run without opening a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# Add parent directory to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.compiled_level import load_level_data
+from src.draw_utils import draw_tiled_background
+from src.entities import Laser, Polocho, GoldenArepa, Mermelada
+from src.entities.particle import Particle, ParticleSystem
+from src.game_session import GameSession
+from src.headless import scripted_keys
+from src.level import Level
+from src.parallax import ParallaxLayer, ParallaxBackground
+from src.optimization import (SpatialGrid, ObjectPool, OptimizedRenderer, optimize_collision_detection,
+                              limit_particle_count)
+from src.performance_monitor import PerformanceMonitor
+from src.text_renderer import TextRenderer
+from harness import time_samples, summarize, save_results, load_results, compare_results
+
+SCALES = collections.OrderedDict([("stock", 1), ("10x", 10), ("100x", 100)])
+STOCK_LEVELS = [1, 2, 3, 4, 5]
+BASE_LEVEL = 1  # Stock level tiled to build the synthetic levels
+STREAMED_LEVEL = 101  # Level file of the 100x level with chunk streaming enabled
+SEED = 1234
+
+# Timed samples per benchmark (frame benchmarks, level load/reset per scale)
+FRAME_SAMPLES = 300
+LOAD_SAMPLES = {"stock": 20, "10x": 10, "100x": 3, "100x_streaming": 20}
+
+
+def quiet():
+    """Silence entity and level logging while benchmarking."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def build_tiled_level(level_data, copies, level_number):
+    """
+    Build a synthetic level by repeating a level horizontally.
+
+    Args:
+        level_data (dict): Parsed level JSON
+        copies (int): Number of copies side by side
+        level_number (int): Level number written to the metadata
+
+    Returns:
+        dict: Level JSON data
+    """
+    width = level_data["metadata"]["width"]
+    tiled = copy.deepcopy(level_data)
+    tiled["metadata"]["width"] = width * copies
+    tiled["metadata"]["level_number"] = level_number
+    tiled["metadata"]["name"] = f"{level_data['metadata']['name']} x{copies}"
+
+    for key, x_field in (("platforms", "x"), ("enemies", "spawn_x"), ("powerups", "x"), ("pits", "x")):
+        items = level_data.get(key, [])
+        tiled[key] = [dict(item, **{x_field: item.get(x_field, 0) + width * i})
+                      for i in range(copies) for item in items]
+
+    if "goal" in tiled:
+        tiled["goal"]["x"] += width * (copies - 1)
+    return tiled
+
+
+def prepare_workspace(workspace):
+    """
+    Fill a working directory with the game assets and the synthetic levels, and switch to it.
+
+    Level.load_from_file reads assets relative to the working directory, so the
+    workspace links every asset folder except levels, which holds copies of the
+    stock levels plus level_10.json and level_100.json (the 10x / 100x levels)
+    and level_101.json (the 100x level, streamed).
+
+    Args:
+        workspace (str): Empty directory to fill (deleted by the caller after the run)
+    """
+    assets = os.path.join(workspace, "assets")
+    levels = os.path.join(assets, "levels")
+    os.makedirs(levels)
+
+    source_assets = os.path.join(PROJECT_ROOT, "assets")
+    for name in os.listdir(source_assets):
+        if name != "levels":
+            os.symlink(os.path.join(source_assets, name), os.path.join(assets, name))
+
+    for level_number in STOCK_LEVELS:
+        with open(os.path.join(source_assets, "levels", f"level_{level_number}.json")) as f:
+            data = json.load(f)
+        with open(os.path.join(levels, f"level_{level_number}.json"), 'w') as f:
+            json.dump(data, f)
+        if level_number == BASE_LEVEL:
+            base_data = data
+
+    for scale, copies in SCALES.items():
+        if copies > 1:
+            with open(os.path.join(levels, f"level_{copies}.json"), 'w') as f:
+                json.dump(build_tiled_level(base_data, copies, copies), f)
+
+    streamed = build_tiled_level(base_data, SCALES["100x"], STREAMED_LEVEL)
+    streamed["metadata"]["streaming"] = True
+    with open(os.path.join(levels, f"level_{STREAMED_LEVEL}.json"), 'w') as f:
+        json.dump(streamed, f)
+
+    os.chdir(workspace)
+
+
+def level_number_for(scale):
+    """Level file number holding the level for a scale."""
+    copies = SCALES[scale]
+    return BASE_LEVEL if copies == 1 else copies
+
+
+def load_level(level_number):
+    """Load a level without logging."""
+    with quiet():
+        return Level.load_from_file(level_number)
+
+
+def bench_player_update(level, samples):
+    """Player.update for one frame, holding right and jumping periodically."""
+    player = level.player
+    level_width = level.metadata["width"]
+    frame = [0]
+
+    def setup():
+        frame[0] += 1
+        if player.rect.top > WINDOW_HEIGHT:
+            level.respawn_player()
+        keys = collections.defaultdict(bool)
+        keys[pygame.K_RIGHT] = True
+        keys[pygame.K_SPACE] = frame[0] % 50 < 20
+        return keys
+
+    return time_samples(lambda keys: player.update(keys, level.platform_index, level_width),
+                        samples, warmup=10, setup=setup)
+
+
+def bench_polocho_update(level, samples):
+    """Polocho.update for every enemy in the level for one frame."""
+    enemies = list(level.enemies)
+
+    def frame():
+        for enemy in enemies:
+            enemy.update(level.platform_index)
+
+    return time_samples(frame, samples, warmup=10)
+
+
+def bench_polocho_spawn(samples, count=50):
+    """Creating a batch of Polocho enemies (level load, reset and streaming all spawn them)."""
+    def spawn():
+        with quiet():
+            for i in range(count):
+                Polocho(i * 60, 300, 150)
+
+    return time_samples(spawn, samples, warmup=1)
+
+
+def bench_projectile_spawn(samples):
+    """A boss volley of 8 mermeladas plus a falling power-up and a player shot."""
+    def spawn():
+        for i in range(8):
+            Mermelada(400, 300, i * 0.785)
+        GoldenArepa(400, -50)
+        Laser(100, 300, 1)
+
+    return time_samples(spawn, samples, warmup=1)
+
+
+def bench_laser_collisions(level, samples, scale_copies):
+    """Laser/enemy collision phase (grid refresh plus one query per laser) for one frame."""
+    rng = random.Random(SEED)
+    level_width = level.metadata["width"]
+    lasers = pygame.sprite.Group()
+    for _ in range(10 * scale_copies):
+        lasers.add(Laser(rng.randint(0, level_width), rng.randint(300, 540), rng.choice([-1, 1])))
+    enemies = level.enemies
+    grid = SpatialGrid(cell_size=100)
+
+    def setup():
+        # Move lasers like Laser.update does, wrapping inside the level
+        for laser in lasers:
+            laser.rect.x = (laser.rect.x + laser.direction * 8) % level_width
+        return None
+
+    def phase(_):
+        grid.refresh(enemies, lasers)
+        hits = 0
+        for laser in lasers:
+            hits += len(optimize_collision_detection(laser, enemies, grid))
+        return hits
+
+    return time_samples(phase, samples, warmup=5, setup=setup)
+
+
+def bench_particles(samples, bursts, pool=None):
+    """ParticleSystem.create_* bursts plus particle updates and the particle cap for one frame."""
+    rng = random.Random(SEED)
+    particles = pygame.sprite.Group()
+
+    def frame():
+        for _ in range(bursts):
+            x, y = rng.randint(0, 800), rng.randint(100, 500)
+            ParticleSystem.create_stomp_particles(x, y, particles, pool)
+            ParticleSystem.create_powerup_particles(x, y, particles, pool)
+        for particle in particles:
+            particle.update()
+        limit_particle_count(particles, max_particles=100)
+
+    return time_samples(frame, samples, warmup=10)
+
+
+def bench_platform_draw(level, samples):
+    """Drawing the level's platforms for one frame while the camera scrolls across the level."""
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    level_width = level.metadata.get("width", WINDOW_WIDTH)
+    camera_positions = itertools.cycle(range(0, max(1, level_width - WINDOW_WIDTH), 37))
+
+    return time_samples(lambda: level.platform_chunks.draw(screen, next(camera_positions)), samples, warmup=1)
+
+
+def bench_sprite_draw(level, samples, indexed=True):
+    """
+    Drawing the level's sprites for one frame while the camera scrolls across the level,
+    through the culling index or walking every sprite.
+    """
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    renderer = OptimizedRenderer(screen)
+    sprites = level.all_sprites if indexed else list(level.all_sprites)
+    level_width = level.metadata.get("width", WINDOW_WIDTH)
+    camera_positions = itertools.cycle(range(0, max(1, level_width - WINDOW_WIDTH), 37))
+
+    def frame():
+        renderer.dirty_rects.clear()
+        renderer.draw_sprites_with_offset(sprites, next(camera_positions))
+
+    return time_samples(frame, samples, warmup=1)
+
+
+def bench_session_step(level_number, samples):
+    """GameSession.update for one simulation step while running right through the level."""
+    session = GameSession()
+    with quiet():
+        session.start_new_game(level_number)
+    frame = [0]
+
+    def setup():
+        frame[0] += 1
+        session.player.lives = 3  # Keep playing - game over is main.py's business
+        return scripted_keys(frame[0], session)
+
+    def step(keys):
+        with quiet():
+            session.update(keys)
+
+    return time_samples(step, samples, warmup=10, setup=setup)
+
+
+def bench_level_load(level_number, samples):
+    """Level.load_from_file from JSON to ready-to-play entities."""
+    return time_samples(lambda: load_level(level_number), samples, warmup=1)
+
+
+def bench_level_data_load(level_number, samples, use_compiled):
+    """load_level_data for a level file, parsing the JSON or reading the compiled file."""
+    level_file = os.path.join("assets", "levels", f"level_{level_number}.json")
+    return time_samples(lambda: load_level_data(level_file, use_compiled), samples, warmup=1)
+
+
+def bench_level_reset(level, samples):
+    """Level.reset_level after a death."""
+    def reset():
+        with quiet():
+            level.reset_level()
+
+    return time_samples(reset, samples, warmup=1)
+
+
+def bench_background_draw(background_image, level_width, samples):
+    """draw_tiled_background for one frame while the camera scrolls across the level."""
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    camera_positions = itertools.cycle(range(0, max(1, level_width - WINDOW_WIDTH), 37))
+
+    def draw():
+        draw_tiled_background(screen, background_image, next(camera_positions), level_width,
+                              WINDOW_WIDTH, WINDOW_HEIGHT)
+
+    return time_samples(draw, samples, warmup=1)
+
+
+def build_parallax_stack():
+    """
+    Four-layer parallax background at window size: a static sky, an opaque far
+    layer, a translucent mid layer over the lower half and a narrow near layer.
+    """
+    sky = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    sky.fill((135, 206, 235))
+    far = pygame.image.load(os.path.join("assets", "images", "andes_mountains.png"))
+    mid = pygame.Surface((3200, WINDOW_HEIGHT // 2), pygame.SRCALPHA)
+    for x in range(0, 3200, 160):
+        pygame.draw.polygon(mid, (40, 90, 40, 220), [(x, WINDOW_HEIGHT // 2), (x + 80, 40), (x + 160, WINDOW_HEIGHT // 2)])
+    near = pygame.Surface((96, 120), pygame.SRCALPHA)
+    pygame.draw.rect(near, (60, 40, 20, 255), (40, 20, 16, 100))
+    pygame.draw.circle(near, (30, 120, 30, 255), (48, 30), 30)
+
+    layers = [
+        ParallaxLayer(sky, scroll_factor=0, window_width=WINDOW_WIDTH),
+        ParallaxLayer(far, scroll_factor=0.2, window_width=WINDOW_WIDTH),
+        ParallaxLayer(mid, scroll_factor=0.5, y=WINDOW_HEIGHT // 2, window_width=WINDOW_WIDTH),
+        ParallaxLayer(near, scroll_factor=0.8, y=WINDOW_HEIGHT - 120, window_width=WINDOW_WIDTH),
+    ]
+    return ParallaxBackground(layers, WINDOW_WIDTH, WINDOW_HEIGHT, (135, 206, 235))
+
+
+def bench_parallax_draw(samples, scrolling=True):
+    """ParallaxBackground.draw of the four-layer stack for one frame."""
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    background = build_parallax_stack()
+    if scrolling:
+        camera_positions = itertools.cycle(range(0, 20000, 5))
+    else:
+        camera_positions = itertools.repeat(1234)
+
+    return time_samples(lambda: background.draw(screen, next(camera_positions)), samples, warmup=2)
+
+
+def bench_hud_text(samples, cached=True):
+    """HUD score and powerup timer for one frame, counting like in play (timer every frame, score every second)."""
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    renderer = TextRenderer()
+    font = renderer.get_font(36) if cached else pygame.font.Font(None, 36)
+    frame_numbers = itertools.count()
+
+    def frame():
+        frame_number = next(frame_numbers)
+        score_text = f"SCORE: {(frame_number // 60 * 100) % 100000:05d}"
+        timer_text = f"POWERUP: {(600 - frame_number % 600) / 60:.1f}s"
+        if cached:
+            renderer.draw_text(screen, font, score_text, (255, 255, 255), topleft=(10, 10))
+            renderer.draw_text(screen, font, timer_text, (255, 215, 0), midtop=(WINDOW_WIDTH // 2, 10))
+        else:
+            screen.blit(font.render(score_text, True, (255, 255, 255)), (10, 10))
+            timer = font.render(timer_text, True, (255, 215, 0))
+            screen.blit(timer, timer.get_rect(midtop=(WINDOW_WIDTH // 2, 10)))
+
+    return time_samples(frame, samples, warmup=10)
+
+
+def bench_overlay_text(samples, cached=True):
+    """Text of the victory screen for one frame (fonts created per frame, as before, or shared and cached)."""
+    screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    renderer = TextRenderer()
+    lines = ((96, "¡FELICIDADES!", (255, 209, 0)), (72, "You completed Coffee Bros!", (255, 255, 255)),
+             (48, "Total Score: 12300", (255, 215, 0)), (48, "Total Time: 312.4s", (255, 215, 0)),
+             (36, "¡Eres el mejor cafetero!", (255, 209, 0)), (36, "Press R to Restart", (200, 200, 200)),
+             (36, "Press M to Return to Menu", (200, 200, 200)), (36, "Press Q or ESC to Quit", (200, 200, 200)))
+
+    def frame():
+        for y, (size, text, color) in enumerate(lines):
+            if cached:
+                surface = renderer.render(renderer.get_font(size), text, color)
+            else:
+                surface = pygame.font.Font(None, size).render(text, True, color)
+            screen.blit(surface, surface.get_rect(center=(WINDOW_WIDTH // 2, 80 + y * 60)))
+
+    return time_samples(frame, samples, warmup=2)
+
+
+def bench_performance_monitor(samples):
+    """PerformanceMonitor overhead per frame: eight timed sections plus update()."""
+    monitor = PerformanceMonitor()
+    sections = ("input", "physics", "collisions", "particles", "background", "sprites", "hud", "flip")
+
+    def frame():
+        for name in sections:
+            monitor.begin_section(name)
+            monitor.end_section(name)
+        monitor.update()
+
+    samples = time_samples(frame, samples, warmup=10)
+    monitor.close()
+    return samples
+
+
+def run_suite(name_filter=None, sample_factor=1.0):
+    """
+    Run every benchmark.
+
+    Args:
+        name_filter (str): Only run benchmarks whose name contains this text
+        sample_factor (float): Multiplier for the number of samples (e.g. 0.2 for a quick run)
+
+    Returns:
+        collections.OrderedDict: Benchmark name -> summary
+    """
+    results = collections.OrderedDict()
+    frame_samples = max(5, int(FRAME_SAMPLES * sample_factor))
+
+    def wanted(name):
+        return name_filter is None or name_filter in name
+
+    def record(name, samples):
+        results[name] = summarize(samples)
+        print_row(name, results[name])
+
+    random.seed(SEED)
+
+    for scale, copies in SCALES.items():
+        load_samples = max(2, int(LOAD_SAMPLES[scale] * sample_factor))
+        level_number = level_number_for(scale)
+
+        names = {
+            'player': f"player_update[{scale}]",
+            'polocho': f"polocho_update[{scale}]",
+            'lasers': f"laser_enemy_collisions[{scale}]",
+            'particles': f"particles[{scale}]",
+            'pooled_particles': f"particles[pooled][{scale}]",
+            'platforms': f"platform_draw[{scale}]",
+            'sprites': f"sprite_draw[{scale}]",
+            'sprites_linear': f"sprite_draw[linear][{scale}]",
+            'load': f"level_load[{scale}]",
+            'json': f"level_data_load[json][{scale}]",
+            'compiled': f"level_data_load[compiled][{scale}]",
+            'reset': f"level_reset[{scale}]",
+        }
+        if copies == 1:
+            # Stock level load/reset is covered per level below
+            del names['load'], names['reset']
+
+        if wanted(names['player']):
+            record(names['player'], bench_player_update(load_level(level_number), frame_samples))
+        if wanted(names['polocho']):
+            record(names['polocho'], bench_polocho_update(load_level(level_number), frame_samples))
+        if wanted(names['lasers']):
+            with quiet():
+                samples = bench_laser_collisions(load_level(level_number), frame_samples, copies)
+            record(names['lasers'], samples)
+        if wanted(names['particles']):
+            record(names['particles'], bench_particles(frame_samples, copies))
+        if wanted(names['pooled_particles']):
+            record(names['pooled_particles'], bench_particles(frame_samples, copies, ObjectPool(Particle)))
+        if wanted(names['platforms']):
+            record(names['platforms'], bench_platform_draw(load_level(level_number), frame_samples))
+        if wanted(names['sprites']):
+            record(names['sprites'], bench_sprite_draw(load_level(level_number), frame_samples))
+        if wanted(names['sprites_linear']):
+            record(names['sprites_linear'], bench_sprite_draw(load_level(level_number), frame_samples, indexed=False))
+        if wanted(names.get('load', '')) and 'load' in names:
+            record(names['load'], bench_level_load(level_number, load_samples))
+        if wanted(names.get('reset', '')) and 'reset' in names:
+            record(names['reset'], bench_level_reset(load_level(level_number), load_samples))
+        # Level data alone, so the two file formats can be compared (warmup builds the compiled file)
+        data_samples = max(5, int(LOAD_SAMPLES["stock"] * sample_factor))
+        if wanted(names['json']):
+            record(names['json'], bench_level_data_load(level_number, data_samples, use_compiled=False))
+        if wanted(names['compiled']):
+            record(names['compiled'], bench_level_data_load(level_number, data_samples, use_compiled=True))
+
+    # Whole simulation steps, with and without chunk streaming on the 100x level
+    for scale, level_number in (("stock", BASE_LEVEL), ("100x", level_number_for("100x")),
+                                ("100x_streaming", STREAMED_LEVEL)):
+        name = f"session_step[{scale}]"
+        if wanted(name):
+            record(name, bench_session_step(level_number, frame_samples))
+    name = "level_load[100x_streaming]"
+    if wanted(name):
+        record(name, bench_level_load(STREAMED_LEVEL, max(2, int(LOAD_SAMPLES["100x_streaming"] * sample_factor))))
+    name = "level_reset[100x_streaming]"
+    if wanted(name):
+        # Worst case: every chunk has been visited, so every entity of the level is restored
+        level = load_level(STREAMED_LEVEL)
+        for camera_x in range(0, level.metadata["width"], WINDOW_WIDTH):
+            level.update_streaming(camera_x)
+        record(name, bench_level_reset(level, max(2, int(LOAD_SAMPLES["100x_streaming"] * sample_factor))))
+
+    # Every stock level, so a slowdown in a single level's content shows up
+    load_samples = max(2, int(LOAD_SAMPLES["stock"] * sample_factor))
+    for level_number in STOCK_LEVELS:
+        name = f"level_load[level_{level_number}]"
+        if wanted(name):
+            record(name, bench_level_load(level_number, load_samples))
+        name = f"level_reset[level_{level_number}]"
+        if wanted(name):
+            record(name, bench_level_reset(load_level(level_number), load_samples))
+
+    # Level backgrounds, plus one whose height differs from the window (scaled to fit)
+    for level_number in STOCK_LEVELS:
+        name = f"background_draw[level_{level_number}]"
+        if wanted(name):
+            level = load_level(level_number)
+            record(name, bench_background_draw(level.background_image, level.metadata.get("width", WINDOW_WIDTH),
+                                               frame_samples))
+    if wanted("background_draw[scaled]"):
+        level = load_level(BASE_LEVEL)
+        image = pygame.transform.scale(level.background_image, (level.background_image.get_width(), WINDOW_HEIGHT // 2))
+        record("background_draw[scaled]", bench_background_draw(image, level.metadata.get("width", WINDOW_WIDTH),
+                                                                 frame_samples))
+
+    # Parallax stack while scrolling and while the camera stands still
+    if wanted("parallax_draw[scrolling]"):
+        record("parallax_draw[scrolling]", bench_parallax_draw(frame_samples))
+    if wanted("parallax_draw[still]"):
+        record("parallax_draw[still]", bench_parallax_draw(frame_samples, scrolling=False))
+
+    if wanted("polocho_spawn"):
+        record("polocho_spawn", bench_polocho_spawn(frame_samples))
+    if wanted("projectile_spawn"):
+        record("projectile_spawn", bench_projectile_spawn(frame_samples))
+
+    if wanted("hud_text[font.render]"):
+        record("hud_text[font.render]", bench_hud_text(frame_samples, cached=False))
+    if wanted("hud_text[cached]"):
+        record("hud_text[cached]", bench_hud_text(frame_samples))
+
+    if wanted("overlay_text[font.render]"):
+        record("overlay_text[font.render]", bench_overlay_text(frame_samples, cached=False))
+    if wanted("overlay_text[cached]"):
+        record("overlay_text[cached]", bench_overlay_text(frame_samples))
+
+    if wanted("performance_monitor"):
+        record("performance_monitor", bench_performance_monitor(frame_samples))
+
+    return results
+
+
+def print_row(name, summary):
+    """Print one result line."""
+    print(f"{name:<36} {summary['median_ms']:>10.3f} {summary['p95_ms']:>10.3f} "
+          f"{summary['mean_ms']:>10.3f} {summary['samples']:>8}")
+
+
+def main(argv=None):
+    """Run the suite, optionally saving JSON results and comparing with a baseline."""
+    parser = argparse.ArgumentParser(description="Coffee Bros benchmark suite")
+    parser.add_argument("--output", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed median slowdown before failing (default: 0.10 = 10%%)")
+    parser.add_argument("--filter", metavar="TEXT", help="only run benchmarks whose name contains TEXT")
+    parser.add_argument("--quick", action="store_true", help="run with a fifth of the samples")
+    args = parser.parse_args(argv)
+
+    # Resolve paths before switching to the benchmark workspace
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = load_results(os.path.abspath(args.compare)) if args.compare else None
+
+    # The workspace (level copies, compiled levels, asset links) is deleted after the run
+    original_directory = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="coffee_bros_bench_") as workspace:
+        try:
+            return run_in_workspace(args, workspace, output, baseline)
+        finally:
+            os.chdir(original_directory)
+
+
+def run_in_workspace(args, workspace, output, baseline):
+    """
+    Run the suite from the benchmark workspace, then save and compare the results.
+
+    Args:
+        args (argparse.Namespace): Parsed command line
+        workspace (str): Empty directory to run from
+        output (str): Absolute path to write JSON results to, or None
+        baseline (dict): Baseline results to compare against, or None
+
+    Returns:
+        int: Exit code (1 if a benchmark regressed past the threshold)
+    """
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    prepare_workspace(workspace)
+
+    print("\n" + "=" * 70)
+    print("COFFEE BROS - BENCHMARK SUITE")
+    print("=" * 70)
+    print(f"{'Benchmark':<36} {'median ms':>10} {'p95 ms':>10} {'mean ms':>10} {'samples':>8}")
+    results = run_suite(args.filter, 0.2 if args.quick else 1.0)
+    print("=" * 70)
+
+    if output:
+        save_results(output, results)
+        print(f"Results written to {output}")
+
+    exit_code = 0
+    if baseline is not None:
+        rows = compare_results(results, baseline, args.threshold)
+        print(f"\nComparison with {args.compare} (median, threshold +{args.threshold:.0%})")
+        print(f"{'Benchmark':<36} {'before':>10} {'after':>10} {'change':>9}")
+        for name, before, after, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<36} {before:>10.3f} {after:>10.3f} {change:>+8.1%}{flag}")
+        regressions = [row for row in rows if row[4]]
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the threshold")
+            exit_code = 1
+        else:
+            print("\nNo regressions")
+
+    pygame.quit()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
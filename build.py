@@ -9,6 +9,8 @@ import subprocess
 import sys
 import platform
 
+from src.compiled_level import compile_all
+
 # Build configuration
 APP_NAME = "CoffeeBros"
 MAIN_SCRIPT = "main.py"
@@ -230,6 +232,10 @@ def main():
     # Clean previous builds
     clean_build_directories()
 
+    # Compile levels so the packaged game loads them without parsing JSON
+    print("\nCompiling levels...")
+    compile_all()
+
     # Build executable
     if not build_executable():
         print("\nBuild failed!")
@@ -6,7 +6,10 @@ All game configuration values and constants.
 # Window settings
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
-FPS = 60
+FPS = 60  # Fixed simulation rate - physics constants below are per simulation step
+MAX_RENDER_FPS = 144  # Rendering frame cap during gameplay (0 = uncapped)
+MAX_FRAME_TIME = 0.25  # seconds - longest frame fed to the simulation (avoids spiral of death)
+MENU_IDLE_TIMEOUT = 100  # ms - longest wait for input outside gameplay before menu animations are updated
 WINDOW_TITLE = "Coffee Bros"
 
 # Debug/Testing settings
@@ -3,24 +3,28 @@ Coffee Bros - Main Game Entry Point
 A 2D platformer game inspired by Super Mario Bros with Colombian cultural themes.
 """
 
+import argparse
 import pygame
-import sys
 import random
-from config import WINDOW_WIDTH, WINDOW_HEIGHT, FPS, WINDOW_TITLE, BLACK, STOMP_SCORE, DEATH_DELAY, PLAYER_STARTING_LIVES, POWERUP_SCORE, MAX_LASERS, LEVEL_COMPLETE_DELAY, DEBUG_START_LEVEL
-from src.entities import Player, Platform, Polocho, GoldenArepa, Laser, Goal, Mermelada
-from src.entities.particle import ParticleSystem
-from src.level import Level
+import sys
+import time
+from config import (WINDOW_WIDTH, WINDOW_HEIGHT, FPS, WINDOW_TITLE, BLACK, DEBUG_START_LEVEL, MAX_RENDER_FPS,
+                    MAX_FRAME_TIME, MENU_IDLE_TIMEOUT)
 from src.menu import MainMenu, PauseMenu, GameOverMenu, SettingsMenu, ControlsMenu
-from src.level_name_display import LevelNameDisplay
+from src.game_session import GameSession
 from src.audio_manager import AudioManager
 from src.settings_manager import SettingsManager
 from src.save_manager import SaveManager
-from src.draw_utils import draw_tiled_background, draw_hearts
+from src.draw_utils import draw_level_background, draw_hearts, prepare_background
+from src.parallax import ParallaxBackground
 from src.performance_monitor import PerformanceMonitor
-from src.optimization import OptimizedRenderer, limit_particle_count
+from src.optimization import OptimizedRenderer
+from src.text_renderer import text_renderer
+from src.overlay import CachedOverlay, compose_level_complete, compose_transition, compose_victory
+from src.input_recording import InputRecorder, InputReplay
 
 
-def main():
+def main(record_path=None, replay_path=None, seed=None):
     """
     Main game entry point and game loop for Coffee Bros.
 
@@ -28,6 +32,12 @@ def main():
     and runs the main game loop handling different game states (menu, playing,
     paused, settings, game over, victory).
 
+    Args:
+        record_path (str): Optional file to record input and the random seed to
+        replay_path (str): Optional recording to replay instead of live input.
+            Replays run uncapped and report the average frame time at the end.
+        seed (int): Optional seed for the random module (random if not given)
+
     Game States:
         - "menu": Main menu screen with game start options
         - "playing": Active gameplay with player control
@@ -44,17 +54,35 @@ def main():
         - Audio manager for music and sound effects (US-040-047)
         - Menu systems (main, pause, settings, controls, game over)
 
-    Game Loop (60 FPS):
+    Game Loop:
         - Event processing (keyboard input, window events)
         - State-specific updates and rendering
+        - Fixed 60 Hz simulation steps (GameSession.update) fed by an accumulator,
+          so physics speed does not depend on the rendering frame rate
         - Camera system for scrolling levels (US-038, US-039)
-        - Physics and collision detection
+        - Rendering at up to MAX_RENDER_FPS, interpolating sprite positions
+          between the last two simulation steps
         - HUD rendering (score, lives, powerup timer)
         - Performance monitoring overlay (toggle with F3)
 
     Returns:
         None: Exits via pygame.quit() and sys.exit()
     """
+    # Input recording and replay for reproducible benchmark runs
+    input_replay = InputReplay(replay_path) if replay_path else None
+    if input_replay is not None:
+        seed = input_replay.seed  # Replay with the recorded seed
+    elif seed is None:
+        seed = random.randrange(2 ** 32)
+    random.seed(seed)  # Particles and boss power-up spawns use the random module
+    input_recorder = InputRecorder(record_path, seed) if record_path else None
+
+    # Replays run as fast as possible so frame times can be compared
+    menu_fps = 0 if input_replay else FPS
+    render_fps = 0 if input_replay else MAX_RENDER_FPS
+    replay_frames = 0
+    replay_start = time.perf_counter()
+
     # Initialize pygame
     pygame.init()
 
@@ -95,96 +123,95 @@ def main():
     main_menu = MainMenu()  # Initialize main menu
     pause_menu = PauseMenu()  # Initialize pause menu (US-035)
     game_over_menu = GameOverMenu()  # Initialize game over menu (US-036)
+    # End-of-level screens, composed once per state and redrawn with a single blit
+    level_complete_overlay = CachedOverlay(compose_level_complete, alpha=180)  # US-023
+    transition_overlay = CachedOverlay(compose_transition, alpha=200)  # Slightly more opaque (US-029)
+    victory_overlay = CachedOverlay(compose_victory, alpha=220)  # Mostly opaque (US-030)
     settings_menu = SettingsMenu(audio_manager, save_manager)  # Initialize settings menu - uses save_manager for persistence (US-060, US-061, US-068)
     controls_menu = ControlsMenu()  # Initialize controls menu (US-062)
 
     # Initialize game state
-    score = 0
-    font = pygame.font.Font(None, 36)  # Default font, size 36
-    # Use debug start level if set, otherwise start at level 1
-    current_level_number = DEBUG_START_LEVEL if DEBUG_START_LEVEL is not None else 1
-    max_level_number = 5  # Maximum level implemented (US-028)
-
-    # Time tracking (for completion screen)
-    level_start_time = pygame.time.get_ticks()  # milliseconds since pygame.init()
-    level_start_score = 0  # Score at level start (for transition screen - US-029)
-
-    # Death and respawn state
-    is_dead = False
-    death_timer = 0
-
-    # Level completion state (US-023)
-    is_level_complete = False
-    completion_timer = 0
-    completion_time = 0  # Time taken to complete level (in seconds)
-
-    # Level transition state (US-029)
-    is_transition_screen = False
-    score_earned_in_level = 0  # Score earned specifically in completed level
-
-    # Victory screen state (US-030)
-    is_victory_screen = False
-    total_game_time = 0  # Total time played across all levels (in seconds)
-
-    # Camera system (US-038, US-039)
-    camera_x = 0  # Camera horizontal offset for scrolling
-
-    # Level name display (US-037)
-    level_name_display = None
-
-    # Boss fight power-up spawning (Level 5)
-    powerup_spawn_timer = 0  # Timer for spawning power-ups during boss fight
-    powerup_spawn_interval = 360  # Spawn every 6 seconds (360 frames at 60 FPS)
-
-    # Level and entity references (initialized when game starts - US-034)
-    level = None
-    player = None
-    all_sprites = None
-    platforms = None
-    enemies = None
-    powerups = None
-    goals = None
-    lasers = pygame.sprite.Group()  # Create laser sprite group (US-019)
-    particles = pygame.sprite.Group()  # Create particle sprite group (US-058)
-    mermeladas = pygame.sprite.Group()  # Create mermelada sprite group for boss projectiles
+    font = text_renderer.get_font(36)  # Default font, size 36 (HUD)
+    # Gameplay state (level, entities, score, progression flags) lives in the session
+    session = GameSession(audio_manager, save_manager, profiler=performance_monitor)
+    for name, pool in session.pools.items():
+        performance_monitor.register_pool(name, pool)
+
+    # Fixed timestep: simulation advances in 1/FPS steps, rendering interpolates between them
+    simulation_step = 1.0 / FPS
+    accumulator = 0.0  # Real time not yet consumed by simulation steps (seconds)
+    last_frame_time = None  # perf_counter() of the previous gameplay frame (None = not playing)
+    simulated_level = None  # Level the accumulator belongs to - reset when a level loads
+    parallax_background = None  # Parallax layers of the simulated level, if it declares any
+
+    # Outside gameplay the loop sleeps until input arrives, so menu animations (the game
+    # over input delay) advance by the real time elapsed, in 1/FPS ticks
+    menu_accumulator = 0.0  # Real time not yet consumed by menu ticks (seconds)
+    last_menu_time = None  # perf_counter() of the previous frame outside gameplay
+    frozen_frame = None  # Gameplay frame shown under the pause and game over menus
 
     # If debug start level is set, load it immediately
     if DEBUG_START_LEVEL is not None:
         try:
-            level = Level.load_from_file(current_level_number, audio_manager)
-            player = level.player
-            all_sprites = level.all_sprites
-            platforms = level.platforms
-            enemies = level.enemies
-            powerups = level.powerups
-            goals = level.goals
-            level_start_time = pygame.time.get_ticks()
-            level_start_score = 0
-            # Create level name display
-            level_name = level.metadata.get("name", f"Level {current_level_number}")
-            level_name_display = LevelNameDisplay(current_level_number, level_name)
+            session.start_new_game(DEBUG_START_LEVEL)
             # Play appropriate music
-            if current_level_number == 5:
+            if session.current_level_number == 5:
                 audio_manager.play_boss_battle_music()  # Menacing boss battle music
             else:
                 audio_manager.play_gameplay_music()
-            print(f"DEBUG: Started at Level {current_level_number}")
+            print(f"DEBUG: Started at Level {session.current_level_number}")
         except Exception as e:
-            print(f"Error loading debug level {current_level_number}: {e}")
+            print(f"Error loading debug level {DEBUG_START_LEVEL}: {e}")
             game_state = "menu"  # Fall back to menu if level load fails
 
+    def draw_scene_background(camera_x):
+        """Draw the level background (US-056), black where there is none, and its platforms"""
+        # The background covers the whole window, so the black fill is only needed without one
+        if not draw_level_background(screen, session.level, parallax_background, camera_x,
+                                     session.level_width, WINDOW_WIDTH, WINDOW_HEIGHT):
+            screen.fill(BLACK)
+        # Platforms are drawn from their pre-rendered chunks
+        session.level.platform_chunks.draw(screen, camera_x)
+
     # Game loop
     running = True
     while running:
+        performance_monitor.begin_section("input")
+
+        # Get this frame's input - live, or from the recording when replaying
+        frame_input = None
+        if input_replay is not None:
+            frame_input = input_replay.next_frame()
+            if frame_input is None:
+                break  # Recording finished
+            pygame.event.pump()  # Keep the window responsive
+            events = frame_input.events
+            replay_frames += 1
+        elif game_state != "playing" and optimized_renderer.is_static_frame_shown():
+            # Nothing on screen changes without input: sleep until some arrives instead of
+            # redrawing at FPS, waking up now and then for menu animations
+            event = pygame.event.wait(MENU_IDLE_TIMEOUT)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+        if input_recorder is not None:
+            input_recorder.record_frame(events)
+
         # Handle events
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window has to be shown whole again, not just the changed areas
+                optimized_renderer.invalidate()
             elif event.type == pygame.KEYDOWN:
                 # Toggle performance overlay with F3 key (US-063)
                 if event.key == pygame.K_F3:
                     show_performance_overlay = not show_performance_overlay
                     print(f"Performance overlay: {'ON' if show_performance_overlay else 'OFF'}")
+                # Export frame and per-section timings with F4 while the overlay is on
+                elif event.key == pygame.K_F4 and show_performance_overlay:
+                    performance_monitor.export_stats(time.strftime("performance_%Y%m%d_%H%M%S.json"))
 
                 # Handle ESC key based on game state
                 if event.key == pygame.K_ESCAPE:
@@ -221,38 +248,14 @@ def main():
                 if menu_action == "start":
                     # Start game - load first level
                     game_state = "playing"
-                    current_level_number = 1
-                    score = 0
-                    total_game_time = 0
                     # Load level from JSON file (US-022, US-041)
                     try:
-                        level = Level.load_from_file(current_level_number, audio_manager)
-                        # Get references to level entities for easy access
-                        player = level.player
-                        all_sprites = level.all_sprites
-                        platforms = level.platforms
-                        enemies = level.enemies
-                        powerups = level.powerups
-                        goals = level.goals
-                        lasers.empty()  # Clear any existing lasers
-                        mermeladas.empty()  # Clear any existing mermeladas
-                        # Reset all game state flags
-                        is_dead = False
-                        is_level_complete = False
-                        is_transition_screen = False
-                        is_victory_screen = False
-                        death_timer = 0
-                        completion_timer = 0
-                        camera_x = 0
-                        level_start_time = pygame.time.get_ticks()
-                        level_start_score = 0
-                        # Create level name display (US-037)
-                        level_name = level.metadata.get("name", f"Level {current_level_number}")
-                        level_name_display = LevelNameDisplay(current_level_number, level_name)
+                        # Fresh score, flags, camera and level name display (US-037)
+                        session.start_new_game(1)
                         # Start music (US-047)
                         audio_manager.stop_music(fade_ms=500)  # Fade out menu music
                         # Play boss battle music for level 5, gameplay music for others
-                        if current_level_number == 5:
+                        if session.current_level_number == 5:
                             audio_manager.play_boss_battle_music()  # Menacing boss battle music
                         else:
                             audio_manager.play_gameplay_music()  # Start gameplay music
@@ -290,34 +293,12 @@ def main():
                 elif menu_action == "restart":
                     # Restart current level
                     try:
-                        level = Level.load_from_file(current_level_number, audio_manager)
-                        # Get fresh references to level entities
-                        player = level.player
-                        all_sprites = level.all_sprites
-                        platforms = level.platforms
-                        enemies = level.enemies
-                        powerups = level.powerups
-                        goals = level.goals
-                        lasers.empty()  # Clear all lasers
-                        mermeladas.empty()  # Clear all mermeladas
-                        # Reset all state flags
-                        is_dead = False
-                        is_level_complete = False
-                        is_transition_screen = False
-                        completion_timer = 0
-                        death_timer = 0
-                        # Reset time tracking for restarted level
-                        level_start_time = pygame.time.get_ticks()
                         # Keep current score (don't reset on restart)
-                        # Reset camera
-                        camera_x = 0
-                        # Create level name display (US-037)
-                        level_name = level.metadata.get("name", f"Level {current_level_number}")
-                        level_name_display = LevelNameDisplay(current_level_number, level_name)
+                        session.restart_level()
                         # Return to playing state
                         game_state = "playing"
                     except (FileNotFoundError, ValueError) as e:
-                        print(f"Error restarting level {current_level_number}: {e}")
+                        print(f"Error restarting level {session.current_level_number}: {e}")
                         running = False
                 elif menu_action == "menu":
                     # Return to main menu
@@ -364,36 +345,12 @@ def main():
                 if menu_action == "retry":
                     # Retry current level - reload it completely
                     try:
-                        level = Level.load_from_file(current_level_number, audio_manager)
-                        # Get fresh references to level entities
-                        player = level.player
-                        all_sprites = level.all_sprites
-                        platforms = level.platforms
-                        enemies = level.enemies
-                        powerups = level.powerups
-                        goals = level.goals
-                        lasers.empty()  # Clear all lasers
-                        mermeladas.empty()  # Clear all mermeladas
-                        # Reset all state flags
-                        is_dead = False
-                        is_level_complete = False
-                        is_transition_screen = False
-                        completion_timer = 0
-                        death_timer = 0
-                        # Reset time tracking for restarted level
-                        level_start_time = pygame.time.get_ticks()
                         # Reset score to 0 on game over retry (US-036 technical notes)
-                        score = 0
-                        level_start_score = 0
-                        # Reset camera
-                        camera_x = 0
-                        # Create level name display (US-037)
-                        level_name = level.metadata.get("name", f"Level {current_level_number}")
-                        level_name_display = LevelNameDisplay(current_level_number, level_name)
+                        session.retry_level()
                         # Return to playing state
                         game_state = "playing"
                     except (FileNotFoundError, ValueError) as e:
-                        print(f"Error retrying level {current_level_number}: {e}")
+                        print(f"Error retrying level {session.current_level_number}: {e}")
                         running = False
                 elif menu_action == "menu":
                     # Return to main menu
@@ -409,87 +366,33 @@ def main():
             # Gameplay event handling (only when in playing state)
             if game_state == "playing" and event.type == pygame.KEYDOWN:
                 # Handle transition screen continuation (US-029)
-                if is_transition_screen:
+                if session.is_transition_screen:
                     # Any key press continues to next level
-                    # Check if there's a next level available
-                    if current_level_number < max_level_number:
-                        # Load next level
-                        current_level_number += 1
-                        try:
-                            level = Level.load_from_file(current_level_number, audio_manager)
-                            # Get fresh references to level entities
-                            player = level.player
-                            all_sprites = level.all_sprites
-                            platforms = level.platforms
-                            enemies = level.enemies
-                            powerups = level.powerups
-                            goals = level.goals
-                            lasers.empty()  # Clear all lasers from previous level
-                            mermeladas.empty()  # Clear all mermeladas from previous level
-                            # Reset completion and transition state
-                            is_level_complete = False
-                            is_transition_screen = False
-                            completion_timer = 0
-                            # Reset time tracking for new level
-                            level_start_time = pygame.time.get_ticks()
-                            level_start_score = score  # Record starting score for next level
-                            # Reset camera for new level (US-038)
-                            camera_x = 0
-                            # Create level name display (US-037)
-                            level_name = level.metadata.get("name", f"Level {current_level_number}")
-                            level_name_display = LevelNameDisplay(current_level_number, level_name)
+                    try:
+                        # Score carries over between levels
+                        if session.advance_from_transition():
                             # Switch to boss battle music for level 5
-                            if current_level_number == 5:
+                            if session.current_level_number == 5:
                                 audio_manager.stop_music(fade_ms=500)
                                 audio_manager.play_boss_battle_music()
-                            # Score carries over between levels
-                        except (FileNotFoundError, ValueError) as e:
-                            print(f"Error loading level {current_level_number}: {e}")
-                            running = False
-                    else:
-                        # No more levels - show victory screen! (US-030)
-                        is_transition_screen = False
-                        is_victory_screen = True
-                        # total_game_time already includes all level times from transition screens
-                        # Play victory music (US-047)
-                        audio_manager.stop_music(fade_ms=500)
-                        audio_manager.play_victory_music()
+                        else:
+                            # No more levels - victory screen (US-030)
+                            # Play victory music (US-047)
+                            audio_manager.stop_music(fade_ms=500)
+                            audio_manager.play_victory_music()
+                    except (FileNotFoundError, ValueError) as e:
+                        print(f"Error loading level {session.current_level_number + 1}: {e}")
+                        running = False
                 # Handle victory screen options (US-030)
-                elif is_victory_screen:
+                elif session.is_victory_screen:
                     if event.key == pygame.K_r:
                         # Restart game from Level 1
-                        current_level_number = 1
-                        score = 0
-                        total_game_time = 0
                         try:
-                            level = Level.load_from_file(current_level_number, audio_manager)
-                            # Get fresh references to level entities
-                            player = level.player
-                            all_sprites = level.all_sprites
-                            platforms = level.platforms
-                            enemies = level.enemies
-                            powerups = level.powerups
-                            goals = level.goals
-                            lasers.empty()  # Clear all lasers
-                            # Reset all state flags
-                            is_victory_screen = False
-                            is_level_complete = False
-                            is_transition_screen = False
-                            is_dead = False
-                            completion_timer = 0
-                            death_timer = 0
-                            # Reset time tracking
-                            level_start_time = pygame.time.get_ticks()
-                            level_start_score = 0
-                            # Reset camera (US-038)
-                            camera_x = 0
-                            # Create level name display (US-037)
-                            level_name = level.metadata.get("name", f"Level {current_level_number}")
-                            level_name_display = LevelNameDisplay(current_level_number, level_name)
+                            session.start_new_game(1)
                             # Start music (US-047)
                             audio_manager.stop_music(fade_ms=500)
                             # Play boss battle music for level 5, gameplay music for others
-                            if current_level_number == 5:
+                            if session.current_level_number == 5:
                                 audio_manager.play_boss_battle_music()  # Menacing boss battle music
                             else:
                                 audio_manager.play_gameplay_music()
@@ -498,7 +401,7 @@ def main():
                             running = False
                     elif event.key == pygame.K_m:
                         # Return to main menu
-                        is_victory_screen = False
+                        session.is_victory_screen = False
                         game_state = "menu"
                         # Stop victory music and play menu music
                         audio_manager.stop_music(fade_ms=500)
@@ -507,385 +410,223 @@ def main():
                         # Quit game
                         running = False
 
+        performance_monitor.end_section("input")
+
+        # Simulation is frozen outside gameplay - don't bank that time in the accumulator
+        # (and menu frames don't count towards the gameplay section timings)
+        if game_state != "playing":
+            last_frame_time = None
+            performance_monitor.discard_sections()
+            # Screens outside gameplay only change in response to input
+            if events:
+                optimized_renderer.invalidate()
+
+            # Menu animation ticks due for the real time elapsed, however long the loop slept
+            # (replays advance exactly the recorded ticks)
+            now = time.perf_counter()
+            if frame_input is not None:
+                menu_ticks = frame_input.steps
+            else:
+                if last_menu_time is not None:
+                    menu_accumulator += now - last_menu_time
+                menu_ticks = int(menu_accumulator // simulation_step)
+                menu_accumulator -= menu_ticks * simulation_step
+            last_menu_time = now
+            if input_recorder is not None:
+                input_recorder.record_menu_ticks(menu_ticks)
+        else:
+            last_menu_time = None
+            menu_accumulator = 0.0
+            frozen_frame = None  # The game moves again
+
         # Update and draw based on game state (US-034, US-035)
         if game_state == "menu":
             # Menu state - update and draw menu
             main_menu.update()
-            main_menu.draw(screen)
-            # Update display
-            pygame.display.flip()
-            clock.tick(FPS)
+            # Drawn only when it changes, the display is left alone otherwise
+            if optimized_renderer.begin_static_frame("menu"):
+                main_menu.draw(screen)
+                optimized_renderer.update_display()
+            clock.tick(menu_fps)
             continue  # Skip gameplay logic
 
         # Paused state - freeze game and show pause menu (US-035)
         if game_state == "paused":
             # Don't update any game entities - game is frozen!
-            # Just draw the current game state with pause overlay on top
-
-            # Fill screen with black background
-            screen.fill(BLACK)
-
-            # Draw background image behind everything (US-056)
-            if level and level.background_image:
-                level_width = level.metadata.get("width", WINDOW_WIDTH)
-                draw_tiled_background(screen, level.background_image, camera_x, level_width, WINDOW_WIDTH, WINDOW_HEIGHT)
-
-            # Draw all sprites at their frozen positions with camera offset (US-063: optimized)
-            optimized_renderer.draw_sprites_with_offset(all_sprites, camera_x)
+            # Just draw the current game state with pause overlay on top,
+            # and only when the menu changes (the display is left alone otherwise)
+            if optimized_renderer.begin_static_frame("paused"):
+                if frozen_frame is None:
+                    # Draw background (US-056) and platforms, then all sprites at their frozen
+                    # positions with camera offset (US-063: optimized)
+                    draw_scene_background(session.camera_x)
+                    optimized_renderer.draw_sprites_with_offset(session.all_sprites, session.camera_x)
+
+                    # Draw HUD elements (so player can see their current state)
+                    text_renderer.draw_text(screen, font, f"SCORE: {session.score:05d}", (255, 255, 255),
+                                            topleft=(10, 10))
+
+                    # Draw lives as hearts
+                    player = session.player
+                    draw_hearts(screen, player.lives, WINDOW_WIDTH - 10, 10)
+
+                    if player.is_powered_up:
+                        powerup_seconds = player.powerup_timer / 60
+                        if powerup_seconds < 3.0:
+                            timer_color = (255, 50, 50)
+                        else:
+                            timer_color = (255, 215, 0)
+                        text_renderer.draw_text(screen, font, f"POWERUP: {powerup_seconds:.1f}s", timer_color,
+                                                midtop=(WINDOW_WIDTH // 2, 10))
 
-            # Draw HUD elements (so player can see their current state)
-            score_text = font.render(f"SCORE: {score:05d}", True, (255, 255, 255))
-            screen.blit(score_text, (10, 10))
+                    # Drawn once per pause - menu navigation only redraws the menu over it
+                    frozen_frame = screen.copy()
+                else:
+                    screen.blit(frozen_frame, (0, 0))
 
-            # Draw lives as hearts
-            draw_hearts(screen, player.lives, WINDOW_WIDTH - 10, 10)
+                # Draw pause menu overlay on top
+                pause_menu.draw(screen)
 
-            if player.is_powered_up:
-                powerup_seconds = player.powerup_timer / 60
-                if powerup_seconds < 3.0:
-                    timer_color = (255, 50, 50)
-                else:
-                    timer_color = (255, 215, 0)
-                timer_text = font.render(f"POWERUP: {powerup_seconds:.1f}s", True, timer_color)
-                timer_rect = timer_text.get_rect()
-                timer_rect.centerx = WINDOW_WIDTH // 2
-                timer_rect.top = 10
-                screen.blit(timer_text, timer_rect)
-
-            # Draw pause menu overlay on top
-            pause_menu.draw(screen)
-
-            # Update display
-            pygame.display.flip()
-            clock.tick(FPS)
+                # Update display
+                optimized_renderer.update_display()
+            clock.tick(menu_fps)
             continue  # Skip gameplay logic
 
         # Settings state - draw menu (US-060, US-061)
         if game_state == "settings":
-            # Draw settings menu (US-060)
-            settings_menu.draw(screen)
-            pygame.display.flip()
-            clock.tick(FPS)
+            # Draw settings menu (US-060) when it changes
+            if optimized_renderer.begin_static_frame("settings"):
+                settings_menu.draw(screen)
+                optimized_renderer.update_display()
+            clock.tick(menu_fps)
             continue  # Skip gameplay logic
 
         # Controls state - draw controls screen (US-062)
         if game_state == "controls":
-            # Draw controls menu (US-062)
-            controls_menu.draw(screen)
-            pygame.display.flip()
-            clock.tick(FPS)
+            # Draw controls menu (US-062) when it changes
+            if optimized_renderer.begin_static_frame("controls"):
+                controls_menu.draw(screen)
+                optimized_renderer.update_display()
+            clock.tick(menu_fps)
             continue  # Skip gameplay logic
 
         # Game over state - freeze game and show game over menu (US-036)
         if game_state == "game_over":
             # Don't update any game entities - game is frozen!
             # Update game over menu (for delay timer)
-            game_over_menu.update()
-
-            # Fill screen with black background
-            screen.fill(BLACK)
-
-            # Draw background image behind everything (US-056)
-            if level and level.background_image:
-                level_width = level.metadata.get("width", WINDOW_WIDTH)
-                draw_tiled_background(screen, level.background_image, camera_x, level_width, WINDOW_WIDTH, WINDOW_HEIGHT)
-
-            # Draw all sprites at their frozen positions with camera offset (US-063: optimized)
-            optimized_renderer.draw_sprites_with_offset(all_sprites, camera_x)
+            game_over_menu.update(menu_ticks)
+
+            # Drawn only when the menu changes - including once its options become selectable
+            if optimized_renderer.begin_static_frame(("game_over", game_over_menu.is_input_ready())):
+                if frozen_frame is None:
+                    # Draw background (US-056) and platforms, then all sprites at their frozen
+                    # positions with camera offset (US-063: optimized)
+                    draw_scene_background(session.camera_x)
+                    optimized_renderer.draw_sprites_with_offset(session.all_sprites, session.camera_x)
+                    frozen_frame = screen.copy()  # Drawn once, menu changes only redraw the menu
+                else:
+                    screen.blit(frozen_frame, (0, 0))
 
-            # Draw game over menu overlay on top
-            game_over_menu.draw(screen, score)
+                # Draw game over menu overlay on top
+                game_over_menu.draw(screen, session.score)
 
-            # Update display
-            pygame.display.flip()
-            clock.tick(FPS)
+                # Update display
+                optimized_renderer.update_display()
+            clock.tick(menu_fps)
             continue  # Skip gameplay logic
 
         # Gameplay state - only execute when game_state == "playing"
         # Get currently pressed keys for continuous input
-        keys = pygame.key.get_pressed()
-
-        # Handle continuous shooting when powered up (US-019) - X or J key (only during normal gameplay)
-        if not is_level_complete and not is_dead and not is_transition_screen and not is_victory_screen:
-            if keys[pygame.K_x] or keys[pygame.K_j]:
-                # Shoot unlimited lasers while powered up (no MAX_LASERS limit)
-                laser_info = player.shoot()
-                if laser_info is not None:
-                    x, y, direction = laser_info
-                    laser = Laser(x, y, direction)
-                    lasers.add(laser)
-                    all_sprites.add(laser)
-                    # TODO (US-043): Play laser shoot sound effect (audio system in Epic 7)
-
-        # Handle level completion state (US-023, US-029)
-        if is_level_complete:
-            # Increment completion timer
-            completion_timer += 1
-
-            # After LEVEL_COMPLETE_DELAY frames (3 seconds), show transition screen (US-029)
-            if completion_timer >= LEVEL_COMPLETE_DELAY:
-                # Transition to transition screen
-                is_transition_screen = True
-                is_level_complete = False  # Exit level complete state
-                completion_timer = 0  # Reset timer for future use
-                # Add level completion time to total game time (US-030)
-                total_game_time += completion_time
-
-        # Handle death state
-        elif is_dead:
-            # Increment death timer
-            death_timer += 1
-
-            # Check if it's time to respawn
-            if death_timer >= DEATH_DELAY:
-                # Respawn: reset level using Level.reset_level()
-                level.reset_level()
-                # Get fresh references to level entities
-                player = level.player
-                all_sprites = level.all_sprites
-                platforms = level.platforms
-                enemies = level.enemies
-                powerups = level.powerups
-                lasers.empty()  # Clear all lasers on respawn
-                mermeladas.empty()  # Clear all mermeladas on respawn
-                score = 0  # Reset score on respawn
-                is_dead = False
-                death_timer = 0
-                camera_x = 0  # Reset camera (US-038)
-                # TODO (US-045): Play respawn sound effect (audio system in Epic 7)
-
+        with performance_monitor.section("input"):
+            keys = frame_input.keys if frame_input is not None else pygame.key.get_pressed()
+
+        # Fixed timestep: bank real elapsed time and consume it in 1/FPS simulation steps
+        # so physics runs at 60 Hz regardless of the rendering frame rate
+        now = time.perf_counter()
+        if last_frame_time is None or session.level is not simulated_level:
+            # Just started, resumed or loaded a level - step once and drop the elapsed time
+            # (level load time must not be replayed as a burst of catch-up steps)
+            simulated_level = session.level
+            accumulator = simulation_step
+            # Prepare the new level's background now rather than on its first drawn frame
+            parallax_background = ParallaxBackground.from_level(session.level, WINDOW_WIDTH, WINDOW_HEIGHT)
+            if parallax_background is None:
+                prepare_background(session.level.background_image, WINDOW_WIDTH, WINDOW_HEIGHT)
+            session.level.platform_chunks.prerender(session.camera_x, WINDOW_WIDTH)
         else:
-            # Normal gameplay when not dead
-            # Update level name display if active (US-037)
-            if level_name_display and level_name_display.is_active:
-                level_name_display.update()
-
-            # Update player with current key states, platform collision, and level width (US-038, US-039)
-            level_width = level.metadata.get("width", WINDOW_WIDTH)
-            player.update(keys, platforms, level_width)
-
-            # Update all enemies with platform collision
-            for enemy in enemies:
-                enemy.update(platforms)
-
-            # Update all power-ups (for floating animation)
-            for powerup in powerups:
-                powerup.update()
-
-            # Update all lasers (US-019) - handles movement and off-screen removal
-            for laser in lasers:
-                laser.update(level_width)
-
-            # Update all mermeladas (boss projectiles)
-            for mermelada in mermeladas:
-                mermelada.update(level_width)
-
-            # Update all particles (US-058) - handles position, fading, and lifetime
-            for particle in particles:
-                particle.update()
-
-            # Limit particle count for performance (US-063)
-            limit_particle_count(particles, max_particles=100)
-
-            # Check for laser-enemy collisions (US-020) and boss damage
-            for laser in lasers:
-                # Check collision with all enemies
-                hit_enemies = pygame.sprite.spritecollide(laser, enemies, False)
-                for enemy in hit_enemies:
-                    # Check if it's the boss
-                    if hasattr(enemy, 'take_damage'):  # Boss has take_damage method
-                        damage_dealt = enemy.take_damage(1)  # Boss takes damage
-                        laser.kill()
-                        # Always create particles on hit, even if invulnerable
-                        ParticleSystem.create_stomp_particles(laser.rect.centerx, laser.rect.centery, particles)
-                        # Create additional impact particles for boss hit
-                        for _ in range(5):
-                            ParticleSystem.create_powerup_particles(laser.rect.centerx, laser.rect.centery, particles)
-                        break
-                    elif not enemy.is_squashed:  # Regular enemy - Don't collide with already squashed
-                        # Laser hit an enemy!
-                        laser.kill()  # Remove laser from sprite groups
-                        enemy.squash()  # Mark enemy as squashed (will disappear after animation)
-                        score += STOMP_SCORE  # Award same points as stomp kill
-                        # Create particle effect at impact point (US-058)
-                        ParticleSystem.create_stomp_particles(enemy.rect.centerx, enemy.rect.top, particles)
-                        # TODO (US-042): Play enemy defeat sound effect (audio system in Epic 7)
-                        break  # One laser can only hit one enemy (exit inner loop)
-
-            # Check for player-enemy collisions
-            for enemy in enemies:
-                # Handle boss collision differently
-                if hasattr(enemy, 'take_damage'):  # This is the boss
-                    # Check stomp collision with boss
-                    if player.velocity_y > 0:  # Player is falling
-                        stomp_rect = enemy.get_stomp_rect()
-                        if player.rect.colliderect(stomp_rect):
-                            # Player stomped the boss!
-                            damage_dealt = enemy.take_damage(1)
-                            player.velocity_y = -12  # Big bounce after boss stomp
-                            # Always create particles on stomp
-                            ParticleSystem.create_stomp_particles(enemy.rect.centerx, enemy.rect.top, particles)
-                            # Create extra burst particles for visual feedback
-                            for _ in range(8):
-                                ParticleSystem.create_powerup_particles(enemy.rect.centerx, enemy.rect.top, particles)
-                    # Check if player touches boss (damage)
-                    damage_rect = enemy.get_damage_rect()
-                    if player.rect.colliderect(damage_rect) and not player.is_invulnerable:
-                        knockback_direction = -1 if player.rect.centerx < enemy.rect.centerx else 1
-                        player.take_damage(knockback_direction)
-                elif player.rect.colliderect(enemy.rect) and not enemy.is_squashed:
-                    # Regular enemy collision
-                    # Check if player is falling and hitting enemy from above (stomp)
-                    if player.velocity_y > 0 and player.rect.bottom < enemy.rect.centery:
-                        # Player stomped the enemy!
-                        if not enemy.is_squashed:  # Only count score once per enemy
-                            enemy.squash()  # Mark as squashed (will disappear after animation)
-                            player.velocity_y = -8  # Small upward bounce after stomp
-                            score += STOMP_SCORE  # Increase score
-                            # Create particle effect at stomp point (US-058)
-                            ParticleSystem.create_stomp_particles(enemy.rect.centerx, enemy.rect.top, particles)
-                            # TODO (US-042): Play stomp sound effect (audio system in Epic 7)
-                    else:
-                        # Side or bottom collision - player takes damage
-                        # Determine knockback direction based on relative positions
-                        if player.rect.centerx < enemy.rect.centerx:
-                            knockback_direction = -1  # Push player left
-                        else:
-                            knockback_direction = 1  # Push player right
-
-                        player.take_damage(knockback_direction)
-                        # TODO (US-045): Play damage sound effect (audio system in Epic 7)
-
-            # Check for player-powerup collisions (US-017)
-            for powerup in powerups:
-                if player.rect.colliderect(powerup.rect):
-                    # Player collected the power-up!
-                    player.collect_powerup()  # Enter powered-up state
-                    score += POWERUP_SCORE  # Increase score
-                    # Create particle effect at powerup collection point (US-059)
-                    ParticleSystem.create_powerup_particles(powerup.rect.centerx, powerup.rect.centery, particles)
-                    powerup.kill()  # Remove from sprite groups (disappears)
-                    audio_manager.play_powerup()  # US-044: Play powerup collection sound effect
-
-            # Check for player-mermelada collisions (boss projectile damage)
-            for mermelada in mermeladas:
-                if player.rect.colliderect(mermelada.rect) and not player.is_invulnerable:
-                    # Mermelada hit the player!
-                    # Determine knockback direction based on mermelada velocity
-                    knockback_direction = 1 if mermelada.vel_x > 0 else -1
-                    player.take_damage(knockback_direction)
-                    # Create particle effect at impact point
-                    ParticleSystem.create_stomp_particles(mermelada.rect.centerx, mermelada.rect.centery, particles)
-                    mermelada.kill()  # Remove mermelada
-
-            # Check for boss defeat (Level 5 only)
-            if level and hasattr(level, 'boss') and level.boss:
-                if level.boss.defeated and not is_level_complete:
-                    # Boss defeated! Unlock the goal
-                    is_level_complete = True
-                    completion_timer = 0
-                    completion_time = (pygame.time.get_ticks() - level_start_time) / 1000
-                    score_earned_in_level = score - level_start_score
-                    audio_manager.play_level_complete()
-                    save_manager.set_highest_level_completed(current_level_number)
-                    save_manager.update_high_score(score)
-                else:
-                    # Boss is still alive - spawn power-ups periodically
-                    powerup_spawn_timer += 1
-                    if powerup_spawn_timer >= powerup_spawn_interval:
-                        powerup_spawn_timer = 0
-                        # Spawn a power-up from the sky at random X position
-                        spawn_x = random.randint(200, level.metadata.get('width', 1600) - 200)
-                        spawn_y = -50  # Start above the screen
-                        new_powerup = GoldenArepa(spawn_x, spawn_y)
-                        new_powerup.platforms = platforms  # Set platform reference for collision detection
-                        powerups.add(new_powerup)
-                        all_sprites.add(new_powerup)
-
-                    # Boss throws mermeladas in circular pattern (arcade-style)
-                    mermelada_list = level.boss.throw_mermeladas_circular()
-                    if mermelada_list is not None:
-                        for x, y, angle in mermelada_list:
-                            mermelada = Mermelada(x, y, angle)
-                            mermeladas.add(mermelada)
-                            all_sprites.add(mermelada)
-
-            # Check for level completion (US-023, US-029, US-068)
-            for goal in goals:
-                # For level 5, require boss defeat first
-                boss_defeated = True
-                if level and hasattr(level, 'boss') and level.boss:
-                    boss_defeated = level.boss.defeated
-
-                if player.rect.colliderect(goal.rect) and boss_defeated:
-                    # Player reached the goal - complete the level!
-                    if not is_level_complete:  # Only trigger once
-                        is_level_complete = True
-                        completion_timer = 0
-                        # Calculate time taken to complete level (in seconds)
-                        completion_time = (pygame.time.get_ticks() - level_start_time) / 1000
-                        # Calculate score earned in this level (US-029)
-                        score_earned_in_level = score - level_start_score
-                        # Play level complete sound effect (US-046)
-                        audio_manager.play_level_complete()
-
-                        # Save game progress (US-068)
-                        save_manager.set_highest_level_completed(current_level_number)
-                        save_manager.update_high_score(score)
-
-            # Check for pit/fall death (US-015)
-            if player.rect.top > WINDOW_HEIGHT:
-                # Player fell into a pit - lose one life immediately
-                player.lives -= 1
-                # Play fall death sound effect (US-045)
-                if audio_manager:
-                    audio_manager.play_death()
-
-                # If still have lives left, respawn at spawn position
-                if player.lives > 0:
-                    level.respawn_player()  # Use Level's respawn method
-                # If no lives left, trigger death state
+            # Clamp long frames (window drag, breakpoints) instead of spiralling
+            accumulator += min(now - last_frame_time, MAX_FRAME_TIME)
+        last_frame_time = now
+
+        if frame_input is not None:
+            # Replay runs exactly the recorded number of steps, however long the frame took
+            steps_due = frame_input.steps
+            accumulator = simulation_step * steps_due
+        else:
+            steps_due = int(accumulator // simulation_step)
+
+        steps_run = 0
+        while steps_run < steps_due:
+            # One simulation step: input, entities, collisions, scoring, progression, camera
+            session.update(keys)
+            accumulator -= simulation_step
+            steps_run += 1
 
             # Check for death condition (US-014, US-036)
-            if player.lives <= 0:
+            if session.game_over:
                 # Player has run out of lives - trigger game over state (US-036)
                 game_state = "game_over"
                 game_over_menu.reset()  # Reset game over menu selection and delay timer
-                # TODO (US-036): Play game over sound/music (audio system in Epic 7)
+                accumulator = 0.0
+                break
+
+        if input_recorder is not None:
+            input_recorder.record_gameplay(keys, steps_run)
 
-        # Update camera position (US-038, US-039)
-        # Camera follows player horizontally, centered on player
-        camera_x = player.rect.centerx - WINDOW_WIDTH // 2
+        # Fraction of a step elapsed since the last update, used to interpolate drawing
+        # (replays draw the latest step so every run renders the same frames)
+        if frame_input is not None:
+            alpha = 1.0
+        else:
+            alpha = max(0.0, accumulator / simulation_step)
+
+        # Local references for drawing
+        level = session.level
+        player = session.player
+        score = session.score
+        camera_x = session.get_render_camera_x(alpha)
+        previous_positions = session.previous_positions
 
-        # Clamp camera to level boundaries (US-039)
-        level_width = level.metadata.get("width", WINDOW_WIDTH)
-        max_camera_x = max(0, level_width - WINDOW_WIDTH)  # Don't scroll if level smaller than screen
-        camera_x = max(0, min(camera_x, max_camera_x))  # Clamp to [0, max_camera_x]
+        performance_monitor.begin_section("background")
 
-        # Fill screen with black background
-        screen.fill(BLACK)
+        # Draw background and platforms - only when the camera scrolled; otherwise
+        # just the areas drawn last frame are restored (dirty rectangle mode)
+        optimized_renderer.begin_frame((level, camera_x), lambda: draw_scene_background(camera_x))
 
-        # Draw background image behind everything (US-056)
-        if level and level.background_image:
-            level_width = level.metadata.get("width", WINDOW_WIDTH)
-            draw_tiled_background(screen, level.background_image, camera_x, level_width, WINDOW_WIDTH, WINDOW_HEIGHT)
+        performance_monitor.end_section("background")
+        performance_monitor.begin_section("sprites")
 
         # Draw all sprites with camera offset using optimized renderer (US-038, US-063)
-        optimized_renderer.draw_sprites_with_offset(all_sprites, camera_x)
+        # Positions are interpolated between the last two simulation steps
+        optimized_renderer.draw_sprites_with_offset(session.all_sprites, camera_x, previous_positions, alpha)
 
         # Draw particles with camera offset using optimized renderer (US-058, US-063)
-        optimized_renderer.draw_sprites_with_offset(particles, camera_x)
+        optimized_renderer.draw_sprites_with_offset(session.particles, camera_x, previous_positions, alpha)
 
         # Draw boss health bar if boss exists
         if level and hasattr(level, 'boss') and level.boss:
-            level.boss.draw_health_bar(screen, camera_x)
+            optimized_renderer.mark_dirty(level.boss.draw_health_bar(screen, camera_x))
+
+        performance_monitor.end_section("sprites")
+        performance_monitor.begin_section("hud")
 
         # Draw HUD - Score Display (US-031)
-        score_text = font.render(f"SCORE: {score:05d}", True, (255, 255, 255))  # White text, zero-padded to 5 digits
-        screen.blit(score_text, (10, 10))  # Top-left corner
+        # White text, zero-padded to 5 digits, top-left corner (digits come from the glyph atlas)
+        optimized_renderer.mark_dirty(
+            text_renderer.draw_text(screen, font, f"SCORE: {score:05d}", (255, 255, 255), topleft=(10, 10)))
 
         # Draw HUD - Lives Display (US-032) - Hearts instead of number
-        draw_hearts(screen, player.lives, WINDOW_WIDTH - 10, 10)
+        optimized_renderer.mark_dirty(draw_hearts(screen, player.lives, WINDOW_WIDTH - 10, 10))
 
         # Display powerup timer when powered up (US-033)
         if player.is_powered_up:
@@ -899,166 +640,62 @@ def main():
             else:
                 timer_color = (255, 215, 0)  # Gold color (normal)
 
-            # Format timer text to show countdown
-            timer_text = font.render(f"POWERUP: {powerup_seconds:.1f}s", True, timer_color)
-
-            # Position at top-center of screen for visibility
-            timer_rect = timer_text.get_rect()
-            timer_rect.centerx = WINDOW_WIDTH // 2  # Centered horizontally
-            timer_rect.top = 10  # 10px from top (same as score/lives)
-
-            screen.blit(timer_text, timer_rect)
+            # Show the countdown at top-center of screen for visibility,
+            # 10px from top (same as score/lives)
+            optimized_renderer.mark_dirty(text_renderer.draw_text(
+                screen, font, f"POWERUP: {powerup_seconds:.1f}s", timer_color, midtop=(WINDOW_WIDTH // 2, 10)))
 
         # Display level name at level start (US-037)
         # Only show during normal gameplay, not during special screens
-        if level_name_display and not is_level_complete and not is_transition_screen and not is_victory_screen:
-            level_name_display.draw(screen)
-
-        # Display level completion screen (US-023)
-        if is_level_complete:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(180)  # Semi-transparent (0-255)
-            overlay.fill((0, 0, 0))  # Black overlay
-            screen.blit(overlay, (0, 0))
-
-            # Create larger font for completion screen
-            big_font = pygame.font.Font(None, 72)
-            medium_font = pygame.font.Font(None, 48)
-
-            # Display "LEVEL COMPLETE!" message
-            complete_text = big_font.render("LEVEL COMPLETE!", True, (0, 255, 0))  # Bright green
-            complete_rect = complete_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
-            screen.blit(complete_text, complete_rect)
-
-            # Display final score
-            score_text = medium_font.render(f"Final Score: {score}", True, (255, 255, 255))  # White
-            score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-            screen.blit(score_text, score_rect)
-
-            # Display completion time
-            time_text = medium_font.render(f"Time: {completion_time:.1f}s", True, (255, 255, 255))  # White
-            time_rect = time_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
-            screen.blit(time_text, time_rect)
+        if session.level_name_display and not session.is_level_complete and not session.is_transition_screen and not session.is_victory_screen:
+            optimized_renderer.mark_dirty(session.level_name_display.draw(screen))
+
+        # Display level completion screen (US-023) - composed once, one blit per frame
+        if session.is_level_complete:
+            optimized_renderer.mark_dirty(level_complete_overlay.draw(screen, score, session.completion_time))
 
         # Display level transition screen (US-029)
-        if is_transition_screen:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(200)  # Slightly more opaque than completion screen
-            overlay.fill((0, 0, 0))  # Black overlay
-            screen.blit(overlay, (0, 0))
-
-            # Create fonts for transition screen
-            big_font = pygame.font.Font(None, 72)
-            medium_font = pygame.font.Font(None, 48)
-            small_font = pygame.font.Font(None, 36)
-
-            # Get level metadata for display
-            level_name = level.metadata.get("name", f"Level {current_level_number}")
-
-            # Display "Level Complete!" title
-            title_text = big_font.render("Level Complete!", True, (0, 255, 0))  # Bright green
-            title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 6))
-            screen.blit(title_text, title_rect)
-
-            # Display level name and number
-            level_info_text = medium_font.render(f"{level_name} (Level {current_level_number})", True, (255, 255, 255))  # White
-            level_info_rect = level_info_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 6 + 80))
-            screen.blit(level_info_text, level_info_rect)
-
-            # Display score earned in this level
-            score_earned_text = medium_font.render(f"Score Earned: {score_earned_in_level}", True, (255, 215, 0))  # Gold
-            score_earned_rect = score_earned_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40))
-            screen.blit(score_earned_text, score_earned_rect)
-
-            # Display total score
-            total_score_text = small_font.render(f"Total Score: {score}", True, (255, 255, 255))  # White
-            total_score_rect = total_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
-            screen.blit(total_score_text, total_score_rect)
-
-            # Display time taken
-            time_text = medium_font.render(f"Time: {completion_time:.1f}s", True, (255, 255, 255))  # White
-            time_rect = time_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
-            screen.blit(time_text, time_rect)
-
-            # Display "Press any key to continue" prompt
-            # Add blinking effect by alternating visibility every 30 frames
-            if (pygame.time.get_ticks() // 500) % 2 == 0:  # Blink every 0.5 seconds
-                continue_text = small_font.render("Press any key to continue", True, (200, 200, 200))  # Light gray
-                continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100))
-                screen.blit(continue_text, continue_rect)
+        if session.is_transition_screen:
+            level_name = level.metadata.get("name", f"Level {session.current_level_number}")
+            # "Press any key to continue" blinks every 0.5 seconds
+            show_prompt = (pygame.time.get_ticks() // 500) % 2 == 0
+            optimized_renderer.mark_dirty(transition_overlay.draw(
+                screen, level_name, session.current_level_number,
+                session.score_earned_in_level, score, session.completion_time, show_prompt))
 
         # Display victory screen (US-030)
-        if is_victory_screen:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(220)  # Mostly opaque for clear victory screen
-            overlay.fill((0, 0, 0))  # Black overlay
-            screen.blit(overlay, (0, 0))
-
-            # Create fonts for victory screen
-            huge_font = pygame.font.Font(None, 96)  # Extra large for main title
-            big_font = pygame.font.Font(None, 72)
-            medium_font = pygame.font.Font(None, 48)
-            small_font = pygame.font.Font(None, 36)
-
-            # Colombian flag colors for celebration theme
-            yellow_col = (255, 209, 0)  # Colombian yellow
-            blue_col = (0, 56, 168)     # Colombian blue
-            red_col = (206, 17, 38)     # Colombian red
-            gold_col = (255, 215, 0)    # Gold for highlights
-
-            # Display main congratulations message
-            congrats_text = huge_font.render("¡FELICIDADES!", True, yellow_col)  # Spanish for "Congratulations!"
-            congrats_rect = congrats_text.get_rect(center=(WINDOW_WIDTH // 2, 80))
-            screen.blit(congrats_text, congrats_rect)
-
-            # Display "You completed Coffee Bros!" message
-            completed_text = big_font.render("You completed Coffee Bros!", True, (255, 255, 255))  # White
-            completed_rect = completed_text.get_rect(center=(WINDOW_WIDTH // 2, 180))
-            screen.blit(completed_text, completed_rect)
-
-            # Display total score
-            score_text = medium_font.render(f"Total Score: {score}", True, gold_col)  # Gold
-            score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 270))
-            screen.blit(score_text, score_rect)
-
-            # Display total time played
-            time_text = medium_font.render(f"Total Time: {total_game_time:.1f}s", True, gold_col)  # Gold
-            time_rect = time_text.get_rect(center=(WINDOW_WIDTH // 2, 330))
-            screen.blit(time_text, time_rect)
-
-            # Colombian-themed celebration message
-            celebration_text = small_font.render("¡Eres el mejor cafetero!", True, yellow_col)  # "You're the best coffee grower!"
-            celebration_rect = celebration_text.get_rect(center=(WINDOW_WIDTH // 2, 400))
-            screen.blit(celebration_text, celebration_rect)
-
-            # Display options
-            restart_text = small_font.render("Press R to Restart", True, (200, 200, 200))  # Light gray
-            restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, 460))
-            screen.blit(restart_text, restart_rect)
-
-            menu_text = small_font.render("Press M to Return to Menu", True, (200, 200, 200))  # Light gray
-            menu_rect = menu_text.get_rect(center=(WINDOW_WIDTH // 2, 510))
-            screen.blit(menu_text, menu_rect)
-
-            quit_text = small_font.render("Press Q or ESC to Quit", True, (200, 200, 200))  # Light gray
-            quit_rect = quit_text.get_rect(center=(WINDOW_WIDTH // 2, 560))
-            screen.blit(quit_text, quit_rect)
-
-        # Update performance monitoring (US-063)
-        performance_monitor.update()
+        if session.is_victory_screen:
+            optimized_renderer.mark_dirty(victory_overlay.draw(screen, score, session.total_game_time))
 
         # Draw performance overlay if enabled (US-063)
         if show_performance_overlay:
-            performance_monitor.draw_debug_overlay(screen)
+            optimized_renderer.mark_dirty(performance_monitor.draw_debug_overlay(screen))
+
+        performance_monitor.end_section("hud")
 
         # Update display
-        pygame.display.flip()
+        with performance_monitor.section("flip"):
+            optimized_renderer.update_display()
+
+        # Update performance monitoring (US-063) - closes this frame's section timings
+        performance_monitor.update()
+
+        # Cap the rendering frame rate - simulation speed is fixed by the accumulator
+        clock.tick(render_fps)
+
+    # Report replay timing for A/B comparisons
+    if input_replay is not None:
+        replay_time = time.perf_counter() - replay_start
+        if replay_frames > 0 and replay_time > 0:
+            print(f"Replay finished: {replay_frames} frames in {replay_time:.2f}s "
+                  f"({replay_time * 1000 / replay_frames:.2f} ms/frame average, seed {seed})")
+
+    # Stop background memory sampling
+    performance_monitor.close()
 
-        # Maintain consistent FPS
-        clock.tick(FPS)
+    # Save input recording (before pygame shuts down)
+    if input_recorder is not None:
+        input_recorder.save()
 
     # Save game on exit (US-068)
     print("Saving game progress before exit...")
@@ -1070,4 +707,14 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Headless simulation mode: no window, no audio, simulated FPS report
+    if "--headless" in sys.argv[1:]:
+        from src.headless import run_cli
+        sys.exit(run_cli())
+
+    parser = argparse.ArgumentParser(description="Coffee Bros")
+    parser.add_argument("--record", metavar="FILE", help="record input and random seed to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay input recorded with --record")
+    parser.add_argument("--seed", type=int, help="seed for the random module")
+    args = parser.parse_args()
+    main(record_path=args.record, replay_path=args.replay, seed=args.seed)
@@ -0,0 +1,324 @@
+"""
+Compiled level format for Coffee Bros.
+Level JSON files are compiled into a compact binary file holding the platform,
+enemy and powerup records as flat int32 columns (float64 for fields with
+non-integer values). Loading a compiled level is a
+memory-mapped read of a few arrays instead of parsing and walking JSON, and the
+level builds and resets its entities straight from those columns.
+
+Compiled files live in assets/levels/compiled/ and are rebuilt automatically
+whenever the JSON next to them is newer. To compile every level ahead of time
+(build.py does this before packaging), run:
+    python -m src.compiled_level
+"""
+
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+# File layout:
+#   header       "<4sBIIIII": magic, version, JSON length, string table length,
+#                platform count, enemy count, powerup count
+#   JSON         everything except the entity lists (metadata, player, goal, boss, ...)
+#   strings      NUL-separated names referenced by the string columns
+#   typecodes    one array typecode per column: "i" (int32) or "d" (float64)
+#   padding      to a 4-byte boundary
+#   columns      little-endian arrays, one per field, platforms then enemies then powerups
+MAGIC = b"CBLV"
+VERSION = 2
+COLUMN_TYPECODES = "id"
+HEADER = struct.Struct("<4sBIIIII")
+COMPILED_DIR = "compiled"
+COMPILED_EXTENSION = ".cblv"
+
+# Entity record fields: (JSON key, is a string, default) in the order entities are built from
+PLATFORM_FIELDS = (("x", False, 0), ("y", False, 0), ("width", False, 100), ("height", False, 20),
+                   ("type", True, "ground"), ("texture", True, "grass"))
+ENEMY_FIELDS = (("type", True, "polocho"), ("spawn_x", False, 0), ("spawn_y", False, 0),
+                ("patrol_distance", False, 150))
+POWERUP_FIELDS = (("type", True, "golden_arepa"), ("x", False, 0), ("y", False, 0))
+TABLES = (("platforms", PLATFORM_FIELDS), ("enemies", ENEMY_FIELDS), ("powerups", POWERUP_FIELDS))
+
+
+class EntityTable:
+    """
+    Column-oriented entity records (one sequence per field).
+    Rows come out as tuples in field order, ready to pass to the Level create_* methods.
+    """
+
+    def __init__(self, fields, columns):
+        """
+        Initialize an entity table.
+
+        Args:
+            fields (tuple): (name, is a string, default) field descriptions
+            columns (list): One sequence per field, all the same length
+        """
+        self.fields = fields
+        self.columns = columns
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.columns[0]) if self.columns else 0
+
+    def rows(self):
+        """Iterate over records as tuples in field order."""
+        return zip(*self.columns)
+
+    def row(self, index):
+        """
+        Get one record.
+
+        Args:
+            index (int): Record index
+
+        Returns:
+            tuple: Field values in field order
+        """
+        return tuple(column[index] for column in self.columns)
+
+    @classmethod
+    def from_records(cls, fields, records):
+        """
+        Build a table from JSON records (dictionaries), filling in defaults.
+
+        Args:
+            fields (tuple): (name, is a string, default) field descriptions
+            records (list): Entity dictionaries from the level JSON
+
+        Returns:
+            EntityTable: Table holding the records
+        """
+        return cls(fields, [[record.get(name, default) for record in records]
+                            for name, _, default in fields])
+
+
+def split_level_data(level_data):
+    """
+    Split parsed level JSON into the entity tables and everything else.
+
+    Args:
+        level_data (dict): Parsed level JSON
+
+    Returns:
+        tuple: (level data without entity lists, {"platforms": table, "enemies": table, "powerups": table})
+
+    Raises:
+        ValueError: If the data is not a dictionary or an entity list is not an array
+    """
+    if not isinstance(level_data, dict):
+        raise ValueError("Level data must be a dictionary")
+    if "platforms" not in level_data:
+        raise ValueError("Missing required field: platforms")
+
+    data = {key: value for key, value in level_data.items() if key not in dict(TABLES)}
+    tables = {}
+    for name, fields in TABLES:
+        records = level_data.get(name, [])
+        if not isinstance(records, list):
+            raise ValueError(f"{name.capitalize()} must be an array")
+        tables[name] = EntityTable.from_records(fields, records)
+    return data, tables
+
+
+def compile_level(json_path, compiled_path):
+    """
+    Compile a level JSON file into the binary format.
+
+    Args:
+        json_path (str): Level JSON file
+        compiled_path (str): Output file (written atomically)
+
+    Raises:
+        ValueError: If the JSON is invalid, a numeric field is not a number or an
+            integer field is out of the 32-bit range
+    """
+    with open(json_path, 'r') as f:
+        try:
+            level_data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {json_path}: {e}")
+    data, tables = split_level_data(level_data)
+
+    strings = []
+    string_indices = {}
+    typecodes = []
+    column_bytes = []
+    for name, fields in TABLES:
+        for column, (field, is_string, _) in zip(tables[name].columns, fields):
+            if is_string:
+                values = []
+                for value in column:
+                    if value not in string_indices:
+                        string_indices[value] = len(strings)
+                        strings.append(str(value))
+                    values.append(string_indices[value])
+                typecode = 'i'
+            else:
+                values = column
+                if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+                    raise ValueError(f"{name} field '{field}' must be a number in {json_path}")
+                # Integer fields stay int32, any float makes the whole column float64 (values are kept as-is)
+                typecode = 'i' if all(isinstance(value, int) for value in values) else 'd'
+            try:
+                packed = array(typecode, values)
+            except OverflowError:
+                raise ValueError(f"{name} field '{field}' is out of range in {json_path}")
+            if sys.byteorder != 'little':
+                packed.byteswap()
+            typecodes.append(typecode)
+            column_bytes.append(packed.tobytes())
+
+    json_blob = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    string_blob = "\0".join(strings).encode('utf-8')
+    typecode_blob = "".join(typecodes).encode('ascii')
+    header = HEADER.pack(MAGIC, VERSION, len(json_blob), len(string_blob),
+                         len(tables["platforms"]), len(tables["enemies"]), len(tables["powerups"]))
+    padding = -(len(header) + len(json_blob) + len(string_blob) + len(typecode_blob)) % 4
+
+    os.makedirs(os.path.dirname(compiled_path) or ".", exist_ok=True)
+    temp_path = f"{compiled_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(json_blob)
+        f.write(string_blob)
+        f.write(typecode_blob)
+        f.write(b"\0" * padding)
+        for chunk in column_bytes:
+            f.write(chunk)
+    os.replace(temp_path, compiled_path)
+
+
+def load_compiled(compiled_path):
+    """
+    Load a compiled level.
+
+    Args:
+        compiled_path (str): File written by compile_level()
+
+    Returns:
+        tuple: (level data without entity lists, entity tables) like split_level_data()
+
+    Raises:
+        ValueError: If the file is not a compiled level of this version, or is truncated or damaged
+    """
+    with open(compiled_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            raise ValueError(f"Not a compiled level: {compiled_path}")
+
+    with mapped:
+        if len(mapped) < HEADER.size:
+            raise ValueError(f"Not a compiled level: {compiled_path}")
+        magic, version, json_length, strings_length, *counts = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a compiled level: {compiled_path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported compiled level version {version}: {compiled_path}")
+
+        offset = HEADER.size
+        data = json.loads(mapped[offset:offset + json_length].decode('utf-8'))
+        offset += json_length
+        strings = mapped[offset:offset + strings_length].decode('utf-8').split("\0")
+        offset += strings_length
+        column_count = sum(len(fields) for _, fields in TABLES)
+        typecodes = mapped[offset:offset + column_count].decode('ascii', errors='replace')
+        if len(typecodes) != column_count or any(code not in COLUMN_TYPECODES for code in typecodes):
+            raise ValueError(f"Damaged compiled level: {compiled_path}")
+        offset += column_count
+        offset += -offset % 4
+
+        column_counts = [count for count, (_, fields) in zip(counts, TABLES) for _ in fields]
+        expected = offset + sum(count * array(code).itemsize for count, code in zip(column_counts, typecodes))
+        if len(mapped) != expected:
+            raise ValueError(f"Truncated compiled level: {compiled_path}")
+
+        tables = {}
+        typecodes = iter(typecodes)
+        for count, (name, fields) in zip(counts, TABLES):
+            columns = []
+            for _, is_string, _ in fields:
+                column = array(next(typecodes))
+                if is_string and column.typecode != 'i':
+                    raise ValueError(f"Damaged compiled level: {compiled_path}")
+                size = count * column.itemsize
+                column.frombytes(mapped[offset:offset + size])
+                if sys.byteorder != 'little':
+                    column.byteswap()
+                offset += size
+                columns.append([strings[index] for index in column] if is_string else column)
+            tables[name] = EntityTable(fields, columns)
+
+    return data, tables
+
+
+def get_compiled_path(json_path):
+    """Get the compiled file path for a level JSON file."""
+    directory, filename = os.path.split(json_path)
+    return os.path.join(directory, COMPILED_DIR, os.path.splitext(filename)[0] + COMPILED_EXTENSION)
+
+
+def load_level_data(json_path, use_compiled=True):
+    """
+    Load a level's data, from its compiled file when it is up to date.
+    The compiled file is (re)built when it is missing, older than the JSON or unreadable.
+    If it can't be written, the JSON is parsed directly.
+
+    Args:
+        json_path (str): Level JSON file
+        use_compiled (bool): False to always parse the JSON
+
+    Returns:
+        tuple: (level data without entity lists, entity tables) like split_level_data()
+
+    Raises:
+        ValueError: If the level JSON is invalid
+    """
+    if use_compiled:
+        compiled_path = get_compiled_path(json_path)
+        try:
+            if os.path.getmtime(compiled_path) >= os.path.getmtime(json_path):
+                return load_compiled(compiled_path)
+        except (OSError, ValueError):
+            pass  # Missing, stale or unreadable - rebuild it below
+
+        try:
+            compile_level(json_path, compiled_path)
+            return load_compiled(compiled_path)
+        except OSError as e:
+            print(f"Warning: Could not write compiled level {compiled_path}: {e}")
+
+    with open(json_path, 'r') as f:
+        try:
+            level_data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in {json_path}: {e}")
+    return split_level_data(level_data)
+
+
+def compile_all(levels_dir=os.path.join("assets", "levels")):
+    """
+    Compile every level JSON file in a directory.
+
+    Args:
+        levels_dir (str): Directory holding level_*.json files
+
+    Returns:
+        list: Paths of the compiled files
+    """
+    compiled = []
+    for json_path in sorted(glob.glob(os.path.join(levels_dir, "level_*.json"))):
+        compiled_path = get_compiled_path(json_path)
+        compile_level(json_path, compiled_path)
+        print(f"Compiled {json_path} -> {compiled_path}")
+        compiled.append(compiled_path)
+    return compiled
+
+
+if __name__ == "__main__":
+    compile_all()
@@ -36,7 +36,93 @@ def create_fallback_heart():
     return heart
 
 
-def draw_tiled_background(screen, background_image, camera_x, level_width, window_width, window_height):
+class BackgroundCache:
+    """
+    Cache of level backgrounds prepared for drawing.
+    Each background is scaled to the window height once instead of being resampled
+    for every tile every frame. Tiles narrower than the window can optionally be
+    pre-composited into a strip one viewport plus one tile wide, so drawing is a
+    single blit (or two when a wide image wraps around) however narrow the tile.
+    The strip only pays off for very narrow tiles - blitting a few medium tiles is
+    as fast as one large strip blit.
+    """
+
+    def __init__(self, max_entries=8):
+        """
+        Initialize the background cache.
+
+        Args:
+            max_entries (int): Prepared backgrounds kept before the oldest is dropped
+        """
+        self.max_entries = max_entries
+        self.entries = {}  # Dictionary mapping (image, window size, strip) to (surface, tile width)
+
+    def get(self, background_image, window_width, window_height, composite_strip=False):
+        """
+        Get a background prepared for a window size, preparing it on first use.
+
+        Args:
+            background_image: Background image surface
+            window_width: Width of the game window
+            window_height: Height of the game window
+            composite_strip: Pre-composite tiles narrower than the window into one strip
+
+        Returns:
+            tuple: (prepared surface, width of one tile in pixels)
+        """
+        key = (background_image, window_width, window_height, composite_strip)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self._prepare(background_image, window_width, window_height, composite_strip)
+            if len(self.entries) >= self.max_entries:
+                # Backgrounds are reloaded with each level - drop the oldest entry
+                del self.entries[next(iter(self.entries))]
+            self.entries[key] = entry
+        return entry
+
+    def _prepare(self, background_image, window_width, window_height, composite_strip):
+        """Scale a background to the window height and tile it into a strip if needed."""
+        tile_width = background_image.get_width()
+        if background_image.get_height() != window_height:
+            tile = pygame.transform.scale(background_image, (tile_width, window_height))
+        else:
+            tile = background_image
+
+        if not composite_strip or tile_width >= window_width:
+            return (tile, tile_width)
+
+        # Enough whole tiles to cover the viewport at any scroll offset
+        tile_count = -(-window_width // tile_width) + 1
+        strip = pygame.Surface((tile_width * tile_count, window_height)).convert(tile)
+        for i in range(tile_count):
+            strip.blit(tile, (i * tile_width, 0))
+        return (strip, tile_width)
+
+    def clear(self):
+        """Clear all prepared backgrounds."""
+        self.entries.clear()
+
+
+# Prepared level backgrounds (scaled once per level load)
+_background_cache = BackgroundCache()
+
+
+def prepare_background(background_image, window_width, window_height, composite_strip=False):
+    """
+    Scale (and tile) a level background ahead of drawing it, e.g. right after a level loads.
+
+    Args:
+        background_image: Background image surface
+        window_width: Width of the game window
+        window_height: Height of the game window
+        composite_strip: Pre-composite tiles narrower than the window into one strip
+    """
+    if background_image:
+        _background_cache.get(background_image, window_width, window_height, composite_strip)
+
+
+def draw_tiled_background(screen, background_image, camera_x, level_width, window_width, window_height,
+                          composite_strip=False):
     """
     Draw a background image tiled across the entire level width
 
@@ -47,31 +133,48 @@ def draw_tiled_background(screen, background_image, camera_x, level_width, windo
         level_width: Total width of the level
         window_width: Width of the game window
         window_height: Height of the game window
+        composite_strip: Pre-composite tiles narrower than the window into one strip
     """
     if not background_image:
         return
 
-    bg_width = background_image.get_width()
-    bg_height = background_image.get_height()
+    surface, tile_width = _background_cache.get(background_image, window_width, window_height, composite_strip)
+    surface_width = surface.get_width()
 
-    # Calculate how many tiles we need to cover the visible area
-    # We draw from slightly before the camera to slightly after
-    start_x = (camera_x // bg_width) * bg_width
-    end_x = camera_x + window_width + bg_width
+    # Tiles repeat every tile_width pixels, so only the camera offset within one tile matters
+    offset = int(camera_x) % tile_width
+    screen.blit(surface, (0, 0), (offset, 0, window_width, window_height))
 
-    # Draw tiles
-    for tile_x in range(int(start_x), int(end_x), bg_width):
-        # Calculate draw position on screen (with camera offset)
-        screen_x = tile_x - camera_x
+    # Wrap around to the next copy when the visible span runs past the end of the surface
+    screen_x = surface_width - offset
+    while screen_x < window_width:
+        screen.blit(surface, (screen_x, 0))
+        screen_x += surface_width
 
-        # Only draw if visible on screen
-        if screen_x + bg_width >= 0 and screen_x < window_width:
-            # If the background is taller/shorter than window, scale it
-            if bg_height != window_height:
-                scaled_bg = pygame.transform.scale(background_image, (bg_width, window_height))
-                screen.blit(scaled_bg, (screen_x, 0))
-            else:
-                screen.blit(background_image, (screen_x, 0))
+
+def draw_level_background(screen, level, parallax_background, camera_x, level_width, window_width, window_height):
+    """
+    Draw a level's parallax layers if it has them, its background image otherwise
+
+    Args:
+        screen: Pygame screen surface to draw on
+        level: Current level (or None)
+        parallax_background: The level's ParallaxBackground, or None if it declares no layers
+        camera_x: Current camera x position
+        level_width: Total width of the level
+        window_width: Width of the game window
+        window_height: Height of the game window
+
+    Returns:
+        True if the whole window was covered, False if nothing was drawn
+    """
+    if parallax_background is not None:
+        parallax_background.draw(screen, camera_x)
+        return True
+    if level and level.background_image:
+        draw_tiled_background(screen, level.background_image, camera_x, level_width, window_width, window_height)
+        return True
+    return False
 
 
 def draw_hearts(screen, lives, x, y, spacing=5):
@@ -86,7 +189,7 @@ def draw_hearts(screen, lives, x, y, spacing=5):
         spacing: Space between hearts in pixels
 
     Returns:
-        The leftmost x position of the drawn hearts
+        pygame.Rect of the area the hearts take (from the leftmost heart to x)
     """
     heart_image = load_heart_image()
     heart_width = heart_image.get_width()
@@ -99,4 +202,5 @@ def draw_hearts(screen, lives, x, y, spacing=5):
         screen.blit(heart_image, (heart_x, y))
         current_x = heart_x - spacing
 
-    return current_x
+    left = min(current_x + spacing, x)
+    return pygame.Rect(left, y, x - left, heart_height)
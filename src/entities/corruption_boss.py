@@ -6,6 +6,7 @@ The ultimate enemy - a massive corruption monster that must be defeated
 import pygame
 import os
 import math
+from src.optimization import query_platforms
 
 class CorruptionBoss(pygame.sprite.Sprite):
     """
@@ -136,7 +137,7 @@ class CorruptionBoss(pygame.sprite.Sprite):
         Update boss state
 
         Args:
-            platforms: Sprite group of platforms for collision
+            platforms: Sprite group or PlatformIndex of platforms for collision
         """
         if not self.alive:
             return
@@ -173,7 +174,7 @@ class CorruptionBoss(pygame.sprite.Sprite):
 
         # Platform collision (boss needs to stay on ground)
         self.on_ground = False
-        for platform in platforms:
+        for platform in query_platforms(platforms, self.rect):
             if self.rect.colliderect(platform.rect):
                 # Vertical collision
                 if self.vel_y > 0:  # Falling
@@ -227,9 +228,12 @@ class CorruptionBoss(pygame.sprite.Sprite):
         Args:
             surface: Surface to draw on
             camera_x: Camera offset for scrolling
+
+        Returns:
+            pygame.Rect: Area drawn, or None if the bar is hidden
         """
         if not self.alive and self.defeated:
-            return
+            return None
 
         # Health bar dimensions
         bar_width = 150
@@ -259,6 +263,7 @@ class CorruptionBoss(pygame.sprite.Sprite):
             pygame.draw.rect(surface, health_color, health_rect)
 
         # Boss name label removed per user request
+        return bg_rect
 
     def get_damage_rect(self):
         """
@@ -3,6 +3,7 @@ Goal entity for level completion.
 Represents the end goal (flag/door) that triggers level completion.
 """
 
+import os
 import pygame
 from config import GOAL_COLOR
 
@@ -13,6 +14,26 @@ class Goal(pygame.sprite.Sprite):
     Visually represents the end goal of a level (flag, door, etc.)
     """
 
+    # Class-level image cache, so each level load doesn't decode the goal image again
+    _image_cache = {}
+
+    @classmethod
+    def _load_image(cls, path):
+        """
+        Load a goal image, decoding it only the first time.
+
+        Args:
+            path (str): Path to the image file
+
+        Returns:
+            pygame.Surface: Goal image, or None if the file doesn't exist
+        """
+        if path not in cls._image_cache:
+            if not os.path.exists(path):
+                return None
+            cls._image_cache[path] = pygame.image.load(path).convert_alpha()
+        return cls._image_cache[path]
+
     def __init__(self, x, y, width=40, height=80, goal_type="castle"):
         """
         Initialize the goal sprite.
@@ -44,6 +65,15 @@ class Goal(pygame.sprite.Sprite):
         self.rect.centerx = x
         self.rect.bottom = y
 
+    def get_x_range(self):
+        """
+        Get the horizontal range the goal stays in, for camera culling (it never moves).
+
+        Returns:
+            tuple: (left, right) world x coordinates
+        """
+        return (self.rect.left, self.rect.right)
+
     def _load_chiva_sprite(self):
         """
         Load the Colombian Chiva bus sprite for goal.
@@ -51,10 +81,10 @@ class Goal(pygame.sprite.Sprite):
         Returns:
             pygame.Surface: Chiva bus sprite image
         """
-        import os
         chiva_path = os.path.join("assets", "images", "chiva_bus.png")
-        if os.path.exists(chiva_path):
-            return pygame.image.load(chiva_path).convert_alpha()
+        image = self._load_image(chiva_path)
+        if image is not None:
+            return image
         else:
             # Fallback to castle if Chiva not found
             print(f"Warning: Chiva bus sprite not found at {chiva_path}, using castle")
@@ -67,10 +97,10 @@ class Goal(pygame.sprite.Sprite):
         Returns:
             pygame.Surface: Jam jar sprite image
         """
-        import os
         jam_path = os.path.join("assets", "images", "purple_jam_jar.png")
-        if os.path.exists(jam_path):
-            return pygame.image.load(jam_path).convert_alpha()
+        image = self._load_image(jam_path)
+        if image is not None:
+            return image
         else:
             # Fallback to castle if jam jar not found
             print(f"Warning: Jam jar sprite not found at {jam_path}, using castle")
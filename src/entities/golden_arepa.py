@@ -5,6 +5,7 @@ A collectible power-up that floats in the game world with a glowing effect.
 import pygame
 import math
 from config import GOLD, POWERUP_FLOAT_AMPLITUDE, POWERUP_FLOAT_SPEED
+from src.optimization import shared_frames
 
 
 class GoldenArepa(pygame.sprite.Sprite):
@@ -14,6 +15,14 @@ class GoldenArepa(pygame.sprite.Sprite):
     Can be collected by the player.
     """
 
+    # Power-up dimensions (30x30 pixels as per technical notes)
+    width = 30
+    height = 30
+
+    # Glow dimensions (larger to create glow effect around the arepa)
+    glow_width = 50
+    glow_height = 50
+
     def __init__(self, x, y):
         """
         Initialize the Golden Arepa power-up.
@@ -24,17 +33,9 @@ class GoldenArepa(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        # Power-up dimensions (30x30 pixels as per technical notes)
-        self.width = 30
-        self.height = 30
-
-        # Glow dimensions (larger to create glow effect around the arepa)
-        self.glow_width = 50
-        self.glow_height = 50
-
-        # Create base surfaces
-        self._create_base_image()
-        self._create_glow_frames()
+        # Glow frames are drawn once and shared by every power-up
+        self.glow_frames = shared_frames.get("golden_arepa")
+        self.image = self.glow_frames[0]
 
         # Set up the rect for positioning and collision
         # Use glow dimensions - slightly larger collision area is fine
@@ -58,10 +59,16 @@ class GoldenArepa(pygame.sprite.Sprite):
         self.has_landed = False  # Track if power-up has landed
         self.platforms = None  # Will be set by game loop for collision detection
 
-    def _create_base_image(self):
-        """Create the base arepa image - circular Colombian arepa with texture."""
-        self.base_image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.base_image.fill((0, 0, 0, 0))  # Transparent background
+    @classmethod
+    def _create_base_image(cls):
+        """
+        Create the base arepa image - circular Colombian arepa with texture.
+
+        Returns:
+            pygame.Surface: Arepa image without glow
+        """
+        base_image = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
+        base_image.fill((0, 0, 0, 0))  # Transparent background
 
         # Colombian arepa colors
         arepa_color = (255, 223, 128)  # Golden corn color
@@ -69,15 +76,15 @@ class GoldenArepa(pygame.sprite.Sprite):
         grill_marks = (180, 140, 70)  # Dark brown grill marks
 
         # Draw main circular arepa body
-        center = (self.width // 2, self.height // 2)
-        radius = self.width // 2 - 1
-        pygame.draw.circle(self.base_image, arepa_color, center, radius)
+        center = (cls.width // 2, cls.height // 2)
+        radius = cls.width // 2 - 1
+        pygame.draw.circle(base_image, arepa_color, center, radius)
 
         # Draw slightly darker inner circle for depth
-        pygame.draw.circle(self.base_image, darker_arepa, center, radius - 2)
+        pygame.draw.circle(base_image, darker_arepa, center, radius - 2)
 
         # Draw toasted edges (darker ring around the edge)
-        pygame.draw.circle(self.base_image, darker_arepa, center, radius, 2)
+        pygame.draw.circle(base_image, darker_arepa, center, radius, 2)
 
         # Add grill mark texture (characteristic of Colombian arepas)
         # Horizontal grill marks
@@ -86,21 +93,28 @@ class GoldenArepa(pygame.sprite.Sprite):
             x_start = center[0] - int(math.sqrt(max(0, radius**2 - i**2)))
             x_end = center[0] + int(math.sqrt(max(0, radius**2 - i**2)))
             if x_end > x_start:
-                pygame.draw.line(self.base_image, grill_marks,
+                pygame.draw.line(base_image, grill_marks,
                                (x_start + 2, y_pos), (x_end - 2, y_pos), 1)
 
         # Add some corn texture dots
         for i in range(8):
             dot_x = center[0] + int(math.cos(i * math.pi / 4) * (radius - 6))
             dot_y = center[1] + int(math.sin(i * math.pi / 4) * (radius - 6))
-            pygame.draw.circle(self.base_image, darker_arepa, (dot_x, dot_y), 1)
+            pygame.draw.circle(base_image, darker_arepa, (dot_x, dot_y), 1)
+
+        return base_image
 
-    def _create_glow_frames(self):
+    @classmethod
+    def _create_glow_frames(cls):
         """
         Create 6 frames of glow animation with varying alpha values.
         Each frame has a different glow intensity that pulses smoothly.
+
+        Returns:
+            list: 6 glow frames, each with the arepa drawn in the center
         """
-        self.glow_frames = []
+        base_image = cls._create_base_image()
+        glow_frames = []
 
         # Define alpha values for each of the 6 frames
         # Smoothly pulse from dim to bright and back
@@ -108,41 +122,40 @@ class GoldenArepa(pygame.sprite.Sprite):
 
         for alpha in alpha_values:
             # Create a surface for the entire glow + arepa
-            frame = pygame.Surface((self.glow_width, self.glow_height), pygame.SRCALPHA)
+            frame = pygame.Surface((cls.glow_width, cls.glow_height), pygame.SRCALPHA)
 
             # Create glow layers (3 concentric layers for smoother glow)
             glow_color = (255, 223, 0)  # Slightly different gold for glow
 
             # Outer glow (largest, most transparent)
-            outer_glow = pygame.Surface((self.glow_width, self.glow_height), pygame.SRCALPHA)
+            outer_glow = pygame.Surface((cls.glow_width, cls.glow_height), pygame.SRCALPHA)
             pygame.draw.circle(outer_glow, (*glow_color, alpha // 3),
-                             (self.glow_width // 2, self.glow_height // 2),
-                             self.glow_width // 2)
+                             (cls.glow_width // 2, cls.glow_height // 2),
+                             cls.glow_width // 2)
             frame.blit(outer_glow, (0, 0))
 
             # Middle glow (medium size and transparency)
-            middle_glow = pygame.Surface((self.glow_width, self.glow_height), pygame.SRCALPHA)
+            middle_glow = pygame.Surface((cls.glow_width, cls.glow_height), pygame.SRCALPHA)
             pygame.draw.circle(middle_glow, (*glow_color, alpha // 2),
-                             (self.glow_width // 2, self.glow_height // 2),
-                             self.glow_width // 3)
+                             (cls.glow_width // 2, cls.glow_height // 2),
+                             cls.glow_width // 3)
             frame.blit(middle_glow, (0, 0))
 
             # Inner glow (smallest, most opaque)
-            inner_glow = pygame.Surface((self.glow_width, self.glow_height), pygame.SRCALPHA)
+            inner_glow = pygame.Surface((cls.glow_width, cls.glow_height), pygame.SRCALPHA)
             pygame.draw.circle(inner_glow, (*glow_color, alpha),
-                             (self.glow_width // 2, self.glow_height // 2),
-                             self.width // 2 + 5)
+                             (cls.glow_width // 2, cls.glow_height // 2),
+                             cls.width // 2 + 5)
             frame.blit(inner_glow, (0, 0))
 
             # Draw the solid arepa in the center
-            arepa_x = (self.glow_width - self.width) // 2
-            arepa_y = (self.glow_height - self.height) // 2
-            frame.blit(self.base_image, (arepa_x, arepa_y))
+            arepa_x = (cls.glow_width - cls.width) // 2
+            arepa_y = (cls.glow_height - cls.height) // 2
+            frame.blit(base_image, (arepa_x, arepa_y))
 
-            self.glow_frames.append(frame)
+            glow_frames.append(frame)
 
-        # Set initial image to first glow frame
-        self.image = self.glow_frames[0]
+        return glow_frames
 
     def update(self):
         """
@@ -199,3 +212,16 @@ class GoldenArepa(pygame.sprite.Sprite):
             self.glow_frame = (self.glow_frame + 1) % 6
             # Update the image to the current glow frame
             self.image = self.glow_frames[self.glow_frame]
+
+    def get_x_range(self):
+        """
+        Get the horizontal range the power-up stays in, for camera culling.
+        It only ever moves vertically (floating or falling).
+
+        Returns:
+            tuple: (left, right) world x coordinates
+        """
+        return (self.rect.left, self.rect.right)
+
+
+shared_frames.register("golden_arepa", GoldenArepa._create_glow_frames)
@@ -5,14 +5,22 @@ Now designed as a DBZ-style green energy ball (Ki blast).
 import pygame
 import math
 from config import LASER_SPEED, WINDOW_WIDTH
+from src.optimization import shared_frames, PooledSprite
 
 
-class Laser(pygame.sprite.Sprite):
+class Laser(PooledSprite):
     """
     Energy ball projectile (DBZ-style green Ki blast) that travels horizontally.
     Fired by the player when powered up.
     """
 
+    # Energy ball size (larger than old laser)
+    size = 16  # Radius of energy ball
+    width = size * 2
+    height = size * 2
+    animation_speed = 4  # Change animation every 4 frames
+    speed = LASER_SPEED
+
     def __init__(self, x, y, direction):
         """
         Initialize an energy ball projectile.
@@ -24,19 +32,24 @@ class Laser(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        # Energy ball size (larger than old laser)
-        self.size = 16  # Radius of energy ball
-        self.width = self.size * 2
-        self.height = self.size * 2
+        # Energy ball frames are drawn once and shared by every shot
+        self.energy_frames = shared_frames.get("laser")
+
+        self.reset(x, y, direction)
+
+    def reset(self, x, y, direction):
+        """
+        Put the energy ball in its just-fired state (also used when it is reused from a pool).
 
+        Args:
+            x: Starting x position (center of energy ball)
+            y: Starting y position (center of energy ball)
+            direction: Direction to travel (1 for right, -1 for left)
+        """
         # Animation properties
         self.animation_frame = 0
-        self.animation_speed = 4  # Change animation every 4 frames
         self.animation_timer = 0
 
-        # Generate energy ball frames
-        self.energy_frames = self._generate_energy_ball_frames()
-
         # Set initial image
         self.image = self.energy_frames[0]
 
@@ -46,9 +59,9 @@ class Laser(pygame.sprite.Sprite):
 
         # Movement properties
         self.direction = direction  # 1 = right, -1 = left
-        self.speed = LASER_SPEED
 
-    def _generate_energy_ball_frames(self):
+    @classmethod
+    def _generate_energy_ball_frames(cls):
         """
         Generate DBZ-style green energy ball animation frames.
         Creates a pulsing energy sphere with glow and crackling energy.
@@ -61,7 +74,7 @@ class Laser(pygame.sprite.Sprite):
         # Generate 4 frames for pulsing animation
         for frame_num in range(4):
             # Create surface with transparency
-            surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            surface = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
             surface.fill((0, 0, 0, 0))  # Transparent background
 
             # Animation phase for pulsing effect
@@ -75,27 +88,27 @@ class Laser(pygame.sprite.Sprite):
                 (0, 220, 0, 200),      # Deep green core
             ]
 
-            center_x = self.width // 2
-            center_y = self.height // 2
+            center_x = cls.width // 2
+            center_y = cls.height // 2
 
             # Pulsing size variation
             pulse = math.sin(phase * math.pi * 2) * 2 + 2
 
             # Draw multiple layers of energy glow (from outer to inner)
             for layer in range(len(energy_colors)):
-                radius = self.size - layer * 3 + int(pulse)
+                radius = cls.size - layer * 3 + int(pulse)
                 if radius > 0:
                     color = energy_colors[layer]
 
                     # Create glow surface
-                    glow_surf = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                    glow_surf = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
                     pygame.draw.circle(glow_surf, color, (center_x, center_y), radius)
 
                     # Blit to main surface
                     surface.blit(glow_surf, (0, 0))
 
             # Draw bright core
-            core_radius = max(1, int(self.size * 0.4 + pulse * 0.5))
+            core_radius = max(1, int(cls.size * 0.4 + pulse * 0.5))
             pygame.draw.circle(surface, (200, 255, 200, 255),
                              (center_x, center_y), core_radius)
 
@@ -103,7 +116,7 @@ class Laser(pygame.sprite.Sprite):
             num_sparks = 6
             for i in range(num_sparks):
                 angle = (i / num_sparks) * math.pi * 2 + phase * math.pi * 3
-                spark_dist = self.size * 0.7
+                spark_dist = cls.size * 0.7
                 spark_x = center_x + int(math.cos(angle) * spark_dist)
                 spark_y = center_y + int(math.sin(angle) * spark_dist)
 
@@ -137,3 +150,6 @@ class Laser(pygame.sprite.Sprite):
         max_width = level_width if level_width else 10000
         if self.rect.right < -100 or self.rect.left > max_width + 100:
             self.kill()  # Remove from sprite groups
+
+
+shared_frames.register("laser", Laser._generate_energy_ball_frames)
@@ -5,14 +5,18 @@ Damages player on contact
 
 import pygame
 import math
+from src.optimization import shared_frames, PooledSprite
 
 
-class Mermelada(pygame.sprite.Sprite):
+class Mermelada(PooledSprite):
     """
     Purple mermelada projectile thrown by boss
     Shoots in any direction (angle-based for circular patterns)
     """
 
+    width = 20
+    height = 20
+
     def __init__(self, x, y, angle):
         """
         Initialize mermelada projectile
@@ -24,23 +28,20 @@ class Mermelada(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        # Create purple mermelada sprite
-        self.width = 20
-        self.height = 20
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Purple mermelada sprite, drawn once and shared by every projectile
+        self.image = shared_frames.get("mermelada")
 
-        # Draw purple mermelada blob
-        purple = (150, 50, 150)
-        purple_dark = (100, 30, 100)
-        purple_light = (180, 80, 180)
+        self.reset(x, y, angle)
 
-        # Main blob
-        pygame.draw.circle(self.image, purple, (10, 10), 10)
-        # Highlight
-        pygame.draw.circle(self.image, purple_light, (7, 7), 3)
-        # Dark spot
-        pygame.draw.circle(self.image, purple_dark, (13, 13), 2)
+    def reset(self, x, y, angle):
+        """
+        Put the mermelada in its just-thrown state (also used when it is reused from a pool).
 
+        Args:
+            x: Starting x position
+            y: Starting y position
+            angle: Angle in radians (for circular pattern shooting)
+        """
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
 
@@ -50,8 +51,29 @@ class Mermelada(pygame.sprite.Sprite):
         self.vel_y = math.sin(angle) * speed
         self.gravity = 0  # No gravity for arcade-style straight shots
 
-        # Lifetime
-        self.alive = True
+    @classmethod
+    def _create_image(cls):
+        """
+        Draw the purple mermelada blob.
+
+        Returns:
+            pygame.Surface: Mermelada sprite
+        """
+        image = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
+
+        # Draw purple mermelada blob
+        purple = (150, 50, 150)
+        purple_dark = (100, 30, 100)
+        purple_light = (180, 80, 180)
+
+        # Main blob
+        pygame.draw.circle(image, purple, (10, 10), 10)
+        # Highlight
+        pygame.draw.circle(image, purple_light, (7, 7), 3)
+        # Dark spot
+        pygame.draw.circle(image, purple_dark, (13, 13), 2)
+
+        return image
 
     def update(self, level_width):
         """
@@ -69,3 +91,6 @@ class Mermelada(pygame.sprite.Sprite):
             self.kill()
         if self.rect.right < -100 or self.rect.left > level_width + 100:
             self.kill()
+
+
+shared_frames.register("mermelada", Mermelada._create_image)
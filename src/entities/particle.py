@@ -5,14 +5,18 @@ Handles visual effects like stomping particles and powerup collection particles
 import pygame
 import random
 from config import YELLOW, RED, GOLD
+from src.optimization import PooledSprite
 
 
-class Particle(pygame.sprite.Sprite):
+class Particle(PooledSprite):
     """
     Individual particle sprite
     Used for visual effects like enemy stomp impacts
     """
 
+    MAX_SIZE = 6  # Largest particle, in pixels
+    COLORKEY = (255, 0, 255)  # Transparent color of the unused part of the surface
+
     def __init__(self, x, y, color, velocity_x, velocity_y, lifetime=25):
         """
         Initialize a particle
@@ -26,16 +30,34 @@ class Particle(pygame.sprite.Sprite):
             lifetime (int): Number of frames before particle disappears
         """
         super().__init__()
+        # One surface for every size the particle takes - only the top-left size x size
+        # square is colored, the rest is the colorkey, so reuse never allocates a surface
+        self.image = pygame.Surface((self.MAX_SIZE, self.MAX_SIZE))
+        self.image.set_colorkey(self.COLORKEY)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, color, velocity_x, velocity_y, lifetime)
+
+    def reset(self, x, y, color, velocity_x, velocity_y, lifetime=25):
+        """
+        Put the particle in its just-spawned state (also used when it is reused from a pool).
+        The particle's surface and rect are reused, nothing is allocated.
 
+        Args:
+            x (int): Starting x position
+            y (int): Starting y position
+            color (tuple): RGB color of the particle
+            velocity_x (float): Horizontal velocity in pixels per frame
+            velocity_y (float): Vertical velocity in pixels per frame
+            lifetime (int): Number of frames before particle disappears
+        """
         # Particle dimensions (small square)
-        self.size = random.randint(3, 6)  # Random size between 3-6 pixels
+        self.size = random.randint(3, self.MAX_SIZE)  # Random size between 3-6 pixels
 
-        # Create particle surface
-        self.image = pygame.Surface((self.size, self.size))
-        self.image.fill(color)
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        # Color the particle's square of the surface (and clear the fade of a reused one)
+        self.image.set_alpha(None)
+        self.image.fill(self.COLORKEY)
+        self.image.fill(color, (0, 0, self.size, self.size))
+        self.rect.update(x, y, self.size, self.size)
 
         # Movement properties
         self.velocity_x = velocity_x
@@ -81,7 +103,7 @@ class ParticleSystem:
     """
 
     @staticmethod
-    def create_stomp_particles(x, y, particle_group):
+    def create_stomp_particles(x, y, particle_group, pool=None):
         """
         Create particles for enemy stomp effect (US-058)
         Spawns 5-10 small particles that spread outward from impact point
@@ -90,6 +112,7 @@ class ParticleSystem:
             x (int): X position of stomp impact (center of enemy)
             y (int): Y position of stomp impact (top of enemy)
             particle_group (pygame.sprite.Group): Group to add particles to
+            pool (ObjectPool): Optional pool of Particle objects to take the particles from
         """
         num_particles = random.randint(5, 10)  # Random number of particles
 
@@ -115,12 +138,15 @@ class ParticleSystem:
             # Random lifetime between 20-30 frames (~0.33-0.5 seconds at 60 FPS)
             lifetime = random.randint(20, 30)
 
-            # Create particle and add to group
-            particle = Particle(x, y, color, velocity_x, velocity_y, lifetime)
+            # Create (or reuse) particle and add to group
+            if pool is not None:
+                particle = pool.acquire(x, y, color, velocity_x, velocity_y, lifetime)
+            else:
+                particle = Particle(x, y, color, velocity_x, velocity_y, lifetime)
             particle_group.add(particle)
 
     @staticmethod
-    def create_powerup_particles(x, y, particle_group):
+    def create_powerup_particles(x, y, particle_group, pool=None):
         """
         Create particles for powerup collection effect (US-059)
         Spawns golden/yellow particles that float upward
@@ -129,6 +155,7 @@ class ParticleSystem:
             x (int): X position of powerup (center)
             y (int): Y position of powerup (center)
             particle_group (pygame.sprite.Group): Group to add particles to
+            pool (ObjectPool): Optional pool of Particle objects to take the particles from
         """
         num_particles = random.randint(8, 12)  # More particles for powerup effect
 
@@ -153,6 +180,9 @@ class ParticleSystem:
             # Random lifetime between 25-35 frames (~0.4-0.6 seconds at 60 FPS)
             lifetime = random.randint(25, 35)
 
-            # Create particle and add to group
-            particle = Particle(x, y, color, velocity_x, velocity_y, lifetime)
+            # Create (or reuse) particle and add to group
+            if pool is not None:
+                particle = pool.acquire(x, y, color, velocity_x, velocity_y, lifetime)
+            else:
+                particle = Particle(x, y, color, velocity_x, velocity_y, lifetime)
             particle_group.add(particle)
@@ -12,11 +12,16 @@ from config import (
     KNOCKBACK_DISTANCE, KNOCKBACK_BOUNCE, POWERUP_DURATION, GOLD,
     LASER_COOLDOWN
 )
+from src.optimization import query_platforms
 
 
 class Player(pygame.sprite.Sprite):
     """Player character class for Coffee"""
 
+    # Class-level animation frame atlas shared by every Player instance (US-063)
+    # Built on first use, maps (animation, facing_direction) to a list of frames
+    _frame_atlas = None
+
     def __init__(self, x, y, audio_manager=None):
         """
         Initialize the player
@@ -37,11 +42,13 @@ class Player(pygame.sprite.Sprite):
         self.height = 60
 
         # Animation system (US-048, US-049, US-050, US-051)
-        self.walk_frames = self._generate_walk_frames()  # 6 frames for walk cycle
-        self.jump_frame = self._generate_jump_frame()  # Frame for ascending (US-049)
-        self.fall_frame = self._generate_fall_frame()  # Frame for descending (US-049)
-        self.idle_frames = self._generate_idle_frames()  # 4 frames for idle animation (US-050)
-        self.shoot_frames = self._generate_shoot_frames()  # 4 frames for shooting animation (US-051)
+        # Frames come from the shared atlas, so they are only drawn once per process
+        self.frame_atlas = self._load_frame_atlas()
+        self.walk_frames = self.frame_atlas[("walk", 1)]  # 6 frames for walk cycle
+        self.jump_frame = self.frame_atlas[("jump", 1)][0]  # Frame for ascending (US-049)
+        self.fall_frame = self.frame_atlas[("fall", 1)][0]  # Frame for descending (US-049)
+        self.idle_frames = self.frame_atlas[("idle", 1)]  # 4 frames for idle animation (US-050)
+        self.shoot_frames = self.frame_atlas[("shoot", 1)]  # 4 frames for shooting animation (US-051)
         self.current_frame = 0  # Current animation frame index
         self.animation_timer = 0  # Timer for frame cycling
         self.animation_speed = 6  # Frames to display each animation frame (60 FPS / 6 = 10 FPS animation)
@@ -52,7 +59,7 @@ class Player(pygame.sprite.Sprite):
         self.shoot_animation_timer = 0  # Timer for shooting animation duration (frames)
 
         # Create player surface (start with idle animation frame 0)
-        self.image = self.idle_frames[0].copy()
+        self.image = self.idle_frames[0]
 
         # Get rect for positioning
         self.rect = self.image.get_rect()
@@ -73,7 +80,7 @@ class Player(pygame.sprite.Sprite):
         self.visible = True  # Used for blinking effect
 
         # Store original image for blinking effect
-        self.original_image = self.image.copy()
+        self.original_image = self.image
 
         # Powered-up state (US-017)
         self.is_powered_up = False  # True when player has collected a power-up
@@ -84,11 +91,59 @@ class Player(pygame.sprite.Sprite):
         self.shoot_cooldown = 0  # Frames until can shoot again
 
         # Super Saiyan aura effect (DBZ-style)
-        self.aura_frames = []  # List of aura animation frames
+        self.aura_frames = self.frame_atlas[("aura", 1)]  # List of aura animation frames
         self.aura_frame_index = 0  # Current aura frame
         self.aura_animation_timer = 0  # Timer for aura animation
         self.aura_animation_speed = 3  # Change aura frame every 3 game frames
-        self._generate_aura_frames()  # Generate aura animation
+
+    def _load_frame_atlas(self):
+        """
+        Get the shared animation frame atlas, building it on first use (US-063).
+
+        Returns:
+            dict: Atlas mapping (animation, facing_direction) to a list of frames
+        """
+        if Player._frame_atlas is None:
+            Player._frame_atlas = self._build_frame_atlas()
+        return Player._frame_atlas
+
+    def _build_frame_atlas(self):
+        """
+        Render every player frame variant once (US-063).
+
+        Animations are stored for both facing directions (left-facing frames are
+        pre-flipped). The powered-up look is drawn as a separate aura, so normal and
+        powered states share the same character frames.
+
+        Returns:
+            dict: Atlas mapping (animation, facing_direction) to a list of frames
+        """
+        right_facing = {
+            "walk": self._generate_walk_frames(),
+            "jump": [self._generate_jump_frame()],
+            "fall": [self._generate_fall_frame()],
+            "idle": self._generate_idle_frames(),
+            "shoot": self._generate_shoot_frames(),
+        }
+
+        atlas = {}
+        for animation, frames in right_facing.items():
+            atlas[(animation, 1)] = frames
+            atlas[(animation, -1)] = [pygame.transform.flip(frame, True, False) for frame in frames]
+
+        # Semi-transparent "invisible" frame for the invulnerability blink
+        blink_frame = pygame.Surface((self.width, self.height))
+        blink_frame.set_alpha(100)
+        blink_frame.fill(YELLOW)
+        atlas[("blink", 1)] = [blink_frame]
+        atlas[("blink", -1)] = [blink_frame]
+
+        # Aura is symmetric, both directions share the same frames
+        self._generate_aura_frames()
+        atlas[("aura", 1)] = self.aura_frames
+        atlas[("aura", -1)] = self.aura_frames
+
+        return atlas
 
     def _generate_walk_frames(self):
         """
@@ -661,6 +716,25 @@ class Player(pygame.sprite.Sprite):
 
         return (aura_x, aura_y)
 
+    def draw_behind(self, surface, offset_x, offset_y):
+        """
+        Draw the aura behind the player when powered up (renderer draw hook).
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            offset_x (int): Offset from world to screen x (camera and interpolation shift)
+            offset_y (int): Offset from world to screen y (interpolation shift)
+
+        Returns:
+            pygame.Rect: Area drawn, or None if there is no aura
+        """
+        aura_surface = self.get_aura_surface()
+        if aura_surface is None:
+            return None
+
+        aura_x, aura_y = self.get_aura_position()
+        return surface.blit(aura_surface, (aura_x + offset_x, aura_y + offset_y))
+
     def take_damage(self, knockback_direction=0):
         """
         Handle player taking damage from an enemy
@@ -752,39 +826,26 @@ class Player(pygame.sprite.Sprite):
         """
         Update player visual appearance based on current state (US-018, US-048-051).
 
-        Regenerates all animation frames with current powered-up state.
-        Adds golden border when powered up, removes it when normal.
+        Picks the current frame from the shared atlas instead of redrawing it, so it
+        is cheap enough to call every frame during the powerup expiry warning.
         Handles state transitions between all animation types.
         """
-        # Regenerate animation frames with current powered-up state (US-048, US-049, US-050, US-051)
-        self.walk_frames = self._generate_walk_frames()
-        self.jump_frame = self._generate_jump_frame()
-        self.fall_frame = self._generate_fall_frame()
-        self.idle_frames = self._generate_idle_frames()
-        self.shoot_frames = self._generate_shoot_frames()
-
         # Reset current_frame to prevent index out of bounds errors
         # Different animation states have different frame counts
         self.current_frame = 0
 
-        # Set current image based on animation state
+        # Set current image based on animation state (cached surface, facing direction aware)
         if not self.is_grounded:
             # In air - use jump/fall animation (US-049)
             if self.velocity_y < 0:
-                self.image = self.jump_frame.copy()  # Ascending
+                self.image = self.frame_atlas[("jump", self.facing_direction)][0]  # Ascending
             else:
-                self.image = self.fall_frame.copy()  # Descending
+                self.image = self.frame_atlas[("fall", self.facing_direction)][0]  # Descending
         elif self.is_walking:
-            # Safety check for walking frames
-            if self.current_frame >= len(self.walk_frames):
-                self.current_frame = 0
-            self.image = self.walk_frames[self.current_frame].copy()
+            self.image = self.frame_atlas[("walk", self.facing_direction)][self.current_frame]
         else:
             # Idle - use idle animation (US-050)
-            # Safety check for idle frames
-            if self.current_frame >= len(self.idle_frames):
-                self.current_frame = 0
-            self.image = self.idle_frames[self.current_frame].copy()
+            self.image = self.frame_atlas[("idle", self.facing_direction)][self.current_frame]
 
         # If powered up, add DBZ Super Saiyan aura effect
         if self.is_powered_up:
@@ -793,7 +854,7 @@ class Player(pygame.sprite.Sprite):
             pass
 
         # Update original image for blinking effect
-        self.original_image = self.image.copy()
+        self.original_image = self.image
 
     def update(self, keys_pressed, platforms, level_width=WINDOW_WIDTH):
         """
@@ -802,7 +863,7 @@ class Player(pygame.sprite.Sprite):
 
         Args:
             keys_pressed (tuple): Result from pygame.key.get_pressed()
-            platforms (pygame.sprite.Group): Group of platform sprites for collision detection
+            platforms (pygame.sprite.Group or PlatformIndex): Platforms for collision detection
             level_width (int): Width of the current level (for boundary clamping with camera system)
         """
         # Handle horizontal movement and walking animation (US-048)
@@ -830,8 +891,12 @@ class Player(pygame.sprite.Sprite):
         if self.rect.right > level_width:
             self.rect.right = level_width
 
+        # Only test platforms near the player (US-063 broad phase)
+        # Margin covers the side push below, which never moves the player more than its width
+        nearby_platforms = query_platforms(platforms, self.rect, self.rect.width)
+
         # Check for horizontal collision with platforms (side collision)
-        for platform in platforms:
+        for platform in nearby_platforms:
             if self.rect.colliderect(platform.rect):
                 # Moving right - hit left side of platform
                 if self.rect.right > platform.rect.left and self.rect.centerx < platform.rect.centerx:
@@ -870,7 +935,7 @@ class Player(pygame.sprite.Sprite):
         self.is_grounded = False
 
         # Check for vertical collision with platforms
-        for platform in platforms:
+        for platform in nearby_platforms:
             if self.rect.colliderect(platform.rect):
                 # Falling down - landing on top of platform
                 if self.velocity_y > 0:
@@ -894,18 +959,16 @@ class Player(pygame.sprite.Sprite):
 
                 # Update sprite visibility
                 if self.visible:
-                    self.image = self.original_image.copy()
+                    self.image = self.original_image
                 else:
-                    # Create transparent image for "invisible" blink
-                    self.image = pygame.Surface((self.width, self.height))
-                    self.image.set_alpha(100)  # Semi-transparent
-                    self.image.fill(YELLOW)
+                    # Use cached semi-transparent frame for "invisible" blink
+                    self.image = self.frame_atlas[("blink", self.facing_direction)][0]
 
             # End invulnerability when timer expires
             if self.invulnerability_timer <= 0:
                 self.is_invulnerable = False
                 self.visible = True
-                self.image = self.original_image.copy()
+                self.image = self.original_image
 
         # Handle powered-up timer (US-017, US-018)
         if self.is_powered_up:
@@ -949,6 +1012,7 @@ class Player(pygame.sprite.Sprite):
                 self.animation_timer = 0
 
         # Update animation based on player state (US-048, US-049, US-051)
+        # Frames are shared, pre-flipped atlas surfaces - assigned by reference, never copied (US-063)
         # Priority: shooting animation > jump/fall > walking > idle
         if self.is_shooting:
             # Player is shooting - use shooting animation (US-051)
@@ -957,29 +1021,16 @@ class Player(pygame.sprite.Sprite):
             frame_index = (12 - self.shoot_animation_timer) // 3
             frame_index = min(frame_index, 3)  # Clamp to valid range (0-3)
 
-            self.image = self.shoot_frames[frame_index].copy()
-
-            # Flip sprite horizontally based on facing direction
-            if self.facing_direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
-
-            # Update original image for blinking effect
-            self.original_image = self.image.copy()
+            # Frame already faces the right direction
+            self.image = self.frame_atlas[("shoot", self.facing_direction)][frame_index]
         elif not self.is_grounded:
             # Player is in air - use jump/fall animation (US-049)
             if self.velocity_y < 0:
                 # Ascending (jumping up)
-                self.image = self.jump_frame.copy()
+                self.image = self.frame_atlas[("jump", self.facing_direction)][0]
             else:
                 # Descending (falling down)
-                self.image = self.fall_frame.copy()
-
-            # Flip sprite horizontally based on facing direction
-            if self.facing_direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
-
-            # Update original image for blinking effect
-            self.original_image = self.image.copy()
+                self.image = self.frame_atlas[("fall", self.facing_direction)][0]
         elif self.is_walking:
             # Player is walking on ground - use walking animation (US-048)
             # Increment animation timer
@@ -994,15 +1045,8 @@ class Player(pygame.sprite.Sprite):
             if self.current_frame >= len(self.walk_frames):
                 self.current_frame = 0
 
-            # Update image to current frame
-            self.image = self.walk_frames[self.current_frame].copy()
-
-            # Flip sprite horizontally based on facing direction (US-048)
-            if self.facing_direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
-
-            # Update original image for blinking effect
-            self.original_image = self.image.copy()
+            # Update image to current frame, facing the movement direction (US-048)
+            self.image = self.frame_atlas[("walk", self.facing_direction)][self.current_frame]
         else:
             # Player is idle (not moving, on ground) - use idle animation (US-050)
             # Increment animation timer
@@ -1018,11 +1062,7 @@ class Player(pygame.sprite.Sprite):
                 self.current_frame = 0
 
             # Update image to current idle frame
-            self.image = self.idle_frames[self.current_frame].copy()
+            self.image = self.frame_atlas[("idle", self.facing_direction)][self.current_frame]
 
-            # Flip sprite horizontally based on facing direction
-            if self.facing_direction == -1:
-                self.image = pygame.transform.flip(self.image, True, False)
-
-            # Update original image for blinking effect
-            self.original_image = self.image.copy()
+        # Update original image for blinking effect
+        self.original_image = self.image
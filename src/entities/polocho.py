@@ -4,14 +4,30 @@ Polocho enemy entity for Coffee Bros game.
 import pygame
 import math
 from config import GRAVITY, TERMINAL_VELOCITY, RED, ENEMY_SPEED
+from src.optimization import query_platforms, shared_frames
 
 
 class Polocho(pygame.sprite.Sprite):
     """Enemy sprite class - Polocho enemies patrol and can be stomped."""
 
+    # Enemy appearance - 40x40 pixels, red colored
+    width = 40
+    height = 40
+    animation_speed = 8  # Frames to display each animation frame (60 FPS / 8 = 7.5 FPS animation)
+    speed = ENEMY_SPEED
+
+    # Flyweight frame set shared by every Polocho (US-063), drawn once on first spawn
+    # Maps direction (1 = right, -1 = left, pre-flipped) to the list of walk frames
+    _walk_frame_cache = None
+    walk_frames_by_direction = None
+    walk_frames = None  # Right-facing walk cycle (4 frames)
+    squashed_frame = None  # Shown after a stomp (US-053)
+
     def __init__(self, x, y, patrol_distance=150, audio_manager=None):
         """
         Initialize Polocho enemy.
+        Artwork and constants live on the class, so an enemy only holds its rect
+        and a few counters.
 
         Args:
             x: Initial x position
@@ -23,23 +39,16 @@ class Polocho(pygame.sprite.Sprite):
 
         # Store audio manager reference (US-042)
         self.audio_manager = audio_manager
-        print(f"Polocho initialized with audio_manager: {audio_manager}")
-
-        # Enemy appearance - 40x40 pixels, red colored
-        self.width = 40
-        self.height = 40
 
         # Animation system (US-052)
-        self.walk_frames = self._generate_walk_frames()  # 4 frames for walk cycle
+        if Polocho._walk_frame_cache is None:
+            shared_frames.get("polocho")
         self.current_frame = 0  # Current animation frame index
         self.animation_timer = 0  # Timer for frame cycling
-        self.animation_speed = 8  # Frames to display each animation frame (60 FPS / 8 = 7.5 FPS animation)
 
         # Create enemy surface with first walk frame
-        self.image = self.walk_frames[0].copy()
-        self.rect = self.image.get_rect()
-        self.rect.x = x
-        self.rect.y = y
+        self.image = self.walk_frames[0]
+        self.rect = pygame.Rect(x, y, self.width, self.height)
 
         # Physics properties
         self.velocity_y = 0
@@ -49,13 +58,29 @@ class Polocho(pygame.sprite.Sprite):
         self.patrol_start = x - patrol_distance
         self.patrol_end = x + patrol_distance
         self.direction = 1  # 1 for right, -1 for left
-        self.speed = ENEMY_SPEED
 
         # Squashed state for stomp mechanic
         self.is_squashed = False
         self.squash_timer = 0  # Frames remaining in squashed state
 
-    def _generate_walk_frames(self):
+    @classmethod
+    def _load_frames(cls):
+        """
+        Draw the shared walk frames for both directions and the squashed frame (US-063).
+
+        Returns:
+            dict: Maps direction (1 or -1) to a list of 4 walk frames
+        """
+        right_frames = cls._generate_walk_frames()
+        left_frames = [pygame.transform.flip(frame, True, False) for frame in right_frames]
+        Polocho._walk_frame_cache = {1: right_frames, -1: left_frames}
+        Polocho.walk_frames_by_direction = Polocho._walk_frame_cache
+        Polocho.walk_frames = right_frames
+        Polocho.squashed_frame = cls._generate_squashed_frame()
+        return Polocho._walk_frame_cache
+
+    @classmethod
+    def _generate_walk_frames(cls):
         """
         Generate 4 walking animation frames for Polocho enemy (US-052)
         Creates an evil, menacing creature with horns, sharp features, and glowing eyes
@@ -67,7 +92,7 @@ class Polocho(pygame.sprite.Sprite):
 
         for i in range(4):
             # Create a new surface with transparency
-            frame = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            frame = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
             frame.fill((0, 0, 0, 0))  # Transparent background
 
             # Calculate leg positions based on frame number
@@ -86,56 +111,56 @@ class Polocho(pygame.sprite.Sprite):
             leg_height = 12
 
             # Left leg
-            left_leg_x = self.width // 2 - 8 + int(leg_offset)
-            left_leg_y = self.height - leg_height
+            left_leg_x = cls.width // 2 - 8 + int(leg_offset)
+            left_leg_y = cls.height - leg_height
             pygame.draw.rect(frame, blood_red, (left_leg_x, left_leg_y, leg_width, leg_height))
             # Left claw (small triangle at bottom)
             pygame.draw.polygon(frame, black, [
-                (left_leg_x - 2, self.height),
-                (left_leg_x + leg_width // 2, self.height - 3),
-                (left_leg_x, self.height)
+                (left_leg_x - 2, cls.height),
+                (left_leg_x + leg_width // 2, cls.height - 3),
+                (left_leg_x, cls.height)
             ])
 
             # Right leg (opposite phase)
-            right_leg_x = self.width // 2 + 2 - int(leg_offset)
-            right_leg_y = self.height - leg_height
+            right_leg_x = cls.width // 2 + 2 - int(leg_offset)
+            right_leg_y = cls.height - leg_height
             pygame.draw.rect(frame, blood_red, (right_leg_x, right_leg_y, leg_width, leg_height))
             # Right claw
             pygame.draw.polygon(frame, black, [
-                (right_leg_x + leg_width, self.height),
-                (right_leg_x + leg_width // 2, self.height - 3),
-                (right_leg_x + leg_width + 2, self.height)
+                (right_leg_x + leg_width, cls.height),
+                (right_leg_x + leg_width // 2, cls.height - 3),
+                (right_leg_x + leg_width + 2, cls.height)
             ])
 
             # Draw body (menacing ellipse shape)
-            body_rect = pygame.Rect(4, 4, self.width - 8, self.height - 16)
+            body_rect = pygame.Rect(4, 4, cls.width - 8, cls.height - 16)
             pygame.draw.ellipse(frame, evil_red, body_rect)
 
             # Draw darker inner shadow for depth
-            inner_shadow_rect = pygame.Rect(6, 6, self.width - 12, self.height - 20)
+            inner_shadow_rect = pygame.Rect(6, 6, cls.width - 12, cls.height - 20)
             pygame.draw.ellipse(frame, dark_red, inner_shadow_rect)
 
             # Draw evil horns on top of head
             horn_color = black
             # Left horn
             left_horn_points = [
-                (self.width // 2 - 8, 8),  # Base
-                (self.width // 2 - 10, 2),  # Tip
-                (self.width // 2 - 6, 6)   # Inner point
+                (cls.width // 2 - 8, 8),  # Base
+                (cls.width // 2 - 10, 2),  # Tip
+                (cls.width // 2 - 6, 6)   # Inner point
             ]
             pygame.draw.polygon(frame, horn_color, left_horn_points)
 
             # Right horn
             right_horn_points = [
-                (self.width // 2 + 8, 8),  # Base
-                (self.width // 2 + 10, 2),  # Tip
-                (self.width // 2 + 6, 6)   # Inner point
+                (cls.width // 2 + 8, 8),  # Base
+                (cls.width // 2 + 10, 2),  # Tip
+                (cls.width // 2 + 6, 6)   # Inner point
             ]
             pygame.draw.polygon(frame, horn_color, right_horn_points)
 
             # Draw menacing glowing eyes (larger, evil looking)
-            left_eye_pos = (self.width // 2 - 7, self.height // 3)
-            right_eye_pos = (self.width // 2 + 7, self.height // 3)
+            left_eye_pos = (cls.width // 2 - 7, cls.height // 3)
+            right_eye_pos = (cls.width // 2 + 7, cls.height // 3)
 
             # Outer glow
             pygame.draw.circle(frame, evil_glow, left_eye_pos, 5)
@@ -146,27 +171,28 @@ class Polocho(pygame.sprite.Sprite):
             pygame.draw.ellipse(frame, black, (right_eye_pos[0] - 1, right_eye_pos[1] - 3, 2, 6))
 
             # Draw evil fanged mouth (jagged teeth)
-            mouth_y = self.height // 2 + 2
+            mouth_y = cls.height // 2 + 2
             pygame.draw.line(frame, black,
-                           (self.width // 2 - 6, mouth_y),
-                           (self.width // 2 + 6, mouth_y), 2)
+                           (cls.width // 2 - 6, mouth_y),
+                           (cls.width // 2 + 6, mouth_y), 2)
             # Fangs (small triangles)
             pygame.draw.polygon(frame, (255, 255, 255), [
-                (self.width // 2 - 4, mouth_y),
-                (self.width // 2 - 3, mouth_y + 3),
-                (self.width // 2 - 2, mouth_y)
+                (cls.width // 2 - 4, mouth_y),
+                (cls.width // 2 - 3, mouth_y + 3),
+                (cls.width // 2 - 2, mouth_y)
             ])
             pygame.draw.polygon(frame, (255, 255, 255), [
-                (self.width // 2 + 2, mouth_y),
-                (self.width // 2 + 3, mouth_y + 3),
-                (self.width // 2 + 4, mouth_y)
+                (cls.width // 2 + 2, mouth_y),
+                (cls.width // 2 + 3, mouth_y + 3),
+                (cls.width // 2 + 4, mouth_y)
             ])
 
             frames.append(frame)
 
         return frames
 
-    def _generate_squashed_frame(self):
+    @classmethod
+    def _generate_squashed_frame(cls):
         """
         Generate squashed animation frame for defeated enemy (US-053)
         Creates a flattened/compressed sprite showing clear defeat
@@ -175,8 +201,8 @@ class Polocho(pygame.sprite.Sprite):
             pygame.Surface: Squashed sprite frame
         """
         # Squashed dimensions - reduce height significantly, increase width
-        squashed_width = int(self.width * 1.5)  # 50% wider
-        squashed_height = int(self.height * 0.25)  # 25% of original height (very flat)
+        squashed_width = int(cls.width * 1.5)  # 50% wider
+        squashed_height = int(cls.height * 0.25)  # 25% of original height (very flat)
 
         # Create squashed frame surface with transparency
         frame = pygame.Surface((squashed_width, squashed_height), pygame.SRCALPHA)
@@ -235,8 +261,8 @@ class Polocho(pygame.sprite.Sprite):
             old_centerx = self.rect.centerx
             old_bottom = self.rect.bottom
 
-            # Generate and apply squashed sprite
-            self.image = self._generate_squashed_frame()
+            # Apply the shared squashed sprite
+            self.image = self.squashed_frame
             self.rect = self.image.get_rect()
             self.rect.bottom = old_bottom  # Keep bottom position same
             self.rect.centerx = old_centerx  # Keep horizontal center
@@ -245,12 +271,23 @@ class Polocho(pygame.sprite.Sprite):
             if self.audio_manager:
                 self.audio_manager.play_stomp()
 
+    def get_x_range(self):
+        """
+        Get the horizontal range the enemy stays in, for camera culling.
+        It patrols between its patrol bounds; squashed, it is wider around its center.
+
+        Returns:
+            tuple: (left, right) world x coordinates
+        """
+        spread = (self.squashed_frame.get_width() - self.width) // 2 + 1
+        return (min(self.patrol_start, self.rect.left) - spread, max(self.patrol_end, self.rect.right) + spread)
+
     def update(self, platforms):
         """
         Update enemy physics, patrol movement, and collision.
 
         Args:
-            platforms: Sprite group containing platform objects
+            platforms: Sprite group or PlatformIndex containing platform objects
         """
         # If squashed, count down timer and kill when done
         if self.is_squashed:
@@ -270,15 +307,20 @@ class Polocho(pygame.sprite.Sprite):
             self.rect.right = self.patrol_end
             self.direction = -1  # Turn left
 
+        # Only test platforms near the enemy (US-063 broad phase)
+        # Margin covers the edge look-ahead and the wall push-back below
+        look_ahead = self.speed * 5
+        nearby_platforms = query_platforms(platforms, self.rect, self.rect.width + look_ahead)
+
         # Check for platform edges (don't walk off platforms)
         if self.is_grounded:
             # Check if there's no ground ahead by looking for platform underneath future position
-            future_x = self.rect.x + (self.speed * self.direction * 5)  # Look ahead
+            future_x = self.rect.x + (look_ahead * self.direction)  # Look ahead
             future_rect = pygame.Rect(future_x, self.rect.bottom, self.width, 1)
 
             # Check if any platform is under the future position
             has_ground_ahead = False
-            for platform in platforms:
+            for platform in nearby_platforms:
                 if future_rect.colliderect(platform.rect):
                     has_ground_ahead = True
                     break
@@ -288,7 +330,7 @@ class Polocho(pygame.sprite.Sprite):
                 self.direction *= -1
 
         # Check for horizontal wall collisions
-        for platform in platforms:
+        for platform in nearby_platforms:
             if self.rect.colliderect(platform.rect):
                 # Check if we hit a vertical wall (side collision)
                 if self.direction > 0 and self.rect.right > platform.rect.left and self.rect.left < platform.rect.left:
@@ -310,7 +352,7 @@ class Polocho(pygame.sprite.Sprite):
 
         # Check for platform collisions (vertical)
         self.is_grounded = False
-        for platform in platforms:
+        for platform in nearby_platforms:
             if self.rect.colliderect(platform.rect):
                 # Landing on top of platform
                 if self.velocity_y > 0 and self.rect.bottom <= platform.rect.bottom:
@@ -335,11 +377,10 @@ class Polocho(pygame.sprite.Sprite):
         if self.current_frame >= len(self.walk_frames):
             self.current_frame = 0
 
-        # Update image to current frame
-        self.image = self.walk_frames[self.current_frame].copy()
+        # Update image to current frame, facing the movement direction (US-052)
+        # direction = 1 means moving right, direction = -1 uses the pre-flipped frames
+        # Shared frames are assigned by reference, never copied (US-063)
+        self.image = self.walk_frames_by_direction[self.direction][self.current_frame]
+
 
-        # Flip sprite horizontally based on movement direction (US-052)
-        # direction = 1 means moving right (no flip)
-        # direction = -1 means moving left (flip horizontally)
-        if self.direction == -1:
-            self.image = pygame.transform.flip(self.image, True, False)
+shared_frames.register("polocho", Polocho._load_frames)
@@ -0,0 +1,572 @@
+"""
+Game session for Coffee Bros.
+Holds the gameplay state from main.py (level, entities, score, progression flags)
+and advances it in fixed simulation steps, independent of rendering.
+"""
+
+import random
+import pygame
+from config import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, FPS, STOMP_SCORE, DEATH_DELAY, POWERUP_SCORE,
+    LEVEL_COMPLETE_DELAY
+)
+from src.entities import GoldenArepa, Laser, Mermelada
+from src.entities.particle import Particle, ParticleSystem
+from src.level import Level
+from src.level_name_display import LevelNameDisplay
+from src.level_preload import LevelPreloader
+from src.optimization import SpatialGrid, ObjectPool, optimize_collision_detection, limit_particle_count
+from src.performance_monitor import NULL_PROFILER
+
+
+class GameSession:
+    """
+    Gameplay state for one play-through.
+
+    Owns the current level, projectile and particle groups, score, camera and the
+    level complete / transition / victory / death flags. update() runs exactly one
+    fixed simulation step (1 / FPS seconds) so main.py can run physics at a steady
+    rate while rendering at whatever rate the display allows.
+    """
+
+    def __init__(self, audio_manager=None, save_manager=None, max_level_number=5, profiler=None):
+        """
+        Initialize an empty game session.
+
+        Args:
+            audio_manager (AudioManager): Optional audio manager for sound effects
+            save_manager (SaveManager): Optional save manager for progress (US-068)
+            max_level_number (int): Last level of the game (US-028)
+            profiler (PerformanceMonitor): Optional monitor timing the physics,
+                collisions and particles sections of each step
+        """
+        self.audio_manager = audio_manager
+        self.save_manager = save_manager
+        self.max_level_number = max_level_number
+        self.profiler = profiler or NULL_PROFILER
+
+        # Score and level progression
+        self.score = 0
+        self.current_level_number = 1
+        self.level = None
+        self.level_start_score = 0  # Score at level start (for transition screen - US-029)
+        self.level_frames = 0  # Simulation steps since level start (for completion time)
+
+        # Death and respawn state
+        self.is_dead = False
+        self.death_timer = 0
+        self.game_over = False  # Set when the player runs out of lives (US-036)
+
+        # Level completion state (US-023)
+        self.is_level_complete = False
+        self.completion_timer = 0
+        self.completion_time = 0  # Time taken to complete level (in seconds)
+
+        # Level transition state (US-029)
+        self.is_transition_screen = False
+        self.score_earned_in_level = 0  # Score earned specifically in completed level
+        self.preloader = None  # LevelPreloader reading the next level's files during these screens
+
+        # Victory screen state (US-030)
+        self.is_victory_screen = False
+        self.total_game_time = 0  # Total time played across all levels (in seconds)
+
+        # Camera system (US-038, US-039)
+        self.camera_x = 0  # Camera horizontal offset for scrolling
+        self.previous_camera_x = 0  # Camera offset before the last step (for interpolation)
+        self.camera_cut = False  # The camera jumps this step (pit respawn) - don't interpolate it
+
+        # Level name display (US-037)
+        self.level_name_display = None
+
+        # Boss fight power-up spawning (Level 5)
+        self.powerup_spawn_timer = 0  # Timer for spawning power-ups during boss fight
+        self.powerup_spawn_interval = 360  # Spawn every 6 seconds (360 frames at 60 FPS)
+
+        # Projectiles and effects live outside the level
+        self.lasers = pygame.sprite.Group()  # Laser sprite group (US-019)
+        self.particles = pygame.sprite.Group()  # Particle sprite group (US-058)
+        self.mermeladas = pygame.sprite.Group()  # Mermelada sprite group for boss projectiles
+        # Projectiles and particles are recycled through pools - killed sprites go back to
+        # their pool and are reset on the next spawn instead of being reallocated
+        self.laser_pool = ObjectPool(Laser, on_reuse=self._forget_previous_position)
+        self.mermelada_pool = ObjectPool(Mermelada, on_reuse=self._forget_previous_position)
+        self.particle_pool = ObjectPool(Particle, on_reuse=self._forget_previous_position)
+        self.pools = {"lasers": self.laser_pool, "mermeladas": self.mermelada_pool,
+                      "particles": self.particle_pool}
+        # Persistent spatial grid for enemies, powerups, mermeladas and lasers (US-063)
+        # Sprites are only re-bucketed when they cross a cell boundary
+        self.collision_grid = SpatialGrid(cell_size=100)
+
+        # Sprite positions before the last step, used to interpolate rendering
+        self.previous_positions = {}
+
+    # Level entity shortcuts (the level replaces its player on reset)
+    @property
+    def player(self):
+        return self.level.player if self.level else None
+
+    @property
+    def all_sprites(self):
+        return self.level.all_sprites if self.level else None
+
+    @property
+    def platforms(self):
+        return self.level.platforms if self.level else None
+
+    @property
+    def enemies(self):
+        return self.level.enemies if self.level else None
+
+    @property
+    def powerups(self):
+        return self.level.powerups if self.level else None
+
+    @property
+    def goals(self):
+        return self.level.goals if self.level else None
+
+    @property
+    def level_width(self):
+        """Width of the current level in pixels"""
+        return self.level.metadata.get("width", WINDOW_WIDTH)
+
+    def load_level(self, level_number):
+        """
+        Load a level and reset per-level state.
+        Score is left untouched - callers decide whether it carries over.
+
+        Args:
+            level_number (int): Level number to load (US-022)
+
+        Raises:
+            FileNotFoundError: If level file doesn't exist
+            ValueError: If level data is invalid
+        """
+        # Use the next level's files if they were read in the background
+        files = None
+        preloader, self.preloader = self.preloader, None
+        if preloader is not None and preloader.level_number == level_number:
+            files = preloader.result()
+        self.level = Level.load_from_file(level_number, self.audio_manager, files)
+        self.current_level_number = level_number
+        self._reset_level_state()
+
+    def _reset_level_state(self):
+        """Reset the per-level session state for a freshly loaded or reset level."""
+        self._clear_projectiles()
+        # Reset all state flags
+        self.is_dead = False
+        self.game_over = False
+        self.is_level_complete = False
+        self.is_transition_screen = False
+        self.is_victory_screen = False
+        self.death_timer = 0
+        self.completion_timer = 0
+        self.level_frames = 0
+        # Reset camera (US-038)
+        self.camera_x = 0
+        self.previous_camera_x = 0
+        self.previous_positions = {}
+        # Create level name display (US-037)
+        level_number = self.current_level_number
+        level_name = self.level.metadata.get("name", f"Level {level_number}")
+        self.level_name_display = LevelNameDisplay(level_number, level_name)
+
+    def start_new_game(self, level_number=1):
+        """
+        Start a new game from the given level with a fresh score.
+
+        Args:
+            level_number (int): Level to start from (1 unless DEBUG_START_LEVEL is set)
+        """
+        self.score = 0
+        self.total_game_time = 0
+        self.level_start_score = 0
+        self.load_level(level_number)
+
+    def restart_level(self):
+        """
+        Restart the current level from the pause menu (score is kept).
+        The loaded level is reset in place rather than reloaded from its file.
+        """
+        self.level.reset_level()
+        self._reset_level_state()
+
+    def retry_level(self):
+        """Retry the current level after game over (score resets - US-036)."""
+        self.score = 0
+        self.level_start_score = 0
+        self.level.reset_level()
+        self._reset_level_state()
+
+    def advance_from_transition(self):
+        """
+        Leave the transition screen: load the next level, or show the victory
+        screen after the last level (US-029, US-030).
+
+        Returns:
+            bool: True if a new level was loaded, False if the game was won
+        """
+        if self.current_level_number < self.max_level_number:
+            # Score carries over between levels
+            self.load_level(self.current_level_number + 1)
+            self.level_start_score = self.score  # Record starting score for next level
+            return True
+
+        # No more levels - show victory screen! (US-030)
+        # total_game_time already includes all level times from transition screens
+        self.is_transition_screen = False
+        self.is_victory_screen = True
+        return False
+
+    def is_in_normal_gameplay(self):
+        """True when the player is in control (no death, completion or end screens)."""
+        return (not self.is_level_complete and not self.is_dead and
+                not self.is_transition_screen and not self.is_victory_screen)
+
+    def _clear_projectiles(self):
+        """Remove every laser and mermelada, returning them to their pools."""
+        for projectile in self.lasers.sprites() + self.mermeladas.sprites():
+            projectile.kill()
+
+    def _forget_previous_position(self, sprite):
+        """Drop a reused sprite's position from before this step, so it isn't interpolated from where it died."""
+        self.previous_positions.pop(sprite, None)
+
+    def _store_previous_positions(self):
+        """Remember sprite positions and camera before a step for render interpolation."""
+        positions = {sprite: sprite.rect.topleft for sprite in self.level.all_sprites}
+        for particle in self.particles:
+            positions[particle] = particle.rect.topleft
+        self.previous_positions = positions
+        self.previous_camera_x = self.camera_x
+
+    def update(self, keys):
+        """
+        Advance gameplay by one fixed simulation step.
+
+        Args:
+            keys: Result from pygame.key.get_pressed() (or an equivalent key state)
+        """
+        self._store_previous_positions()
+        self.level_frames += 1
+
+        level = self.level
+        player = self.player
+        level_width = self.level_width
+
+        # Handle continuous shooting when powered up (US-019) - X or J key (only during normal gameplay)
+        if self.is_in_normal_gameplay():
+            if keys[pygame.K_x] or keys[pygame.K_j]:
+                # Shoot unlimited lasers while powered up (no MAX_LASERS limit)
+                laser_info = player.shoot()
+                if laser_info is not None:
+                    x, y, direction = laser_info
+                    laser = self.laser_pool.acquire(x, y, direction)
+                    self.lasers.add(laser)
+                    self.all_sprites.add(laser)
+
+        # Handle level completion state (US-023, US-029)
+        if self.is_level_complete:
+            # Increment completion timer
+            self.completion_timer += 1
+
+            # After LEVEL_COMPLETE_DELAY frames (3 seconds), show transition screen (US-029)
+            if self.completion_timer >= LEVEL_COMPLETE_DELAY:
+                # Transition to transition screen
+                self.is_transition_screen = True
+                self.is_level_complete = False  # Exit level complete state
+                self.completion_timer = 0  # Reset timer for future use
+                # Add level completion time to total game time (US-030)
+                self.total_game_time += self.completion_time
+
+        # Handle death state
+        elif self.is_dead:
+            # Increment death timer
+            self.death_timer += 1
+
+            # Check if it's time to respawn
+            if self.death_timer >= DEATH_DELAY:
+                # Respawn: reset level using Level.reset_level()
+                level.reset_level()
+                self._clear_projectiles()  # Clear all lasers and mermeladas on respawn
+                self.score = 0  # Reset score on respawn
+                self.is_dead = False
+                self.death_timer = 0
+                self.camera_x = 0  # Reset camera (US-038)
+                self.previous_camera_x = 0  # Don't sweep the camera back from where the player died
+                self.previous_positions = {}  # Restored sprites must not interpolate from where they were
+
+        else:
+            self._update_gameplay(keys, level_width)
+
+        self.update_camera()
+        if self.camera_cut:
+            # The player was moved to the spawn point - draw the camera there straight away
+            self.previous_camera_x = self.camera_x
+            self.camera_cut = False
+        # Streamed levels wake up the chunks the camera approaches and freeze far ones
+        self.level.update_streaming(self.camera_x)
+
+    def _update_gameplay(self, keys, level_width):
+        """
+        Normal gameplay step: entity updates, collisions, scoring, boss fight,
+        level completion, pit deaths and game over.
+
+        Args:
+            keys: Current key state
+            level_width (int): Width of the current level
+        """
+        level = self.level
+        player = self.player
+        enemies = self.enemies
+        powerups = self.powerups
+        lasers = self.lasers
+        mermeladas = self.mermeladas
+        particles = self.particles
+        particle_pool = self.particle_pool
+        profiler = self.profiler
+
+        profiler.begin_section("physics")
+
+        # Update level name display if active (US-037)
+        if self.level_name_display and self.level_name_display.is_active:
+            self.level_name_display.update()
+
+        # Update player with current key states, platform collision, and level width (US-038, US-039)
+        # Entities query the level's static platform index instead of every platform (US-063)
+        player.update(keys, level.platform_index, level_width)
+
+        # Update all enemies with platform collision
+        for enemy in enemies:
+            enemy.update(level.platform_index)
+
+        # Update all power-ups (for floating animation)
+        for powerup in powerups:
+            powerup.update()
+
+        # Update all lasers (US-019) - handles movement and off-screen removal
+        for laser in lasers:
+            laser.update(level_width)
+
+        # Update all mermeladas (boss projectiles)
+        for mermelada in mermeladas:
+            mermelada.update(level_width)
+
+        profiler.end_section("physics")
+        profiler.begin_section("particles")
+
+        # Update all particles (US-058) - handles position, fading, and lifetime
+        for particle in particles:
+            particle.update()
+
+        # Limit particle count for performance (US-063)
+        limit_particle_count(particles, max_particles=100)
+
+        profiler.end_section("particles")
+        profiler.begin_section("collisions")
+
+        # Sync collision grid with this frame's positions (US-063)
+        # Drops killed sprites and entities left over from a previous level
+        self.collision_grid.refresh(enemies, powerups, mermeladas, lasers)
+
+        # Check for laser-enemy collisions (US-020) and boss damage
+        for laser in lasers:
+            # Check collision with nearby enemies only (US-063: spatial grid)
+            hit_enemies = optimize_collision_detection(laser, enemies, self.collision_grid)
+            for enemy in hit_enemies:
+                # Check if it's the boss
+                if hasattr(enemy, 'take_damage'):  # Boss has take_damage method
+                    enemy.take_damage(1)  # Boss takes damage
+                    laser.kill()
+                    # Always create particles on hit, even if invulnerable
+                    ParticleSystem.create_stomp_particles(laser.rect.centerx, laser.rect.centery,
+                                                          particles, particle_pool)
+                    # Create additional impact particles for boss hit
+                    for _ in range(5):
+                        ParticleSystem.create_powerup_particles(laser.rect.centerx, laser.rect.centery,
+                                                                particles, particle_pool)
+                    break
+                elif not enemy.is_squashed:  # Regular enemy - Don't collide with already squashed
+                    # Laser hit an enemy!
+                    laser.kill()  # Remove laser from sprite groups
+                    enemy.squash()  # Mark enemy as squashed (will disappear after animation)
+                    self.score += STOMP_SCORE  # Award same points as stomp kill
+                    # Create particle effect at impact point (US-058)
+                    ParticleSystem.create_stomp_particles(enemy.rect.centerx, enemy.rect.top,
+                                                          particles, particle_pool)
+                    break  # One laser can only hit one enemy (exit inner loop)
+
+        # Check for player-enemy collisions
+        # Boss stomp/damage rects lie inside its rect, so grid candidates cover them too
+        for enemy in optimize_collision_detection(player, enemies, self.collision_grid):
+            # Handle boss collision differently
+            if hasattr(enemy, 'take_damage'):  # This is the boss
+                # Check stomp collision with boss
+                if player.velocity_y > 0:  # Player is falling
+                    stomp_rect = enemy.get_stomp_rect()
+                    if player.rect.colliderect(stomp_rect):
+                        # Player stomped the boss!
+                        enemy.take_damage(1)
+                        player.velocity_y = -12  # Big bounce after boss stomp
+                        # Always create particles on stomp
+                        ParticleSystem.create_stomp_particles(enemy.rect.centerx, enemy.rect.top,
+                                                              particles, particle_pool)
+                        # Create extra burst particles for visual feedback
+                        for _ in range(8):
+                            ParticleSystem.create_powerup_particles(enemy.rect.centerx, enemy.rect.top,
+                                                                    particles, particle_pool)
+                # Check if player touches boss (damage)
+                damage_rect = enemy.get_damage_rect()
+                if player.rect.colliderect(damage_rect) and not player.is_invulnerable:
+                    knockback_direction = -1 if player.rect.centerx < enemy.rect.centerx else 1
+                    player.take_damage(knockback_direction)
+            elif player.rect.colliderect(enemy.rect) and not enemy.is_squashed:
+                # Regular enemy collision
+                # Check if player is falling and hitting enemy from above (stomp)
+                if player.velocity_y > 0 and player.rect.bottom < enemy.rect.centery:
+                    # Player stomped the enemy!
+                    if not enemy.is_squashed:  # Only count score once per enemy
+                        enemy.squash()  # Mark as squashed (will disappear after animation)
+                        player.velocity_y = -8  # Small upward bounce after stomp
+                        self.score += STOMP_SCORE  # Increase score
+                        # Create particle effect at stomp point (US-058)
+                        ParticleSystem.create_stomp_particles(enemy.rect.centerx, enemy.rect.top,
+                                                              particles, particle_pool)
+                else:
+                    # Side or bottom collision - player takes damage
+                    # Determine knockback direction based on relative positions
+                    if player.rect.centerx < enemy.rect.centerx:
+                        knockback_direction = -1  # Push player left
+                    else:
+                        knockback_direction = 1  # Push player right
+
+                    player.take_damage(knockback_direction)
+
+        # Check for player-powerup collisions (US-017)
+        for powerup in optimize_collision_detection(player, powerups, self.collision_grid):
+            # Player collected the power-up!
+            player.collect_powerup()  # Enter powered-up state
+            self.score += POWERUP_SCORE  # Increase score
+            # Create particle effect at powerup collection point (US-059)
+            ParticleSystem.create_powerup_particles(powerup.rect.centerx, powerup.rect.centery,
+                                                    particles, particle_pool)
+            powerup.kill()  # Remove from sprite groups (disappears)
+            if self.audio_manager:
+                self.audio_manager.play_powerup()  # US-044: Play powerup collection sound effect
+
+        # Check for player-mermelada collisions (boss projectile damage)
+        for mermelada in optimize_collision_detection(player, mermeladas, self.collision_grid):
+            if not player.is_invulnerable:
+                # Mermelada hit the player!
+                # Determine knockback direction based on mermelada velocity
+                knockback_direction = 1 if mermelada.vel_x > 0 else -1
+                player.take_damage(knockback_direction)
+                # Create particle effect at impact point
+                ParticleSystem.create_stomp_particles(mermelada.rect.centerx, mermelada.rect.centery,
+                                                      particles, particle_pool)
+                mermelada.kill()  # Remove mermelada
+
+        profiler.end_section("collisions")
+
+        # Check for boss defeat (Level 5 only)
+        if level.boss:
+            if level.boss.defeated and not self.is_level_complete:
+                # Boss defeated! Unlock the goal
+                self._complete_level()
+            else:
+                # Boss is still alive - spawn power-ups periodically
+                self.powerup_spawn_timer += 1
+                if self.powerup_spawn_timer >= self.powerup_spawn_interval:
+                    self.powerup_spawn_timer = 0
+                    # Spawn a power-up from the sky at random X position
+                    spawn_x = random.randint(200, level.metadata.get('width', 1600) - 200)
+                    spawn_y = -50  # Start above the screen
+                    new_powerup = GoldenArepa(spawn_x, spawn_y)
+                    new_powerup.platforms = self.platforms  # Set platform reference for collision detection
+                    powerups.add(new_powerup)
+                    self.all_sprites.add(new_powerup)
+
+                # Boss throws mermeladas in circular pattern (arcade-style)
+                mermelada_list = level.boss.throw_mermeladas_circular()
+                if mermelada_list is not None:
+                    for x, y, angle in mermelada_list:
+                        mermelada = self.mermelada_pool.acquire(x, y, angle)
+                        mermeladas.add(mermelada)
+                        self.all_sprites.add(mermelada)
+
+        # Check for level completion (US-023, US-029, US-068)
+        # For level 5, require boss defeat first
+        boss_defeated = level.boss.defeated if level.boss else True
+        for goal in self.goals:
+            if player.rect.colliderect(goal.rect) and boss_defeated:
+                # Player reached the goal - complete the level!
+                if not self.is_level_complete:  # Only trigger once
+                    self._complete_level()
+
+        # Check for pit/fall death (US-015)
+        if player.rect.top > WINDOW_HEIGHT:
+            # Player fell into a pit - lose one life immediately
+            player.lives -= 1
+            # Play fall death sound effect (US-045)
+            if self.audio_manager:
+                self.audio_manager.play_death()
+
+            # If still have lives left, respawn at spawn position
+            if player.lives > 0:
+                level.respawn_player()  # Use Level's respawn method
+                # Draw the player and camera at the spawn point, not interpolated from the pit
+                self._forget_previous_position(player)
+                self.camera_cut = True
+            # If no lives left, trigger death state
+
+        # Check for death condition (US-014, US-036)
+        if player.lives <= 0:
+            # Player has run out of lives - main.py switches to the game over state (US-036)
+            self.game_over = True
+
+    def _complete_level(self):
+        """Enter the level complete state and save progress (US-023, US-029, US-068)."""
+        self.is_level_complete = True
+        self.completion_timer = 0
+        # Calculate time taken to complete level (in seconds of simulated time)
+        self.completion_time = self.level_frames / FPS
+        # Calculate score earned in this level (US-029)
+        self.score_earned_in_level = self.score - self.level_start_score
+        # Play level complete sound effect (US-046)
+        if self.audio_manager:
+            self.audio_manager.play_level_complete()
+
+        # Save game progress (US-068)
+        if self.save_manager:
+            self.save_manager.set_highest_level_completed(self.current_level_number)
+            self.save_manager.update_high_score(self.score)
+
+        # Read the next level's files while the level complete and transition screens are shown
+        if self.current_level_number < self.max_level_number:
+            self.preloader = LevelPreloader(self.current_level_number + 1)
+            self.preloader.start()
+
+    def update_camera(self):
+        """
+        Update camera position (US-038, US-039).
+        Camera follows player horizontally, centered on player.
+        """
+        camera_x = self.player.rect.centerx - WINDOW_WIDTH // 2
+
+        # Clamp camera to level boundaries (US-039)
+        max_camera_x = max(0, self.level_width - WINDOW_WIDTH)  # Don't scroll if level smaller than screen
+        self.camera_x = max(0, min(camera_x, max_camera_x))  # Clamp to [0, max_camera_x]
+
+    def get_render_camera_x(self, alpha):
+        """
+        Get the camera offset to draw with, interpolated between the last two steps.
+
+        Args:
+            alpha (float): Fraction of a simulation step elapsed since the last update (0-1)
+
+        Returns:
+            int: Camera horizontal offset for rendering
+        """
+        return round(self.previous_camera_x + (self.camera_x - self.previous_camera_x) * alpha)
@@ -0,0 +1,185 @@
+"""
+Headless simulation mode for Coffee Bros.
+Runs the gameplay state machine (GameSession) without a window or audio mixer,
+stepping as fast as the CPU allows, and reports simulated frames per second.
+
+Usage (from the project root):
+    python main.py --headless [--level N] [--frames N] [--seed N]
+"""
+
+import argparse
+import collections
+import contextlib
+import io
+import os
+import random
+import time
+
+import pygame
+from config import FPS
+
+
+def scripted_keys(frame, session):
+    """
+    Default input for headless runs: run right, jump periodically and keep shooting.
+
+    Args:
+        frame (int): Simulation step number since the run started
+        session (GameSession): Session being simulated
+
+    Returns:
+        collections.defaultdict: Key state indexed by pygame key codes
+    """
+    keys = collections.defaultdict(bool)
+    keys[pygame.K_RIGHT] = True
+    keys[pygame.K_x] = True
+    keys[pygame.K_SPACE] = frame % 50 < 20
+    return keys
+
+
+class HeadlessRunner:
+    """
+    Drives a GameSession without rendering.
+
+    Plays the same state machine as main.py: the transition screen is continued
+    immediately, game over retries the level and the victory screen ends the run.
+    """
+
+    def __init__(self, start_level=1, input_source=None, seed=None, quiet=True):
+        """
+        Initialize pygame without a window or mixer and start a new game.
+
+        Args:
+            start_level (int): Level to start from
+            input_source (callable): Function (frame, session) -> key state (default: scripted_keys)
+            seed (int): Optional seed for the random module (boss power-up spawns, particles)
+            quiet (bool): Suppress entity construction logging
+        """
+        # Must be set before the display is initialized
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+        # Images are converted on load, so a (1x1, never shown) display surface is required
+        pygame.display.init()
+        pygame.font.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+
+        if seed is not None:
+            random.seed(seed)
+
+        # Imported here so entity modules see an initialized display
+        from src.game_session import GameSession
+
+        self.input_source = input_source or scripted_keys
+        self.quiet = quiet
+        self.session = GameSession()
+        self.frame = 0
+
+        # Run statistics
+        self.levels_completed = 0
+        self.game_overs = 0
+        self.victory = False
+
+        with self._output():
+            self.session.start_new_game(start_level)
+
+    def _output(self):
+        """Context manager that silences stdout when running quietly."""
+        if self.quiet:
+            return contextlib.redirect_stdout(io.StringIO())
+        return contextlib.nullcontext()
+
+    def step(self):
+        """
+        Advance one fixed simulation step, then resolve menu-driven transitions.
+
+        Returns:
+            bool: False once the game has been won, True otherwise
+        """
+        session = self.session
+        if session.is_victory_screen:
+            return False
+
+        with self._output():
+            session.update(self.input_source(self.frame, session))
+            self.frame += 1
+
+            if session.game_over:
+                # Game over menu "Retry" (US-036)
+                self.game_overs += 1
+                session.retry_level()
+            elif session.is_transition_screen:
+                # Any key continues to the next level (US-029)
+                self.levels_completed += 1
+                if not session.advance_from_transition():
+                    self.victory = True
+                    return False
+        return True
+
+    def run(self, frames):
+        """
+        Simulate up to a number of frames as fast as possible.
+
+        Args:
+            frames (int): Maximum number of simulation steps
+
+        Returns:
+            dict: Run statistics including simulated frames per second
+        """
+        start = time.perf_counter()
+        start_frame = self.frame
+        while self.frame - start_frame < frames:
+            if not self.step():
+                break
+        elapsed = time.perf_counter() - start
+        simulated = self.frame - start_frame
+
+        session = self.session
+        return {
+            'frames': simulated,
+            'elapsed_seconds': elapsed,
+            'simulated_fps': simulated / elapsed if elapsed > 0 else 0,
+            'realtime_factor': simulated / FPS / elapsed if elapsed > 0 else 0,
+            'level': session.current_level_number,
+            'score': session.score,
+            'lives': session.player.lives,
+            'levels_completed': self.levels_completed,
+            'game_overs': self.game_overs,
+            'victory': self.victory,
+        }
+
+
+def run_cli(argv=None):
+    """
+    Command line entry point for headless runs.
+
+    Args:
+        argv (list): Arguments (default: sys.argv[1:])
+
+    Returns:
+        int: Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Run Coffee Bros gameplay headlessly.")
+    parser.add_argument("--headless", action="store_true", help="headless mode (implied)")
+    parser.add_argument("--level", type=int, default=1, help="level to start from (default: 1)")
+    parser.add_argument("--frames", type=int, default=FPS * 60, help="simulation steps to run (default: 3600)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random module")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(start_level=args.level, seed=args.seed)
+    stats = runner.run(args.frames)
+    pygame.quit()
+
+    print("=" * 50)
+    print("COFFEE BROS - HEADLESS SIMULATION")
+    print("=" * 50)
+    print(f"Frames simulated:  {stats['frames']}")
+    print(f"Wall time:         {stats['elapsed_seconds']:.3f}s")
+    print(f"Simulated FPS:     {stats['simulated_fps']:.0f} ({stats['realtime_factor']:.1f}x realtime)")
+    print(f"Level reached:     {stats['level']} (completed {stats['levels_completed']})")
+    print(f"Score:             {stats['score']}")
+    print(f"Lives:             {stats['lives']}  Game overs: {stats['game_overs']}")
+    if stats['victory']:
+        print("Victory!")
+    print("=" * 50)
+    return 0
@@ -0,0 +1,222 @@
+"""
+Input recording and replay for Coffee Bros.
+Captures the per-frame keyboard state, the discrete events main.py handles and the
+number of simulation steps (or menu animation ticks) run each frame, together with
+the random seed, in a compact binary file. Replaying the file reproduces the same
+gameplay frame for frame, which makes frame time comparisons between code changes
+meaningful.
+
+File layout (little endian):
+    header:  magic "CBIR", version (u8), seed (u64), frame count (u32),
+             tracked key count (u8), tracked key codes (u32 each)
+    body:    zlib-compressed frames, each:
+             simulation steps or, outside gameplay, menu animation ticks (u8),
+             held key bitmask (u16), event count (u8),
+             events as (type (u8), key code (u32))
+"""
+
+import struct
+import zlib
+
+import pygame
+
+MAGIC = b"CBIR"
+VERSION = 2  # 2: frames outside gameplay store their menu animation ticks
+
+# Keys read through pygame.key.get_pressed() during gameplay (Player.handle_input, shooting)
+TRACKED_KEYS = (
+    pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d,
+    pygame.K_UP, pygame.K_w, pygame.K_SPACE, pygame.K_x, pygame.K_j,
+)
+
+# Event type codes stored in the file (main.py only reacts to these)
+EVENT_KEYDOWN = 1
+EVENT_QUIT = 2
+
+_HEADER = struct.Struct("<4sBQIB")
+_KEY_CODE = struct.Struct("<I")
+_FRAME = struct.Struct("<BHB")
+_EVENT = struct.Struct("<BI")
+
+
+class RecordedKeys:
+    """
+    Key state restored from a recording.
+    Indexable like the result of pygame.key.get_pressed() for the tracked keys.
+    """
+
+    def __init__(self, held_keys=()):
+        """
+        Args:
+            held_keys (iterable): Key codes held down this frame
+        """
+        self.held_keys = frozenset(held_keys)
+
+    def __getitem__(self, key):
+        return key in self.held_keys
+
+
+class RecordedFrame:
+    """One frame of recorded input."""
+
+    def __init__(self, steps, keys, events):
+        """
+        Args:
+            steps (int): Simulation steps run during the frame (menu animation ticks outside gameplay)
+            keys (RecordedKeys): Held key state
+            events (list): pygame events processed during the frame
+        """
+        self.steps = steps
+        self.keys = keys
+        self.events = events
+
+
+class InputRecorder:
+    """
+    Records input frame by frame and writes it to a binary file.
+    """
+
+    def __init__(self, path, seed, tracked_keys=TRACKED_KEYS):
+        """
+        Args:
+            path (str): Output file path
+            seed (int): Seed the random module was initialized with
+            tracked_keys (tuple): Key codes whose held state is recorded (max 16)
+        """
+        self.path = path
+        self.seed = seed
+        self.tracked_keys = tuple(tracked_keys)
+        self.frames = []
+
+    def record_frame(self, events):
+        """
+        Start recording a frame with the events handled during it.
+
+        Args:
+            events (list): Events returned by pygame.event.get() this frame
+        """
+        recorded_events = []
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                recorded_events.append((EVENT_KEYDOWN, event.key))
+            elif event.type == pygame.QUIT:
+                recorded_events.append((EVENT_QUIT, 0))
+
+        self.frames.append([0, 0, recorded_events])
+
+    def record_gameplay(self, keys, steps):
+        """
+        Record the held keys and simulation steps of the current gameplay frame.
+
+        Args:
+            keys: Key state from pygame.key.get_pressed()
+            steps (int): Simulation steps run this frame
+        """
+        mask = 0
+        for bit, key in enumerate(self.tracked_keys):
+            if keys[key]:
+                mask |= 1 << bit
+
+        frame = self.frames[-1]
+        frame[0] = steps
+        frame[1] = mask
+
+    def record_menu_ticks(self, ticks):
+        """
+        Record the menu animation ticks of the current frame outside gameplay.
+
+        Args:
+            ticks (int): 1/FPS ticks the menus advanced this frame
+        """
+        self.frames[-1][0] = ticks
+
+    def save(self):
+        """
+        Write the recording to disk.
+
+        Returns:
+            bool: True if saved successfully, False otherwise
+        """
+        body = bytearray()
+        for steps, mask, events in self.frames:
+            body += _FRAME.pack(min(steps, 255), mask, len(events))
+            for event_type, key in events:
+                body += _EVENT.pack(event_type, key)
+
+        try:
+            with open(self.path, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, self.seed, len(self.frames), len(self.tracked_keys)))
+                for key in self.tracked_keys:
+                    f.write(_KEY_CODE.pack(key))
+                f.write(zlib.compress(bytes(body), 9))
+            print(f"Input recording saved: {self.path} ({len(self.frames)} frames)")
+            return True
+        except IOError as e:
+            print(f"Error saving input recording: {e}")
+            return False
+
+
+class InputReplay:
+    """
+    Reads a recording made by InputRecorder and hands it back frame by frame.
+    """
+
+    def __init__(self, path):
+        """
+        Load a recording.
+
+        Args:
+            path (str): Recording file path
+
+        Raises:
+            ValueError: If the file is not a valid recording
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not an input recording")
+        magic, version, seed, frame_count, key_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input recording")
+
+        offset = _HEADER.size
+        tracked_keys = [_KEY_CODE.unpack_from(data, offset + i * _KEY_CODE.size)[0] for i in range(key_count)]
+        offset += key_count * _KEY_CODE.size
+        body = zlib.decompress(data[offset:])
+
+        self.path = path
+        self.seed = seed
+        self.frames = []
+        offset = 0
+        for _ in range(frame_count):
+            steps, mask, event_count = _FRAME.unpack_from(body, offset)
+            offset += _FRAME.size
+            events = []
+            for _ in range(event_count):
+                event_type, key = _EVENT.unpack_from(body, offset)
+                offset += _EVENT.size
+                if event_type == EVENT_KEYDOWN:
+                    events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=''))
+                elif event_type == EVENT_QUIT:
+                    events.append(pygame.event.Event(pygame.QUIT))
+            held = [key for bit, key in enumerate(tracked_keys) if mask & (1 << bit)]
+            self.frames.append(RecordedFrame(steps, RecordedKeys(held), events))
+
+        self.position = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def next_frame(self):
+        """
+        Get the next recorded frame.
+
+        Returns:
+            RecordedFrame: Next frame, or None when the recording is finished
+        """
+        if self.position >= len(self.frames):
+            return None
+        frame = self.frames[self.position]
+        self.position += 1
+        return frame
@@ -1,13 +1,17 @@
 """
 Level loading and management system.
-Loads level data from JSON files and creates game entities.
+Loads level data from JSON files (through their compiled form) and creates game entities.
 """
 
-import json
-import os
 import time
 import pygame
+from config import WINDOW_WIDTH
 from src.entities import Player, Platform, Polocho, GoldenArepa, Goal, CorruptionBoss
+from src.optimization import PlatformIndex, PlatformChunks, CullableGroup, shared_frames
+from src.level_streaming import LevelStreamer
+from src.parallax import ParallaxLayer
+from src.level_preload import read_level_files
+from src.level_snapshot import SpriteSnapshot
 
 
 class Level:
@@ -27,20 +31,26 @@ class Level:
         self.player_spawn = {"spawn_x": 100, "spawn_y": 400}  # Default spawn
         self.goal_data = {}
         self.platforms = pygame.sprite.Group()
+        self.platform_index = PlatformIndex([])  # Broad-phase index over platforms (US-063)
+        self.platform_chunks = PlatformChunks([])  # Platforms pre-rendered for drawing
         self.enemies = pygame.sprite.Group()
         self.powerups = pygame.sprite.Group()
         self.goals = pygame.sprite.Group()  # Sprite group for goals
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = CullableGroup()  # Moving sprites - platforms are drawn from platform_chunks
         self.player = None
         self.goal_sprite = None  # Reference to the goal sprite
         self.boss = None  # Reference to boss sprite (level 5 only)
         self.initial_enemy_positions = []
-        self.level_data = None
+        self.level_data = None  # Level data without the entity lists
+        self.entity_tables = {}  # Dictionary mapping "platforms", "enemies" and "powerups" to EntityTables
         self.audio_manager = audio_manager  # Store audio manager reference (US-041)
         self.background_image = None  # Background image surface (US-056)
+        self.parallax_layers = []  # Optional ParallaxLayer objects, back to front
+        self.streamer = None  # LevelStreamer for levels that stream their entities in chunks
+        self.snapshot = None  # SpriteSnapshot of the entities as loaded, restored by reset_level()
 
     @classmethod
-    def load_from_file(cls, level_number, audio_manager=None):
+    def load_from_file(cls, level_number, audio_manager=None, files=None):
         """
         Load level data from JSON file and create all game entities.
         Optimized for fast loading (US-063).
@@ -48,6 +58,8 @@ class Level:
         Args:
             level_number (int): The level number to load (e.g., 1 for level_1.json)
             audio_manager (AudioManager): Optional audio manager for sound effects (US-041)
+            files (LevelFiles): The level's files if they were already read by a
+                LevelPreloader, otherwise they are read now
 
         Returns:
             Level: A Level instance with all entities created and ready to use
@@ -61,39 +73,33 @@ class Level:
 
         level = cls(audio_manager)
 
-        # Construct file path (cross-platform compatible - US-067)
-        level_file = os.path.join("assets", "levels", f"level_{level_number}.json")
-
-        # Check if file exists
-        if not os.path.exists(level_file):
-            raise FileNotFoundError(f"Level file not found: {level_file}")
-
-        # Load JSON data
-        try:
-            with open(level_file, 'r') as f:
-                level.level_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {level_file}: {e}")
+        # Read the level's data and decode its images, unless they were preloaded
+        if files is None:
+            files = read_level_files(level_number)
+        level.level_data, level.entity_tables = files.level_data, files.entity_tables
 
         # Validate required fields
         level._validate_level_data()
 
+        # Draw the shared enemy, power-up and projectile frames now (first load only),
+        # so nothing is drawn when they spawn mid-gameplay
+        shared_frames.prewarm()
+
         # Load metadata
         level.metadata = level.level_data.get("metadata", {})
 
-        # Load background image (US-056, US-067: cross-platform paths)
-        background_type = level.metadata.get("background_type")
-        if background_type:
-            background_path = os.path.join("assets", "images", f"{background_type}.png")
-            if os.path.exists(background_path):
-                try:
-                    level.background_image = pygame.image.load(background_path).convert()
-                except pygame.error as e:
-                    print(f"Warning: Could not load background image {background_path}: {e}")
-                    level.background_image = None
-            else:
-                print(f"Warning: Background image not found: {background_path}")
-                level.background_image = None
+        # Convert the background image for fast blitting (US-056)
+        if files.background_image is not None:
+            level.background_image = files.background_image.convert()
+
+        # Create parallax layers, if the level declares any (drawn instead of the background image)
+        for layer_data, layer_image in files.parallax_images:
+            level.parallax_layers.append(ParallaxLayer(
+                layer_image,
+                scroll_factor=layer_data.get("scroll_factor", 1.0),
+                y=layer_data.get("y", 0),
+                window_width=WINDOW_WIDTH
+            ))
 
         # Load player spawn position
         player_data = level.level_data.get("player", {})
@@ -109,41 +115,32 @@ class Level:
         # Load goal data
         level.goal_data = level.level_data.get("goal", {})
 
-        # Create platforms from JSON data
-        platforms_data = level.level_data.get("platforms", [])
-        for platform_data in platforms_data:
-            x = platform_data.get("x", 0)
-            y = platform_data.get("y", 0)
-            width = platform_data.get("width", 100)
-            height = platform_data.get("height", 20)
-            platform_type = platform_data.get("type", "ground")
-            texture = platform_data.get("texture", "grass")
-
-            platform = Platform(x, y, width, height, platform_type, texture)
-            level.platforms.add(platform)
-            level.all_sprites.add(platform)
-
-        # Create enemies from JSON data
-        enemies_data = level.level_data.get("enemies", [])
-        for enemy_data in enemies_data:
-            enemy_type = enemy_data.get("type", "polocho")
-            spawn_x = enemy_data.get("spawn_x", 0)
-            spawn_y = enemy_data.get("spawn_y", 0)
-            patrol_distance = enemy_data.get("patrol_distance", 150)
-
-            # Store initial enemy position for respawning
-            level.initial_enemy_positions.append({
-                "type": enemy_type,
-                "spawn_x": spawn_x,
-                "spawn_y": spawn_y,
-                "patrol_distance": patrol_distance
-            })
-
-            # Create enemy (currently only Polocho type supported)
-            if enemy_type == "polocho":
-                enemy = Polocho(spawn_x, spawn_y, patrol_distance, audio_manager)
-                level.enemies.add(enemy)
-                level.all_sprites.add(enemy)
+        if level.metadata.get("streaming"):
+            # Very long levels: platforms, enemies and powerups are created chunk by chunk
+            # as the camera approaches, and far away enemies and powerups are frozen
+            chunk_width = level.metadata.get("stream_chunk_width", WINDOW_WIDTH)
+            level.platform_chunks = PlatformChunks([], WINDOW_WIDTH)
+            level.streamer = LevelStreamer(level, chunk_width, WINDOW_WIDTH)
+        else:
+            # Create platforms from level data
+            for platform_record in level.entity_tables["platforms"].rows():
+                level.create_platform(*platform_record)
+
+            # Build static platform index once - entities query it instead of scanning every platform
+            level.platform_index = PlatformIndex(level.platforms)
+            # Platforms are drawn from screen-wide chunks instead of one sprite at a time
+            level.platform_chunks = PlatformChunks(level.platforms, WINDOW_WIDTH)
+
+            # Create enemies from level data
+            for enemy_type, spawn_x, spawn_y, patrol_distance in level.entity_tables["enemies"].rows():
+                # Store initial enemy position for respawning
+                level.initial_enemy_positions.append({
+                    "type": enemy_type,
+                    "spawn_x": spawn_x,
+                    "spawn_y": spawn_y,
+                    "patrol_distance": patrol_distance
+                })
+                level.create_enemy(enemy_type, spawn_x, spawn_y, patrol_distance)
 
         # Create boss if present (level 5)
         boss_data = level.level_data.get("boss")
@@ -157,18 +154,10 @@ class Level:
                 level.enemies.add(level.boss)  # Add to enemies group for collision
                 level.all_sprites.add(level.boss)
 
-        # Create powerups from JSON data
-        powerups_data = level.level_data.get("powerups", [])
-        for powerup_data in powerups_data:
-            powerup_type = powerup_data.get("type", "golden_arepa")
-            x = powerup_data.get("x", 0)
-            y = powerup_data.get("y", 0)
-
-            # Create powerup (currently only golden_arepa type supported)
-            if powerup_type == "golden_arepa":
-                powerup = GoldenArepa(x, y)
-                level.powerups.add(powerup)
-                level.all_sprites.add(powerup)
+        # Create powerups from level data
+        if level.streamer is None:
+            for powerup_record in level.entity_tables["powerups"].rows():
+                level.create_powerup(*powerup_record)
 
         # Create goal sprite from JSON data
         if level.goal_data:
@@ -182,12 +171,92 @@ class Level:
             level.goals.add(level.goal_sprite)
             level.all_sprites.add(level.goal_sprite)
 
+        # Remember the initial state of every entity so resets restore it in place
+        # (streamed entities are captured by the streamer as their chunks are created)
+        level.snapshot = SpriteSnapshot(level.all_sprites)
+
+        # Streamed levels start with the chunks around the start of the level
+        level.update_streaming(0)
+
         # Log loading time for performance monitoring (US-063)
         load_time = time.time() - start_time
         print(f"Level {level_number} loaded in {load_time:.3f} seconds")
 
         return level
 
+    def create_platform(self, x, y, width=100, height=20, platform_type="ground", texture="grass"):
+        """
+        Create a platform and add it to the platforms group.
+        Arguments follow the field order of a platform record in the level data.
+
+        Args:
+            x (int): Left edge
+            y (int): Top edge
+            width (int): Platform width
+            height (int): Platform height
+            platform_type (str): Platform type
+            texture (str): Platform texture
+
+        Returns:
+            Platform: The new platform
+        """
+        platform = Platform(x, y, width, height, platform_type, texture)
+        self.platforms.add(platform)
+        return platform
+
+    def create_enemy(self, enemy_type, spawn_x, spawn_y, patrol_distance=150):
+        """
+        Create an enemy and add it to the level.
+        Arguments follow the field order of an enemy record in the level data.
+
+        Args:
+            enemy_type (str): Enemy type
+            spawn_x (int): Spawn position x
+            spawn_y (int): Spawn position y
+            patrol_distance (int): Patrol distance from the spawn position
+
+        Returns:
+            Polocho: The new enemy, or None for unsupported enemy types
+        """
+        # Currently only Polocho type supported
+        if enemy_type != "polocho":
+            return None
+        enemy = Polocho(spawn_x, spawn_y, patrol_distance, self.audio_manager)
+        self.enemies.add(enemy)
+        self.all_sprites.add(enemy)
+        return enemy
+
+    def create_powerup(self, powerup_type, x, y):
+        """
+        Create a powerup and add it to the level.
+        Arguments follow the field order of a powerup record in the level data.
+
+        Args:
+            powerup_type (str): Powerup type
+            x (int): Position x
+            y (int): Position y
+
+        Returns:
+            GoldenArepa: The new powerup, or None for unsupported powerup types
+        """
+        # Currently only golden_arepa type supported
+        if powerup_type != "golden_arepa":
+            return None
+        powerup = GoldenArepa(x, y)
+        self.powerups.add(powerup)
+        self.all_sprites.add(powerup)
+        return powerup
+
+    def update_streaming(self, camera_x):
+        """
+        Activate the chunks near the camera and freeze the rest (streamed levels only).
+
+        Args:
+            camera_x (int): Camera horizontal offset
+        """
+        if self.streamer is not None:
+            self.streamer.update(camera_x)
+
     def _validate_level_data(self):
         """
         Validate that level data contains all required fields.
@@ -198,11 +267,13 @@ class Level:
         if not isinstance(self.level_data, dict):
             raise ValueError("Level data must be a dictionary")
 
-        # Check for required top-level fields
-        required_fields = ["metadata", "player", "platforms"]
+        # Check for required top-level fields (platforms are checked when the entity tables are built)
+        required_fields = ["metadata", "player"]
         for field in required_fields:
             if field not in self.level_data:
                 raise ValueError(f"Missing required field: {field}")
+        if "platforms" not in self.entity_tables:
+            raise ValueError("Missing required field: platforms")
 
         # Validate metadata
         metadata = self.level_data.get("metadata", {})
@@ -216,11 +287,8 @@ class Level:
         if "spawn_x" not in player_data or "spawn_y" not in player_data:
             raise ValueError("Player data missing spawn_x or spawn_y")
 
-        # Validate platforms array
-        platforms = self.level_data.get("platforms", [])
-        if not isinstance(platforms, list):
-            raise ValueError("Platforms must be an array")
-        if len(platforms) == 0:
+        # Validate platforms
+        if len(self.entity_tables["platforms"]) == 0:
             raise ValueError("Level must have at least one platform")
 
     def respawn_player(self):
@@ -259,66 +327,26 @@ class Level:
         Reset the entire level to initial state.
         Respawns player, enemies, powerups, and goal.
         Used when player dies and respawns.
+
+        Entities are restored in place from the snapshot taken at load, so a reset
+        reuses every sprite and surface instead of rebuilding the level. Platforms
+        never change and are kept as they are, along with their index and chunks.
         """
-        # Clear all sprite groups
+        if self.snapshot is None:
+            return
+
+        # Clear the moving sprite groups (this also drops powerups spawned during play)
         self.all_sprites.empty()
-        self.platforms.empty()
         self.enemies.empty()
         self.powerups.empty()
         self.goals.empty()
 
-        # Reload level from stored data
-        if self.level_data:
-            # Recreate player (US-041: pass audio_manager)
-            self.player = Player(self.player_spawn["spawn_x"], self.player_spawn["spawn_y"], self.audio_manager)
-            self.all_sprites.add(self.player)
-
-            # Recreate platforms
-            platforms_data = self.level_data.get("platforms", [])
-            for platform_data in platforms_data:
-                x = platform_data.get("x", 0)
-                y = platform_data.get("y", 0)
-                width = platform_data.get("width", 100)
-                height = platform_data.get("height", 20)
-                platform_type = platform_data.get("type", "ground")
-                texture = platform_data.get("texture", "grass")
-
-                platform = Platform(x, y, width, height, platform_type, texture)
-                self.platforms.add(platform)
-                self.all_sprites.add(platform)
-
-            # Recreate enemies
-            for enemy_pos in self.initial_enemy_positions:
-                enemy_type = enemy_pos.get("type", "polocho")
-                spawn_x = enemy_pos.get("spawn_x", 0)
-                spawn_y = enemy_pos.get("spawn_y", 0)
-                patrol_distance = enemy_pos.get("patrol_distance", 150)
-
-                if enemy_type == "polocho":
-                    enemy = Polocho(spawn_x, spawn_y, patrol_distance, self.audio_manager)
-                    self.enemies.add(enemy)
-                    self.all_sprites.add(enemy)
-
-            # Recreate powerups
-            powerups_data = self.level_data.get("powerups", [])
-            for powerup_data in powerups_data:
-                powerup_type = powerup_data.get("type", "golden_arepa")
-                x = powerup_data.get("x", 0)
-                y = powerup_data.get("y", 0)
-
-                if powerup_type == "golden_arepa":
-                    powerup = GoldenArepa(x, y)
-                    self.powerups.add(powerup)
-                    self.all_sprites.add(powerup)
-
-            # Recreate goal
-            if self.goal_data:
-                goal_x = self.goal_data.get("x", 0)
-                goal_y = self.goal_data.get("y", 0)
-                goal_width = self.goal_data.get("width", 40)
-                goal_height = self.goal_data.get("height", 80)
-                goal_type = self.goal_data.get("type", "castle")
-
-                self.goal_sprite = Goal(goal_x, goal_y, goal_width, goal_height, goal_type)
-                self.goals.add(self.goal_sprite)
-                self.all_sprites.add(self.goal_sprite)
+        # Put the player, enemies, boss, powerups and goal back as they were loaded
+        self.snapshot.restore()
+
+        if self.streamer is not None:
+            # Streamed entities go back to their initial state, frozen until their chunk is active
+            self.streamer.rewind()
+
+            # Streamed levels restart with the chunks around the start of the level
+            self.update_streaming(0)
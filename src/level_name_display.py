@@ -3,7 +3,7 @@ Level Name Display System
 Displays the level name at the start of each level with fade-in/fade-out animation.
 """
 
-import pygame
+from src.text_renderer import text_renderer
 
 
 class LevelNameDisplay:
@@ -32,11 +32,13 @@ class LevelNameDisplay:
         self.total_duration = self.fade_in_duration + self.display_duration + self.fade_out_duration  # 180 frames = 3 seconds
 
         # Create the text surface
-        self.font = pygame.font.Font(None, 60)  # Large, readable font
+        self.font = text_renderer.get_font(60)  # Large, readable font
         self.text = f"Level {level_number} - {level_name}"
 
-        # Pre-render the text at full opacity
-        self.text_surface = self.font.render(self.text, True, (255, 255, 255))
+        # Pre-render the text at full opacity (shared through the text cache, so retries
+        # don't render it again) plus one private copy the fade alpha is applied to
+        self.text_surface = text_renderer.render(self.font, self.text, (255, 255, 255))
+        self.faded_surface = self.text_surface.copy()
         self.text_rect = self.text_surface.get_rect()
 
         # Current alpha value for fade effect
@@ -75,12 +77,15 @@ class LevelNameDisplay:
 
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            pygame.Rect: Area drawn, or None if nothing was drawn
         """
         if not self.is_active or self.alpha <= 0:
-            return
+            return None
 
-        # Create a copy of the text surface with current alpha
-        text_with_alpha = self.text_surface.copy()
+        # Apply the current alpha to the private copy of the text surface
+        text_with_alpha = self.faded_surface
         text_with_alpha.set_alpha(self.alpha)
 
         # Center the text on the screen
@@ -89,4 +94,4 @@ class LevelNameDisplay:
         self.text_rect.center = (screen_width // 2, screen_height // 3)
 
         # Draw the text
-        screen.blit(text_with_alpha, self.text_rect)
+        return screen.blit(text_with_alpha, self.text_rect)
@@ -0,0 +1,127 @@
+"""
+Background preloading of level files.
+Reading a level's data and decoding its background images is the slow part of
+loading it. While the level complete and transition screens are shown, the next
+level's files are read on a background thread, so continuing only has to convert
+the images and create the entities on the main thread.
+"""
+
+import os
+import threading
+
+import pygame
+
+from src.compiled_level import load_level_data
+
+
+class LevelFiles:
+    """
+    Everything a level loads from disk, before anything is created from it.
+    Images are decoded but not converted - conversion needs the display and
+    happens on the main thread when the level is created.
+    """
+
+    def __init__(self, level_number, level_data, entity_tables, background_image, parallax_images):
+        """
+        Args:
+            level_number (int): Level the files belong to
+            level_data (dict): Level data without the entity lists
+            entity_tables (dict): "platforms", "enemies" and "powerups" EntityTables
+            background_image (pygame.Surface): Unconverted background image, or None
+            parallax_images (list): (layer data, unconverted image) pairs, back to front
+        """
+        self.level_number = level_number
+        self.level_data = level_data
+        self.entity_tables = entity_tables
+        self.background_image = background_image
+        self.parallax_images = parallax_images
+
+
+def read_level_files(level_number):
+    """
+    Read a level's data and decode its images (safe to call off the main thread).
+
+    Args:
+        level_number (int): The level number to read (e.g., 1 for level_1.json)
+
+    Returns:
+        LevelFiles: The level's data and decoded images
+
+    Raises:
+        FileNotFoundError: If level file doesn't exist
+        ValueError: If JSON is malformed
+    """
+    # Construct file path (cross-platform compatible - US-067)
+    level_file = os.path.join("assets", "levels", f"level_{level_number}.json")
+
+    # Check if file exists
+    if not os.path.exists(level_file):
+        raise FileNotFoundError(f"Level file not found: {level_file}")
+
+    # Load level data - entity records come from the compiled level as flat columns,
+    # which is rebuilt automatically when the JSON file is newer
+    level_data, entity_tables = load_level_data(level_file)
+    metadata = level_data.get("metadata", {})
+
+    # Decode background image (US-056, US-067: cross-platform paths)
+    background_image = None
+    background_type = metadata.get("background_type")
+    if background_type:
+        background_path = os.path.join("assets", "images", f"{background_type}.png")
+        if os.path.exists(background_path):
+            try:
+                background_image = pygame.image.load(background_path)
+            except pygame.error as e:
+                print(f"Warning: Could not load background image {background_path}: {e}")
+        else:
+            print(f"Warning: Background image not found: {background_path}")
+
+    # Decode parallax layers, if the level declares any (drawn instead of the background image)
+    parallax_images = []
+    for layer_data in metadata.get("parallax_layers", []):
+        layer_path = os.path.join("assets", "images", f"{layer_data['image']}.png")
+        try:
+            parallax_images.append((layer_data, pygame.image.load(layer_path)))
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Warning: Could not load parallax layer {layer_path}: {e}")
+
+    return LevelFiles(level_number, level_data, entity_tables, background_image, parallax_images)
+
+
+class LevelPreloader(threading.Thread):
+    """
+    Background thread reading one level's files.
+    Errors are kept and raised again by result(), on the thread that uses the level.
+    """
+
+    def __init__(self, level_number):
+        """
+        Args:
+            level_number (int): Level to preload
+        """
+        super().__init__(name=f"LevelPreloader-{level_number}", daemon=True)
+        self.level_number = level_number
+        self.files = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.files = read_level_files(self.level_number)
+        except (OSError, ValueError, pygame.error) as e:
+            self.error = e
+
+    def result(self):
+        """
+        Wait for the files to be read.
+
+        Returns:
+            LevelFiles: The preloaded level files
+
+        Raises:
+            FileNotFoundError: If level file doesn't exist
+            ValueError: If JSON is malformed
+        """
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.files
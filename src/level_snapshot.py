@@ -0,0 +1,102 @@
+"""
+Sprite state snapshots for fast level resets.
+The initial state of a level's entities is captured once after they are created,
+and a reset restores it in place - the same sprites, surfaces and frame lists are
+reused instead of reconstructing (and re-rendering) every entity.
+"""
+
+import pygame
+
+# Attributes pygame.sprite.Sprite keeps for its own bookkeeping (group membership).
+# They are never captured or overwritten - membership is restored through the groups.
+_SPRITE_INTERNALS = frozenset(vars(pygame.sprite.Sprite()))
+
+
+def capture_state(sprite):
+    """
+    Capture the mutable state of a sprite.
+
+    Every instance attribute is recorded. Rects are copied, everything else is kept
+    by reference - entities replace their images, frame lists and other objects
+    rather than modifying them, so references are enough to restore them.
+
+    Args:
+        sprite (pygame.sprite.Sprite): Sprite to capture
+
+    Returns:
+        dict: Attribute name to value
+    """
+    state = {}
+    for name, value in vars(sprite).items():
+        if name in _SPRITE_INTERNALS:
+            continue
+        state[name] = pygame.Rect(value) if isinstance(value, pygame.Rect) else value
+    return state
+
+
+def restore_state(sprite, state):
+    """
+    Put a sprite back in a captured state.
+    Attributes added since the capture are removed, so the sprite ends up exactly as it was.
+
+    Args:
+        sprite (pygame.sprite.Sprite): Sprite to restore
+        state (dict): State returned by capture_state() for this sprite
+    """
+    attributes = vars(sprite)
+    internals = [(name, attributes[name]) for name in _SPRITE_INTERNALS if name in attributes]
+    attributes.clear()
+    attributes.update(state)
+    attributes.update(internals)
+    # Fresh rect copies, so later movement doesn't change the snapshot
+    for name, value in state.items():
+        if isinstance(value, pygame.Rect):
+            attributes[name] = value.copy()
+
+
+class SpriteSnapshot:
+    """
+    Initial state of a set of sprites and the groups each belonged to.
+    """
+
+    def __init__(self, sprites=()):
+        """
+        Capture sprites.
+
+        Args:
+            sprites (iterable): Sprites to capture, with their current group membership
+        """
+        self.entries = []  # (sprite, state, groups) tuples
+        self.capture(sprites)
+
+    def __len__(self):
+        """Return the number of captured sprites."""
+        return len(self.entries)
+
+    def capture(self, sprites):
+        """
+        Add sprites to the snapshot.
+
+        Args:
+            sprites (iterable): Sprites to capture, with their current group membership
+        """
+        for sprite in sprites:
+            self.entries.append((sprite, capture_state(sprite), tuple(sprite.groups())))
+
+    def restore(self, add_to_groups=True):
+        """
+        Restore every captured sprite to its captured state.
+
+        Args:
+            add_to_groups (bool): Also put each sprite back in the groups it belonged to
+
+        Returns:
+            list: (sprite, groups) pairs for the restored sprites
+        """
+        restored = []
+        for sprite, state, groups in self.entries:
+            restore_state(sprite, state)
+            if add_to_groups:
+                sprite.add(*groups)
+            restored.append((sprite, groups))
+        return restored
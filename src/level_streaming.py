@@ -0,0 +1,185 @@
+"""
+Chunk streaming for very long levels.
+Splits a level into fixed-width horizontal chunks and only keeps the entities of
+chunks near the camera in the level's sprite groups, so per-frame cost and load
+time depend on what is around the player rather than on the level's length.
+"""
+
+from src.level_snapshot import SpriteSnapshot
+
+
+class LevelStreamer:
+    """
+    Activates and freezes level entities chunk by chunk as the camera moves.
+
+    - Platforms are created the first time their chunk comes near the camera and
+      then stay (they are static, and the platform index and chunks keep lookups
+      and drawing constant-time).
+    - Enemies and powerups are created the first time their chunk becomes active.
+      When the chunk leaves the active range they are taken out of every sprite
+      group - frozen, so they are neither updated nor drawn - and put back as they
+      were when the chunk becomes active again.
+
+    Entities belong to the chunk they spawned in. The active range extends a
+    margin of chunks past each side of the view, which covers enemy patrols.
+    Each chunk's entities are captured when they are created, so rewind() can put
+    them back to their initial state when the level resets.
+    """
+
+    def __init__(self, level, chunk_width=800, view_width=800, margin_chunks=1):
+        """
+        Split a level's entities into chunks.
+
+        Args:
+            level (Level): Level whose platforms, enemies and powerups are streamed
+            chunk_width (int): Width of each chunk in pixels
+            view_width (int): Width of the visible area (usually the window width)
+            margin_chunks (int): Chunks kept active past each side of the view
+        """
+        self.level = level
+        self.chunk_width = chunk_width
+        self.view_width = view_width
+        self.margin_chunks = margin_chunks
+
+        # Dictionary mapping chunk index to indices of the platforms overlapping it
+        platforms = level.entity_tables["platforms"]
+        self.platform_records = {}
+        for record_index, (left, width) in enumerate(zip(platforms.columns[0], platforms.columns[2])):
+            right = left + width
+            for chunk in range(left // chunk_width, (right - 1) // chunk_width + 1):
+                self.platform_records.setdefault(chunk, []).append(record_index)
+
+        # Dictionary mapping chunk index to (create method, entity record) for enemies and powerups
+        self.entity_records = {}
+        for enemy_record in level.entity_tables["enemies"].rows():
+            chunk = enemy_record[1] // chunk_width  # spawn_x
+            self.entity_records.setdefault(chunk, []).append((level.create_enemy, enemy_record))
+        for powerup_record in level.entity_tables["powerups"].rows():
+            chunk = powerup_record[1] // chunk_width  # x
+            self.entity_records.setdefault(chunk, []).append((level.create_powerup, powerup_record))
+
+        self.reset()
+
+    def reset(self):
+        """Forget every created entity - chunks are created from the level data as they come into view."""
+        self.created_platforms = set()  # Indices of platform records already created
+        self.loaded_chunks = set()  # Chunks whose enemies and powerups were created
+        self.active_entities = {}  # Dictionary mapping active chunk index to its entities
+        self.frozen_entities = {}  # Dictionary mapping frozen chunk index to (entity, groups) pairs
+        self.snapshots = {}  # Dictionary mapping loaded chunk index to the SpriteSnapshot of its entities
+        self.rewound_chunks = set()  # Loaded chunks whose entities are restored on their next activation
+        self.active_range = None  # (first, last) active chunk indices
+
+    def rewind(self):
+        """
+        Send every entity created so far back to its initial state when the level resets.
+        Entities are restored lazily, when their chunk next becomes active, so a reset
+        costs the same however much of the level was visited. Created platforms are
+        kept (they never change). The caller empties the level's sprite groups first.
+        """
+        self.active_entities = {}
+        self.frozen_entities = {}
+        self.rewound_chunks = set(self.snapshots)
+        self.active_range = None
+
+    def get_active_range(self, camera_x):
+        """
+        Get the chunks that should be active for a camera position.
+
+        Args:
+            camera_x (int): Camera horizontal offset
+
+        Returns:
+            tuple: (first, last) chunk indices, inclusive
+        """
+        camera_x = int(camera_x)
+        first = camera_x // self.chunk_width - self.margin_chunks
+        last = (camera_x + self.view_width - 1) // self.chunk_width + self.margin_chunks
+        return (first, last)
+
+    def update(self, camera_x):
+        """
+        Activate the chunks near the camera and freeze the ones that left the active range.
+        Does nothing unless the camera crossed into a new chunk.
+
+        Args:
+            camera_x (int): Camera horizontal offset
+        """
+        active_range = self.get_active_range(camera_x)
+        if active_range == self.active_range:
+            return
+        first, last = active_range
+
+        # Platforms reach one chunk further so anything active always has its ground
+        self._create_platforms(first - 1, last + 1)
+
+        if self.active_range is not None:
+            old_first, old_last = self.active_range
+            for chunk in range(old_first, old_last + 1):
+                if chunk < first or chunk > last:
+                    self._freeze(chunk)
+        for chunk in range(first, last + 1):
+            if chunk not in self.active_entities:
+                self._activate(chunk)
+
+        self.active_range = active_range
+
+    def _create_platforms(self, first, last):
+        """Create the platforms of a chunk range that don't exist yet."""
+        level = self.level
+        platforms = level.entity_tables["platforms"]
+        new_platforms = []
+        for chunk in range(first, last + 1):
+            for record_index in self.platform_records.get(chunk, ()):
+                if record_index not in self.created_platforms:
+                    self.created_platforms.add(record_index)
+                    new_platforms.append(level.create_platform(*platforms.row(record_index)))
+
+        if new_platforms:
+            level.platform_index.add(new_platforms)
+            level.platform_chunks.add(new_platforms)
+
+    def _activate(self, chunk):
+        """Put a chunk's frozen entities back in their groups, creating them on first activation."""
+        if chunk in self.rewound_chunks:
+            self.rewound_chunks.discard(chunk)
+            entities = [entity for entity, _ in self.snapshots[chunk].restore()]
+        elif chunk in self.frozen_entities:
+            entities = []
+            for entity, groups in self.frozen_entities.pop(chunk):
+                entity.add(*groups)
+                entities.append(entity)
+        elif chunk not in self.loaded_chunks:
+            self.loaded_chunks.add(chunk)
+            entities = [entity for entity in
+                        (create(*record) for create, record in self.entity_records.get(chunk, ()))
+                        if entity is not None]
+            self.snapshots[chunk] = SpriteSnapshot(entities)
+        else:
+            entities = []
+        self.active_entities[chunk] = entities
+
+    def _freeze(self, chunk):
+        """Take a chunk's entities out of every group, remembering the groups to restore."""
+        frozen = []
+        for entity in self.active_entities.pop(chunk, ()):
+            if entity.alive():  # Squashed enemies and collected powerups stay gone
+                frozen.append((entity, entity.groups()))
+                entity.kill()
+        if frozen:
+            self.frozen_entities[chunk] = frozen
+
+    def get_stats(self):
+        """
+        Get streaming counters for debugging.
+
+        Returns:
+            dict: Active, frozen and created chunk and entity counts
+        """
+        return {
+            'active_chunks': len(self.active_entities),
+            'active_entities': sum(len(entities) for entities in self.active_entities.values()),
+            'frozen_entities': sum(len(entities) for entities in self.frozen_entities.values()),
+            'loaded_chunks': len(self.loaded_chunks),
+            'created_platforms': len(self.created_platforms),
+        }
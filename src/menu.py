@@ -5,6 +5,8 @@ Displays menu screen with navigation options.
 
 import pygame
 from config import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, YELLOW, GREEN, RED, GOLD
+from src.text_renderer import text_renderer
+from src.overlay import CachedOverlay
 
 
 class MainMenu:
@@ -17,9 +19,9 @@ class MainMenu:
         self.selected_index = 0  # Currently selected option (0 = Start Game)
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 96)  # Large font for title
-        self.option_font = pygame.font.Font(None, 48)  # Medium font for options
-        self.subtitle_font = pygame.font.Font(None, 32)  # Small font for subtitle
+        self.title_font = text_renderer.get_font(96)  # Large font for title
+        self.option_font = text_renderer.get_font(48)  # Medium font for options
+        self.subtitle_font = text_renderer.get_font(32)  # Small font for subtitle
 
         # Colors (Colombian theme)
         self.title_color = YELLOW  # Colombian yellow for title
@@ -99,16 +101,16 @@ class MainMenu:
         screen.blit(overlay, (0, 0))
 
         # Draw game title "Coffee Bros"
-        title_text = self.title_font.render("Coffee Bros", True, self.title_color)
+        title_text = text_renderer.render(self.title_font, "Coffee Bros", self.title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 120))
         # Add shadow effect for title
-        shadow_text = self.title_font.render("Coffee Bros", True, (50, 50, 50))
+        shadow_text = text_renderer.render(self.title_font, "Coffee Bros", (50, 50, 50))
         shadow_rect = shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 120 + 3))
         screen.blit(shadow_text, shadow_rect)
         screen.blit(title_text, title_rect)
 
         # Draw subtitle
-        subtitle_text = self.subtitle_font.render("A Colombian Coffee Adventure", True, self.subtitle_color)
+        subtitle_text = text_renderer.render(self.subtitle_font, "A Colombian Coffee Adventure", self.subtitle_color)
         subtitle_rect = subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, 190))
         screen.blit(subtitle_text, subtitle_rect)
 
@@ -121,7 +123,7 @@ class MainMenu:
             if i == self.selected_index:
                 color = self.selected_color
                 # Add selection indicator (arrow)
-                arrow_text = self.option_font.render(">", True, color)
+                arrow_text = text_renderer.render(self.option_font, ">", color)
                 arrow_rect = arrow_text.get_rect()
                 arrow_rect.midright = (WINDOW_WIDTH // 2 - 150, start_y + i * option_spacing)
                 screen.blit(arrow_text, arrow_rect)
@@ -129,12 +131,12 @@ class MainMenu:
                 color = self.unselected_color
 
             # Render option text
-            option_text = self.option_font.render(option, True, color)
+            option_text = text_renderer.render(self.option_font, option, color)
             option_rect = option_text.get_rect(center=(WINDOW_WIDTH // 2, start_y + i * option_spacing))
             screen.blit(option_text, option_rect)
 
         # Draw controls hint at bottom
-        controls_text = self.subtitle_font.render("Use Arrow Keys or W/S to navigate, Enter to select", True, self.subtitle_color)
+        controls_text = text_renderer.render(self.subtitle_font, "Use Arrow Keys or W/S to navigate, Enter to select", self.subtitle_color)
         controls_rect = controls_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
         screen.blit(controls_text, controls_rect)
 
@@ -149,9 +151,9 @@ class GameOverMenu:
         self.selected_index = 0  # Currently selected option (0 = Retry Level)
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 96)  # Large font for "GAME OVER"
-        self.score_font = pygame.font.Font(None, 48)  # Medium font for score display
-        self.option_font = pygame.font.Font(None, 48)  # Medium font for options
+        self.title_font = text_renderer.get_font(96)  # Large font for "GAME OVER"
+        self.score_font = text_renderer.get_font(48)  # Medium font for score display
+        self.option_font = text_renderer.get_font(48)  # Medium font for options
 
         # Colors
         self.title_color = RED  # Red for "GAME OVER" title
@@ -163,6 +165,9 @@ class GameOverMenu:
         self.input_delay = 60  # 60 frames = 1 second at 60 FPS
         self.delay_timer = 0
 
+        # Screen composed once per score/selection, mostly opaque for a clear game over screen
+        self.overlay = CachedOverlay(self._compose, alpha=200, max_cached=len(self.options) + 1)
+
     def reset(self):
         """Reset the game over menu state (call when entering game over state)"""
         self.selected_index = 0
@@ -174,7 +179,7 @@ class GameOverMenu:
         Returns: 'retry', 'menu', or None
         """
         # Don't accept input during delay period
-        if self.delay_timer < self.input_delay:
+        if not self.is_input_ready():
             return None
 
         if event.type == pygame.KEYDOWN:
@@ -200,32 +205,48 @@ class GameOverMenu:
 
         return None
 
-    def update(self):
-        """Update game over menu (increment delay timer)"""
+    def update(self, frames=1):
+        """
+        Update game over menu (advance delay timer)
+
+        Args:
+            frames (int): Frames (1/60 s ticks) elapsed since the last update
+        """
         if self.delay_timer < self.input_delay:
-            self.delay_timer += 1
+            self.delay_timer = min(self.delay_timer + frames, self.input_delay)
+
+    def is_input_ready(self):
+        """Check whether the input delay has passed and options can be selected"""
+        return self.delay_timer >= self.input_delay
 
     def draw(self, screen, final_score):
         """Draw the game over menu to the screen"""
-        # Create semi-transparent dark overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)  # Mostly opaque for clear game over screen
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        # Options stay dimmed (no selection) until the input delay has passed
+        selected_index = self.selected_index if self.is_input_ready() else None
+        self.overlay.draw(screen, final_score, selected_index)
 
-        # Draw "GAME OVER" title
-        title_text = self.title_font.render("GAME OVER", True, self.title_color)
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 120))
-        # Add shadow effect for title
-        shadow_text = self.title_font.render("GAME OVER", True, (50, 50, 50))
-        shadow_rect = shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 120 + 3))
-        screen.blit(shadow_text, shadow_rect)
-        screen.blit(title_text, title_rect)
+    def _compose(self, final_score, selected_index):
+        """
+        Text of the game over screen, drawn on its cached overlay.
+
+        Args:
+            final_score (int): Score shown on the screen
+            selected_index (int): Selected option, or None while input is delayed
+
+        Returns:
+            list: (surface, rect) pairs
+        """
+        items = []
+
+        # Draw "GAME OVER" title with a shadow effect
+        shadow_text = text_renderer.render(self.title_font, "GAME OVER", (50, 50, 50))
+        items.append((shadow_text, shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 120 + 3))))
+        title_text = text_renderer.render(self.title_font, "GAME OVER", self.title_color)
+        items.append((title_text, title_text.get_rect(center=(WINDOW_WIDTH // 2, 120))))
 
         # Draw final score
-        score_text = self.score_font.render(f"Final Score: {final_score}", True, self.score_color)
-        score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, 220))
-        screen.blit(score_text, score_rect)
+        score_text = text_renderer.render(self.score_font, f"Final Score: {final_score}", self.score_color)
+        items.append((score_text, score_text.get_rect(center=(WINDOW_WIDTH // 2, 220))))
 
         # Draw menu options (centered vertically in lower half of screen)
         start_y = 340  # Starting y position for first option
@@ -233,23 +254,24 @@ class GameOverMenu:
 
         for i, option in enumerate(self.options):
             # Determine color based on selection and delay
-            if self.delay_timer < self.input_delay:
+            if selected_index is None:
                 # During delay, show all options in dim color
                 color = (100, 100, 100)  # Dark gray during delay
-            elif i == self.selected_index:
+            elif i == selected_index:
                 color = self.selected_color
                 # Add selection indicator (arrow)
-                arrow_text = self.option_font.render(">", True, color)
+                arrow_text = text_renderer.render(self.option_font, ">", color)
                 arrow_rect = arrow_text.get_rect()
                 arrow_rect.midright = (WINDOW_WIDTH // 2 - 150, start_y + i * option_spacing)
-                screen.blit(arrow_text, arrow_rect)
+                items.append((arrow_text, arrow_rect))
             else:
                 color = self.unselected_color
 
             # Render option text
-            option_text = self.option_font.render(option, True, color)
-            option_rect = option_text.get_rect(center=(WINDOW_WIDTH // 2, start_y + i * option_spacing))
-            screen.blit(option_text, option_rect)
+            option_text = text_renderer.render(self.option_font, option, color)
+            items.append((option_text, option_text.get_rect(center=(WINDOW_WIDTH // 2, start_y + i * option_spacing))))
+
+        return items
 
 
 class SettingsMenu:
@@ -291,9 +313,9 @@ class SettingsMenu:
         self.return_to = "menu"  # Can be "menu" or "pause"
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 96)
-        self.option_font = pygame.font.Font(None, 48)
-        self.value_font = pygame.font.Font(None, 36)
+        self.title_font = text_renderer.get_font(96)
+        self.option_font = text_renderer.get_font(48)
+        self.value_font = text_renderer.get_font(36)
 
         # Colors
         self.title_color = YELLOW
@@ -370,10 +392,10 @@ class SettingsMenu:
         screen.fill(BLACK)
 
         # Draw "SETTINGS" title
-        title_text = self.title_font.render("SETTINGS", True, self.title_color)
+        title_text = text_renderer.render(self.title_font, "SETTINGS", self.title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 100))
         # Add shadow effect for title
-        shadow_text = self.title_font.render("SETTINGS", True, (50, 50, 50))
+        shadow_text = text_renderer.render(self.title_font, "SETTINGS", (50, 50, 50))
         shadow_rect = shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 100 + 3))
         screen.blit(shadow_text, shadow_rect)
         screen.blit(title_text, title_rect)
@@ -387,7 +409,7 @@ class SettingsMenu:
             if i == self.selected_index:
                 color = self.selected_color
                 # Add selection indicator (arrow)
-                arrow_text = self.option_font.render(">", True, color)
+                arrow_text = text_renderer.render(self.option_font, ">", color)
                 arrow_rect = arrow_text.get_rect()
                 arrow_rect.midright = (120, start_y + i * option_spacing)
                 screen.blit(arrow_text, arrow_rect)
@@ -395,7 +417,7 @@ class SettingsMenu:
                 color = self.unselected_color
 
             # Render option text
-            option_text = self.option_font.render(option, True, color)
+            option_text = text_renderer.render(self.option_font, option, color)
             option_rect = option_text.get_rect()
             option_rect.midleft = (150, start_y + i * option_spacing)
             screen.blit(option_text, option_rect)
@@ -407,8 +429,8 @@ class SettingsMenu:
                 self._draw_volume_slider(screen, self.sfx_volume, start_y + i * option_spacing)
 
         # Draw controls hint at bottom
-        controls_font = pygame.font.Font(None, 28)
-        controls_text = controls_font.render("Use Arrow Keys to navigate, Left/Right to adjust, Enter/ESC to go back", True, (150, 150, 150))
+        controls_font = text_renderer.get_font(28)
+        controls_text = text_renderer.render(controls_font, "Use Arrow Keys to navigate, Left/Right to adjust, Enter/ESC to go back", (150, 150, 150))
         controls_rect = controls_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
         screen.blit(controls_text, controls_rect)
 
@@ -439,7 +461,7 @@ class SettingsMenu:
 
         # Draw percentage value
         percentage = int(volume * 100)
-        value_text = self.value_font.render(f"{percentage}%", True, self.value_color)
+        value_text = text_renderer.render(self.value_font, f"{percentage}%", self.value_color)
         value_rect = value_text.get_rect()
         value_rect.midleft = (slider_x + slider_width + 20, y_pos)
         screen.blit(value_text, value_rect)
@@ -465,10 +487,10 @@ class ControlsMenu:
         self.return_to = "menu"  # Can be "menu" or "pause"
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 96)  # Large font for title
-        self.section_font = pygame.font.Font(None, 48)  # Medium font for section headers
-        self.action_font = pygame.font.Font(None, 36)  # Font for action names
-        self.key_font = pygame.font.Font(None, 32)  # Font for key names
+        self.title_font = text_renderer.get_font(96)  # Large font for title
+        self.section_font = text_renderer.get_font(48)  # Medium font for section headers
+        self.action_font = text_renderer.get_font(36)  # Font for action names
+        self.key_font = text_renderer.get_font(32)  # Font for key names
 
         # Colors
         self.title_color = YELLOW  # Yellow for title
@@ -502,10 +524,10 @@ class ControlsMenu:
         screen.fill(BLACK)
 
         # Draw "CONTROLS" title
-        title_text = self.title_font.render("CONTROLS", True, self.title_color)
+        title_text = text_renderer.render(self.title_font, "CONTROLS", self.title_color)
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 80))
         # Add shadow effect for title
-        shadow_text = self.title_font.render("CONTROLS", True, (50, 50, 50))
+        shadow_text = text_renderer.render(self.title_font, "CONTROLS", (50, 50, 50))
         shadow_rect = shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 80 + 3))
         screen.blit(shadow_text, shadow_rect)
         screen.blit(title_text, title_rect)
@@ -519,13 +541,13 @@ class ControlsMenu:
             y_pos = start_y + i * line_spacing
 
             # Draw action name (left-aligned)
-            action_text = self.action_font.render(action + ":", True, self.action_color)
+            action_text = text_renderer.render(self.action_font, action + ":", self.action_color)
             action_rect = action_text.get_rect()
             action_rect.midleft = (100, y_pos)
             screen.blit(action_text, action_rect)
 
             # Draw key binding (right side, with visual key box)
-            key_text = self.key_font.render(keys, True, self.key_color)
+            key_text = text_renderer.render(self.key_font, keys, self.key_color)
             key_rect = key_text.get_rect()
             key_rect.midleft = (400, y_pos)
 
@@ -545,8 +567,8 @@ class ControlsMenu:
             screen.blit(key_text, key_rect)
 
         # Draw controls hint at bottom
-        hint_font = pygame.font.Font(None, 28)
-        hint_text = hint_font.render("Press ESC, Enter, or Space to go back", True, self.hint_color)
+        hint_font = text_renderer.get_font(28)
+        hint_text = text_renderer.render(hint_font, "Press ESC, Enter, or Space to go back", self.hint_color)
         hint_rect = hint_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 40))
         screen.blit(hint_text, hint_rect)
 
@@ -561,14 +583,17 @@ class PauseMenu:
         self.selected_index = 0  # Currently selected option (0 = Resume)
 
         # Fonts
-        self.title_font = pygame.font.Font(None, 96)  # Large font for "PAUSED"
-        self.option_font = pygame.font.Font(None, 48)  # Medium font for options
+        self.title_font = text_renderer.get_font(96)  # Large font for "PAUSED"
+        self.option_font = text_renderer.get_font(48)  # Medium font for options
 
         # Colors
         self.title_color = YELLOW  # Yellow for "PAUSED" title
         self.selected_color = GOLD  # Gold for selected option
         self.unselected_color = (200, 200, 200)  # Light gray for unselected options
 
+        # Screen composed once per selection, semi-transparent so the frozen game shows through
+        self.overlay = CachedOverlay(self._compose, alpha=180, max_cached=len(self.options))
+
     def handle_input(self, event):
         """
         Handle keyboard input for pause menu navigation.
@@ -609,20 +634,25 @@ class PauseMenu:
 
     def draw(self, screen):
         """Draw the pause menu overlay on top of the game"""
-        # Create semi-transparent dark overlay (dims the background game)
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)  # Semi-transparent (0-255)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        self.overlay.draw(screen, self.selected_index)
 
-        # Draw "PAUSED" title
-        title_text = self.title_font.render("PAUSED", True, self.title_color)
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
-        # Add shadow effect for title
-        shadow_text = self.title_font.render("PAUSED", True, (50, 50, 50))
-        shadow_rect = shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 150 + 3))
-        screen.blit(shadow_text, shadow_rect)
-        screen.blit(title_text, title_rect)
+    def _compose(self, selected_index):
+        """
+        Text of the pause menu, drawn on its cached overlay.
+
+        Args:
+            selected_index (int): Selected option
+
+        Returns:
+            list: (surface, rect) pairs
+        """
+        items = []
+
+        # Draw "PAUSED" title with a shadow effect
+        shadow_text = text_renderer.render(self.title_font, "PAUSED", (50, 50, 50))
+        items.append((shadow_text, shadow_text.get_rect(center=(WINDOW_WIDTH // 2 + 3, 150 + 3))))
+        title_text = text_renderer.render(self.title_font, "PAUSED", self.title_color)
+        items.append((title_text, title_text.get_rect(center=(WINDOW_WIDTH // 2, 150))))
 
         # Draw menu options (centered vertically)
         start_y = 300  # Starting y position for first option
@@ -630,17 +660,18 @@ class PauseMenu:
 
         for i, option in enumerate(self.options):
             # Determine color based on selection
-            if i == self.selected_index:
+            if i == selected_index:
                 color = self.selected_color
                 # Add selection indicator (arrow)
-                arrow_text = self.option_font.render(">", True, color)
+                arrow_text = text_renderer.render(self.option_font, ">", color)
                 arrow_rect = arrow_text.get_rect()
                 arrow_rect.midright = (WINDOW_WIDTH // 2 - 150, start_y + i * option_spacing)
-                screen.blit(arrow_text, arrow_rect)
+                items.append((arrow_text, arrow_rect))
             else:
                 color = self.unselected_color
 
             # Render option text
-            option_text = self.option_font.render(option, True, color)
-            option_rect = option_text.get_rect(center=(WINDOW_WIDTH // 2, start_y + i * option_spacing))
-            screen.blit(option_text, option_rect)
+            option_text = text_renderer.render(self.option_font, option, color)
+            items.append((option_text, option_text.get_rect(center=(WINDOW_WIDTH // 2, start_y + i * option_spacing))))
+
+        return items
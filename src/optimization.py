@@ -3,13 +3,238 @@ Performance optimization utilities for Coffee Bros.
 Provides optimized collision detection and rendering techniques.
 """
 
+import bisect
+import math
+
 import pygame
 
 
+class PlatformIndex:
+    """
+    Static broad-phase index for level platforms.
+    Buckets platforms into fixed-width columns along the level's x-axis so entities
+    only test platforms near their rect instead of the whole platform group.
+    Built once per level load/reset since platforms never move.
+    """
+
+    def __init__(self, platforms, cell_size=200):
+        """
+        Build the platform index.
+
+        Args:
+            platforms (iterable): Platform sprites to index (usually level.platforms)
+            cell_size (int): Width of each column in pixels
+        """
+        self.cell_size = cell_size
+        self.platforms = []  # Keep group order so collision resolution is unchanged
+        self.columns = {}  # Dictionary mapping column index to list of platform order indices
+        self.add(platforms)
+
+    def add(self, platforms):
+        """
+        Index more platforms (streamed levels create platforms as they come into view).
+
+        Args:
+            platforms (iterable): Platform sprites to add, after the ones already indexed
+        """
+        cell_size = self.cell_size
+        for platform in platforms:
+            order = len(self.platforms)
+            self.platforms.append(platform)
+            first_column = platform.rect.left // cell_size
+            last_column = (platform.rect.right - 1) // cell_size
+            for column in range(first_column, last_column + 1):
+                if column not in self.columns:
+                    self.columns[column] = []
+                self.columns[column].append(order)
+
+    def __iter__(self):
+        """Iterate over all indexed platforms (keeps Group-style loops working)."""
+        return iter(self.platforms)
+
+    def __len__(self):
+        """Return the number of indexed platforms."""
+        return len(self.platforms)
+
+    def query(self, rect, margin=0):
+        """
+        Get platforms whose horizontal extent may overlap a rectangle.
+
+        Args:
+            rect (pygame.Rect): Rectangle to look around
+            margin (int): Extra pixels to include on each side of the rect, to cover
+                any horizontal movement the caller applies while resolving collisions
+
+        Returns:
+            list: Candidate platforms, in the same order as the original group
+        """
+        first_column = (rect.left - margin) // self.cell_size
+        last_column = (rect.right - 1 + margin) // self.cell_size
+
+        if first_column == last_column:
+            orders = self.columns.get(first_column)
+            if not orders:
+                return []
+            return [self.platforms[order] for order in orders]
+
+        # Rect spans several columns - merge and de-duplicate while preserving order
+        orders = set()
+        for column in range(first_column, last_column + 1):
+            column_orders = self.columns.get(column)
+            if column_orders:
+                orders.update(column_orders)
+        return [self.platforms[order] for order in sorted(orders)]
+
+
+def query_platforms(platforms, rect, margin=0):
+    """
+    Get the platforms an entity needs to test for collision near a rectangle.
+    Uses the platform index if one is given, falls back to the full group if not.
+
+    Args:
+        platforms (PlatformIndex or pygame.sprite.Group): Level platforms
+        rect (pygame.Rect): Rectangle to look around
+        margin (int): Extra pixels to include on each side of the rect
+
+    Returns:
+        iterable: Platforms to check for collision
+    """
+    if isinstance(platforms, PlatformIndex):
+        return platforms.query(rect, margin)
+    return platforms
+
+
+class PlatformChunks:
+    """
+    Static level geometry pre-rendered into screen-wide chunk surfaces.
+    Platforms never move, so instead of drawing every platform sprite each frame
+    they are baked into chunks one window wide, and drawing the level geometry is
+    two or three blits no matter how many platforms the level has.
+
+    Chunks are rendered the first time they are needed and then reused; only the
+    most recently used ones are kept so very long levels don't hold every chunk
+    in memory. Built once per level load/reset, like PlatformIndex.
+    """
+
+    COLORKEY = (255, 0, 255)  # Transparent color of chunk surfaces (not used by any tile)
+
+    def __init__(self, platforms, chunk_width=800, max_cached=8):
+        """
+        Lay out the chunks for a set of platforms.
+
+        Args:
+            platforms (iterable): Platform sprites to bake (usually level.platforms)
+            chunk_width (int): Width of each chunk in pixels (usually the window width)
+            max_cached (int): Rendered chunks kept before the least recently used is dropped
+        """
+        self.chunk_width = chunk_width
+        self.max_cached = max_cached
+        self.chunks = {}  # Dictionary mapping chunk index to (platforms, top, bottom)
+        self.surfaces = {}  # Dictionary mapping chunk index to rendered surface, least recently used first
+        self.add(platforms)
+
+    def add(self, platforms):
+        """
+        Add more platforms (streamed levels create platforms as they come into view).
+        Chunks they touch are re-rendered the next time they are drawn.
+
+        Args:
+            platforms (iterable): Platform sprites to add, drawn over the ones already added
+        """
+        chunk_width = self.chunk_width
+        for platform in platforms:  # Group order, so overlapping platforms stack as before
+            rect = platform.rect
+            for index in range(rect.left // chunk_width, (rect.right - 1) // chunk_width + 1):
+                if index in self.chunks:
+                    chunk_platforms, top, bottom = self.chunks[index]
+                    chunk_platforms.append(platform)
+                    self.chunks[index] = (chunk_platforms, min(top, rect.top), max(bottom, rect.bottom))
+                else:
+                    self.chunks[index] = ([platform], rect.top, rect.bottom)
+                self.surfaces.pop(index, None)
+
+    def __len__(self):
+        """Return the number of chunks that contain platforms."""
+        return len(self.chunks)
+
+    def _get_surface(self, index):
+        """
+        Get a chunk's rendered surface, rendering it if needed.
+
+        Args:
+            index (int): Chunk index
+
+        Returns:
+            pygame.Surface: Chunk surface covering the chunk's platform band
+        """
+        surface = self.surfaces.pop(index, None)
+        if surface is None:
+            chunk_platforms, top, bottom = self.chunks[index]
+            chunk_x = index * self.chunk_width
+            surface = pygame.Surface((self.chunk_width, bottom - top)).convert()
+            surface.fill(self.COLORKEY)
+            for platform in chunk_platforms:
+                surface.blit(platform.image, (platform.rect.x - chunk_x, platform.rect.y - top))
+            surface.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+
+            if len(self.surfaces) >= self.max_cached:
+                del self.surfaces[next(iter(self.surfaces))]
+        self.surfaces[index] = surface  # Re-insert as most recently used
+        return surface
+
+    def prerender(self, camera_x, view_width):
+        """
+        Render the chunks in view ahead of drawing them, e.g. right after a level loads.
+
+        Args:
+            camera_x (int): Camera horizontal offset
+            view_width (int): Width of the visible area
+        """
+        for index in range(int(camera_x) // self.chunk_width, (int(camera_x) + view_width - 1) // self.chunk_width + 1):
+            if index in self.chunks:
+                self._get_surface(index)
+
+    def draw(self, screen, camera_x):
+        """
+        Draw the platforms visible at a camera position.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            camera_x (float): Camera horizontal offset
+
+        Returns:
+            int: Number of chunks drawn (for debugging)
+        """
+        screen_width = screen.get_width()
+        screen_height = screen.get_height()
+        # Whole-pixel camera that puts on-screen platforms where blitting each one at
+        # its float position would (blit truncates it, i.e. floors positive positions)
+        camera_x = math.ceil(camera_x)
+        first_index = int(camera_x // self.chunk_width)
+        last_index = int((camera_x + screen_width - 1) // self.chunk_width)
+        drawn_count = 0
+
+        for index in range(first_index, last_index + 1):
+            chunk = self.chunks.get(index)
+            if chunk is None:
+                continue
+            _, top, bottom = chunk
+            if bottom < 0 or top > screen_height:
+                continue
+            screen.blit(self._get_surface(index), (index * self.chunk_width - camera_x, top))
+            drawn_count += 1
+
+        return drawn_count
+
+
 class SpatialGrid:
     """
     Spatial partitioning grid for efficient collision detection.
     Divides the game world into cells to reduce collision checks from O(n²) to O(n).
+
+    The grid can be kept alive across frames: refresh() only re-buckets sprites
+    that crossed a cell boundary since the last frame, instead of clearing and
+    rebuilding the whole grid.
     """
 
     def __init__(self, cell_size=100):
@@ -21,10 +246,15 @@ class SpatialGrid:
         """
         self.cell_size = cell_size
         self.grid = {}  # Dictionary mapping (grid_x, grid_y) to list of sprites
+        self.sprite_cells = {}  # Dictionary mapping sprite to its (min_x, min_y, max_x, max_y) cell range
+        self.sprite_order = {}  # Dictionary mapping sprite to insertion order (keeps query results stable)
+        self.next_order = 0
 
     def clear(self):
         """Clear all sprites from the grid."""
         self.grid.clear()
+        self.sprite_cells.clear()
+        self.sprite_order.clear()
 
     def _get_cell(self, x, y):
         """
@@ -39,6 +269,20 @@ class SpatialGrid:
         """
         return (int(x // self.cell_size), int(y // self.cell_size))
 
+    def _get_cell_range(self, rect):
+        """
+        Get the range of grid cells that a rectangle overlaps.
+
+        Args:
+            rect (pygame.Rect): Rectangle to check
+
+        Returns:
+            tuple: (min_cell_x, min_cell_y, max_cell_x, max_cell_y)
+        """
+        min_cell_x, min_cell_y = self._get_cell(rect.left, rect.top)
+        max_cell_x, max_cell_y = self._get_cell(rect.right, rect.bottom)
+        return (min_cell_x, min_cell_y, max_cell_x, max_cell_y)
+
     def _get_cells_for_rect(self, rect):
         """
         Get all grid cells that a rectangle overlaps.
@@ -49,11 +293,20 @@ class SpatialGrid:
         Returns:
             list: List of (grid_x, grid_y) cell coordinates
         """
-        cells = []
+        return self._cells_in_range(self._get_cell_range(rect))
 
-        # Get cell range the rect spans
-        min_cell_x, min_cell_y = self._get_cell(rect.left, rect.top)
-        max_cell_x, max_cell_y = self._get_cell(rect.right, rect.bottom)
+    def _cells_in_range(self, cell_range):
+        """
+        Expand a cell range into a list of cells.
+
+        Args:
+            cell_range (tuple): (min_cell_x, min_cell_y, max_cell_x, max_cell_y)
+
+        Returns:
+            list: List of (grid_x, grid_y) cell coordinates
+        """
+        min_cell_x, min_cell_y, max_cell_x, max_cell_y = cell_range
+        cells = []
 
         # Add all cells in the range
         for cx in range(min_cell_x, max_cell_x + 1):
@@ -65,17 +318,113 @@ class SpatialGrid:
     def insert(self, sprite):
         """
         Insert a sprite into the grid.
+        If the sprite is already in the grid it is moved instead.
 
         Args:
             sprite (pygame.sprite.Sprite): Sprite to insert
         """
-        cells = self._get_cells_for_rect(sprite.rect)
+        if sprite in self.sprite_cells:
+            self.move(sprite)
+            return
 
-        for cell in cells:
+        cell_range = self._get_cell_range(sprite.rect)
+        for cell in self._cells_in_range(cell_range):
             if cell not in self.grid:
                 self.grid[cell] = []
             self.grid[cell].append(sprite)
 
+        self.sprite_cells[sprite] = cell_range
+        self.sprite_order[sprite] = self.next_order
+        self.next_order += 1
+
+    def move(self, sprite):
+        """
+        Re-bucket a sprite after it moved.
+        Does nothing unless the sprite crossed a cell boundary.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite already in the grid
+
+        Returns:
+            bool: True if the sprite changed cells, False otherwise
+        """
+        old_range = self.sprite_cells[sprite]
+        new_range = self._get_cell_range(sprite.rect)
+        if new_range == old_range:
+            return False
+
+        self._remove_from_cells(sprite, old_range)
+        for cell in self._cells_in_range(new_range):
+            if cell not in self.grid:
+                self.grid[cell] = []
+            self.grid[cell].append(sprite)
+
+        self.sprite_cells[sprite] = new_range
+        return True
+
+    def remove(self, sprite):
+        """
+        Remove a sprite from the grid.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite to remove
+        """
+        cell_range = self.sprite_cells.pop(sprite, None)
+        if cell_range is None:
+            return
+        self._remove_from_cells(sprite, cell_range)
+        del self.sprite_order[sprite]
+
+    def _remove_from_cells(self, sprite, cell_range):
+        """Remove a sprite from every cell in a cell range, dropping empty cells."""
+        for cell in self._cells_in_range(cell_range):
+            cell_sprites = self.grid.get(cell)
+            if cell_sprites is None:
+                continue
+            cell_sprites.remove(sprite)
+            if not cell_sprites:
+                del self.grid[cell]
+
+    def refresh(self, *groups):
+        """
+        Bring the grid in sync with sprite groups. Call once per frame after updates.
+        New sprites are inserted, moved sprites are re-bucketed only if they crossed
+        a cell boundary, and sprites no longer in any of the groups are removed.
+
+        Args:
+            *groups (pygame.sprite.Group): Groups whose sprites the grid tracks
+        """
+        current = set()
+        for group in groups:
+            for sprite in group:
+                current.add(sprite)
+                if sprite in self.sprite_cells:
+                    self.move(sprite)
+                else:
+                    self.insert(sprite)
+
+        # Drop sprites that were killed or removed from their groups
+        if len(self.sprite_cells) > len(current):
+            for sprite in [s for s in self.sprite_cells if s not in current]:
+                self.remove(sprite)
+
+    def query(self, rect):
+        """
+        Get all sprites in the cells a rectangle overlaps.
+
+        Args:
+            rect (pygame.Rect): Rectangle to look around
+
+        Returns:
+            set: Set of sprites in the overlapped cells
+        """
+        nearby = set()
+        for cell in self._get_cells_for_rect(rect):
+            cell_sprites = self.grid.get(cell)
+            if cell_sprites:
+                nearby.update(cell_sprites)
+        return nearby
+
     def get_nearby(self, sprite):
         """
         Get all sprites in the same or adjacent cells as the given sprite.
@@ -86,15 +435,8 @@ class SpatialGrid:
         Returns:
             set: Set of nearby sprites (excludes the query sprite itself)
         """
-        nearby = set()
-        cells = self._get_cells_for_rect(sprite.rect)
-
-        for cell in cells:
-            if cell in self.grid:
-                for other_sprite in self.grid[cell]:
-                    if other_sprite != sprite:
-                        nearby.add(other_sprite)
-
+        nearby = self.query(sprite.rect)
+        nearby.discard(sprite)
         return nearby
 
 
@@ -201,21 +543,327 @@ class AssetCache:
         self.fonts.clear()
 
 
+class FrameCache:
+    """
+    Registry of procedurally drawn sprite frames shared by every instance of an entity.
+    Entity modules register a builder per frame set; the frames are drawn once per
+    process, on first use or when prewarmed during level load, so spawning an entity
+    mid-gameplay never draws anything.
+    """
+
+    def __init__(self):
+        """Initialize an empty frame cache."""
+        self.builders = {}  # Dictionary mapping frame set name to the function drawing it
+        self.frames = {}  # Dictionary mapping frame set name to its drawn frames
+
+    def register(self, name, builder):
+        """
+        Register a frame set.
+
+        Args:
+            name (str): Frame set name
+            builder (callable): Function without arguments returning the frames
+        """
+        self.builders[name] = builder
+
+    def get(self, name):
+        """
+        Get a frame set, drawing it on first use.
+
+        Args:
+            name (str): Registered frame set name
+
+        Returns:
+            object: Whatever the builder returned (a surface, list or dict of surfaces)
+        """
+        frames = self.frames.get(name)
+        if frames is None:
+            frames = self.frames[name] = self.builders[name]()
+        return frames
+
+    def prewarm(self, names=None):
+        """
+        Draw frame sets ahead of time.
+
+        Args:
+            names (iterable): Frame set names to draw, or None for every registered set
+
+        Returns:
+            list: Names of the frame sets drawn by this call
+        """
+        drawn = []
+        for name in (self.builders if names is None else names):
+            if name not in self.frames:
+                self.get(name)
+                drawn.append(name)
+        return drawn
+
+    def clear(self):
+        """Forget every drawn frame set (they are redrawn on next use)."""
+        self.frames.clear()
+
+
+# Frame sets shared by the entity classes (see the register() calls in src/entities)
+shared_frames = FrameCache()
+
+
+class ObjectPool:
+    """
+    Free list of reusable objects for short-lived entities spawned in bursts
+    (projectiles, particles). Released objects are kept and handed out again,
+    reset to a fresh state, instead of being reallocated.
+
+    Pooled objects need a reset() method taking the same arguments as the factory.
+    """
+
+    def __init__(self, factory, max_size=256, on_reuse=None):
+        """
+        Initialize an empty pool.
+
+        Args:
+            factory (callable): Creates a new object from the acquire() arguments
+            max_size (int): Maximum number of free objects kept (extra releases are dropped)
+            on_reuse (callable): Optional function called with every object handed out again
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.on_reuse = on_reuse
+        self.free = []  # Released objects waiting to be reused
+
+        # Statistics
+        self.hits = 0  # Acquires served from the free list
+        self.misses = 0  # Acquires that had to create an object
+        self.in_use = 0  # Objects acquired and not released yet
+        self.high_water = 0  # Most objects in use at the same time
+
+    def acquire(self, *args):
+        """
+        Get an object, reusing a released one when available.
+
+        Args:
+            *args: Arguments for the factory, or for reset() when reusing
+
+        Returns:
+            object: Fresh or reset object
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.hits += 1
+            if self.on_reuse is not None:
+                self.on_reuse(obj)
+        else:
+            obj = self.factory(*args)
+            obj.pool = self
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """
+        Return an object to the pool. It must no longer be used by the caller.
+
+        Args:
+            obj (object): Object previously returned by acquire()
+        """
+        if self.in_use > 0:
+            self.in_use -= 1
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    def get_stats(self):
+        """
+        Get pool statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate, objects in use and free, and the high-water mark
+        """
+        acquires = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / acquires, 3) if acquires else 0.0,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water,
+        }
+
+    def clear(self):
+        """Drop every free object and reset the statistics."""
+        self.free.clear()
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    """
+    Sprite that returns itself to the ObjectPool that created it when killed.
+    Sprites created directly (not through a pool) behave like normal sprites.
+    """
+
+    pool = None  # Set on the instances an ObjectPool creates
+
+    def kill(self):
+        """Remove the sprite from all groups and hand it back to its pool."""
+        if self.pool is not None and self.alive():
+            super().kill()
+            self.pool.release(self)
+        else:
+            super().kill()
+
+
+class CullingIndex:
+    """
+    Index of a sprite group for camera culling, kept up to date by the group.
+
+    Sprites that stay within a fixed horizontal range (patrolling enemies, power-ups,
+    the goal) declare it with get_x_range() and are kept sorted by it, so finding
+    the ones near the camera window is a bisection. Other sprites (the player,
+    projectiles) are few and are returned every time. The group reports each sprite
+    joining or leaving, so syncing and querying never touch the sprites outside
+    the window.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.order = {}  # Dictionary mapping sprite to its position in the group (draw order)
+        self.next_order = 0  # Position of the next sprite added
+        self.moving = set()  # Sprites without a fixed horizontal range
+        self.ranged = set()  # Sprites with one
+        self.needs_sort = False  # Ranged sprites joined or left since the last sync
+        self.sorted_sprites = []  # Ranged sprites sorted by the left end of their range
+        self.lefts = []  # Left ends of their ranges, for bisection
+        self.rights = []  # Right ends of their ranges
+        self.max_span = 0  # Widest range - how far left of a window a range can start and reach into it
+
+    def add(self, sprite):
+        """
+        Index a sprite that joined the group (it goes last in draw order, like in the group).
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite added
+        """
+        self.order[sprite] = self.next_order
+        self.next_order += 1
+        if hasattr(sprite, "get_x_range"):
+            self.ranged.add(sprite)
+            self.needs_sort = True
+        else:
+            self.moving.add(sprite)
+
+    def remove(self, sprite):
+        """
+        Forget a sprite that left the group.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite removed
+        """
+        del self.order[sprite]
+        if sprite in self.ranged:
+            self.ranged.remove(sprite)
+            self.needs_sort = True
+        else:
+            self.moving.discard(sprite)
+
+    def sync(self):
+        """Sort the ranged sprites again if any joined or left. Call before querying each frame."""
+        if not self.needs_sort:
+            return
+        self.needs_sort = False
+        entries = sorted((sprite.get_x_range(), self.order[sprite], sprite) for sprite in self.ranged)
+        self.sorted_sprites = [sprite for _, _, sprite in entries]
+        self.lefts = [left for (left, _), _, _ in entries]
+        self.rights = [right for (_, right), _, _ in entries]
+        self.max_span = max((right - left for (left, right), _, _ in entries), default=0)
+
+    def query(self, left, right):
+        """
+        Get the sprites that may overlap a horizontal range, in group order.
+
+        Args:
+            left (int): Left edge of the range (world x)
+            right (int): Right edge of the range (world x)
+
+        Returns:
+            list: Ranged sprites whose range overlaps, plus every moving sprite
+        """
+        start = bisect.bisect_left(self.lefts, left - self.max_span)
+        stop = bisect.bisect_right(self.lefts, right)
+        rights = self.rights
+        found = [self.sorted_sprites[i] for i in range(start, stop) if rights[i] >= left]
+        found.extend(self.moving)
+        found.sort(key=self.order.__getitem__)
+        return found
+
+
+class CullableGroup(pygame.sprite.Group):
+    """
+    Sprite group with a CullingIndex, updated as sprites join and leave the group.
+    OptimizedRenderer.draw_sprites_with_offset() only visits the sprites near the
+    camera window in these groups.
+    """
+
+    def __init__(self, *sprites):
+        """
+        Args:
+            *sprites: Sprites to add to the group
+        """
+        self.culling_index = CullingIndex()
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.culling_index.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.culling_index.remove(sprite)
+
+
 class OptimizedRenderer:
     """
     Optimized rendering system with dirty rectangle tracking and sprite batching.
+
+    In dirty rectangle mode a gameplay frame only restores the background under what
+    was drawn the frame before and sends the changed areas to the display; frames where
+    the camera scrolled are drawn and flipped whole. Screens outside gameplay (menus,
+    pause, game over) are only drawn again when they change.
+
+    Usage per gameplay frame:
+        renderer.begin_frame((level, camera_x), draw_background)
+        renderer.draw_sprites_with_offset(...)  # Drawn areas are tracked
+        renderer.mark_dirty(text_renderer.draw_text(...))  # And anything else drawn
+        renderer.update_display()
     """
 
-    def __init__(self, screen):
+    CULL_MARGIN = 50  # Pixels around the screen where sprites are still drawn (partially visible)
+
+    def __init__(self, screen, use_dirty_rects=True):
         """
         Initialize optimized renderer.
 
         Args:
             screen (pygame.Surface): Game screen surface
+            use_dirty_rects (bool): Update only the changed areas of the display
+                (False draws and flips every frame whole)
         """
         self.screen = screen
-        self.background = None
-        self.dirty_rects = []
+        self.use_dirty_rects = use_dirty_rects
+        self.background = None  # Snapshot of the background under the sprites
+        self.background_key = None  # What the background shows (None = must be drawn)
+        self.static_key = None  # Screen shown outside gameplay (None = must be drawn)
+        self.dirty_rects = []  # Screen areas drawn this frame
+        self.previous_rects = []  # Screen areas drawn last frame
+        self.full_frame = True  # This frame is shown whole
+
+        # Statistics
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.skipped_frames = 0
 
     def set_background(self, background):
         """
@@ -226,54 +874,158 @@ class OptimizedRenderer:
         """
         self.background = background
 
-    def draw_sprites_with_offset(self, sprites, camera_x):
+    def invalidate(self):
+        """Draw and show the next frame whole (e.g. after the window was exposed)."""
+        self.background = None
+        self.background_key = None
+        self.static_key = None
+
+    def begin_frame(self, background_key, draw_background):
+        """
+        Start a gameplay frame.
+        The background (everything under the sprites) is drawn by draw_background when
+        background_key changes - the camera scrolled or another level is shown - and the
+        frame is then shown whole. While the key stays the same the background is kept
+        as a snapshot and only the areas drawn last frame are restored from it.
+
+        Args:
+            background_key: Value identifying what the background shows, e.g. (level, camera_x)
+            draw_background (callable): Function drawing the background on the screen
+        """
+        self.previous_rects, self.dirty_rects = self.dirty_rects, []
+        self.static_key = None
+
+        if not self.use_dirty_rects or background_key != self.background_key:
+            # Scrolling: the whole screen changes, no point keeping a snapshot
+            draw_background()
+            self.background = None
+            self.background_key = background_key
+            self.full_frame = True
+        elif self.background is None:
+            # The camera stopped: keep the background from now on
+            draw_background()
+            self.background = self.screen.copy()
+            self.full_frame = False
+        else:
+            for rect in self.previous_rects:
+                self.screen.blit(self.background, rect, rect)
+            self.full_frame = False
+
+    def mark_dirty(self, rect):
+        """
+        Track an area drawn this frame outside draw_sprites_with_offset (HUD, overlays...).
+
+        Args:
+            rect (pygame.Rect): Drawn screen area (ignored if None)
+        """
+        if rect is not None:
+            self.dirty_rects.append(self.screen.get_rect().clip(rect))
+
+    def begin_static_frame(self, key):
+        """
+        Check whether a screen outside gameplay must be drawn this frame.
+        Menus, pause and game over screens don't animate, so they are drawn once and
+        the display is left alone until key changes or invalidate() is called.
+
+        Args:
+            key: Value identifying what the screen shows (state, selection...)
+
+        Returns:
+            bool: True if the screen must be drawn and update_display() called
+        """
+        self.background = None
+        self.background_key = None  # Gameplay is drawn whole when it resumes
+        self.dirty_rects = []
+        self.full_frame = True
+        if self.use_dirty_rects and key is not None and key == self.static_key:
+            self.skipped_frames += 1
+            return False
+        self.static_key = key
+        return True
+
+    def is_static_frame_shown(self):
+        """
+        Check whether a static screen is shown and up to date.
+
+        Returns:
+            bool: True if nothing needs drawing until input arrives or the screen's key changes
+        """
+        return self.static_key is not None
+
+    def update_display(self):
+        """Show this frame: flip whole frames, update only the changed areas otherwise."""
+        if self.full_frame:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            # Areas drawn last frame were restored, areas drawn this frame are new
+            pygame.display.update(self.previous_rects + self.dirty_rects)
+            self.partial_frames += 1
+
+    def draw_sprites_with_offset(self, sprites, camera_x, previous_positions=None, alpha=1.0):
         """
         Draw sprites with camera offset efficiently.
-        Uses screen culling to skip sprites outside the visible area.
+        Uses screen culling to skip sprites outside the visible area. CullableGroups are
+        looked up in their culling index, so only sprites near the camera window are
+        visited; other groups and iterables are walked whole.
+
+        When previous_positions is given, each sprite is drawn between its position
+        before the last simulation step and its current position, so motion stays
+        smooth when rendering runs faster than the fixed 60 Hz update.
+
+        Sprites with a draw_behind(surface, offset_x, offset_y) method (the player's
+        aura) get to draw behind themselves first.
 
         Args:
-            sprites (pygame.sprite.Group or list): Sprites to draw
+            sprites (CullableGroup, pygame.sprite.Group or list): Sprites to draw
             camera_x (int): Camera horizontal offset
+            previous_positions (dict): Optional sprite -> (x, y) before the last step
+            alpha (float): Interpolation factor between previous and current position (0-1)
 
         Returns:
             int: Number of sprites actually drawn (for debugging)
         """
         screen_width = self.screen.get_width()
         screen_height = self.screen.get_height()
+        # Add margin for partially visible sprites
+        margin = self.CULL_MARGIN
         drawn_count = 0
 
+        if isinstance(sprites, CullableGroup):
+            index = sprites.culling_index
+            index.sync()
+            sprites = index.query(camera_x - margin, camera_x + screen_width + margin)
+
         for sprite in sprites:
+            rect = sprite.rect
+            x, y = rect.x, rect.y
+            # Interpolate between the last two simulation steps (fixed timestep)
+            if previous_positions:
+                previous = previous_positions.get(sprite)
+                if previous is not None:
+                    x = round(previous[0] + (x - previous[0]) * alpha)
+                    y = round(previous[1] + (y - previous[1]) * alpha)
+
             # Calculate sprite's screen position
-            screen_x = sprite.rect.x - camera_x
+            screen_x = x - camera_x
 
             # Screen culling: skip sprites outside visible area
-            # Add margin for partially visible sprites
-            margin = 50
-            if (screen_x + sprite.rect.width < -margin or
+            if (screen_x + rect.width < -margin or
                 screen_x > screen_width + margin or
-                sprite.rect.y + sprite.rect.height < -margin or
-                sprite.rect.y > screen_height + margin):
+                y + rect.height < -margin or
+                y > screen_height + margin):
                 continue
 
-            # Check if sprite is a Player with powered-up aura (DBZ Super Saiyan style)
-            # Import Player class locally to avoid circular imports
-            from src.entities.player import Player
-
-            if isinstance(sprite, Player):
-                # Draw aura behind the player if powered up
-                aura_surface = sprite.get_aura_surface()
-                if aura_surface is not None:
-                    aura_pos = sprite.get_aura_position()
-                    if aura_pos:
-                        # Apply camera offset to aura position
-                        aura_screen_x = aura_pos[0] - camera_x
-                        aura_screen_y = aura_pos[1]
-                        self.screen.blit(aura_surface, (aura_screen_x, aura_screen_y))
+            # Draw hook for effects behind the sprite (e.g. the powered-up aura),
+            # shifted by the camera offset and the interpolation
+            draw_behind = getattr(sprite, "draw_behind", None)
+            if draw_behind is not None:
+                behind_rect = draw_behind(self.screen, screen_x - rect.x, y - rect.y)
+                if behind_rect is not None:
+                    self.dirty_rects.append(behind_rect)
 
             # Draw sprite at offset position
-            offset_rect = sprite.rect.copy()
-            offset_rect.x = screen_x
-            self.screen.blit(sprite.image, offset_rect)
+            self.dirty_rects.append(self.screen.blit(sprite.image, (screen_x, y)))
             drawn_count += 1
 
         return drawn_count
@@ -290,17 +1042,22 @@ def optimize_collision_detection(sprite, target_group, spatial_grid=None):
         spatial_grid (SpatialGrid): Optional spatial grid for optimization
 
     Returns:
-        list: List of sprites that collide with the given sprite
+        list: List of sprites from target_group that collide with the given sprite,
+            in the same order pygame.sprite.spritecollide would return them
     """
     if spatial_grid:
-        # Use spatial grid for optimization
+        # Use spatial grid for optimization - the grid may hold several groups,
+        # so only keep sprites that belong to the target group
         nearby = spatial_grid.get_nearby(sprite)
         collisions = []
 
         for other in nearby:
-            if sprite.rect.colliderect(other.rect):
+            if other in target_group and sprite.rect.colliderect(other.rect):
                 collisions.append(other)
 
+        if len(collisions) > 1:
+            collisions.sort(key=spatial_grid.sprite_order.__getitem__)
+
         return collisions
     else:
         # Fall back to standard pygame collision detection
@@ -0,0 +1,205 @@
+"""
+Cached overlay screens for Coffee Bros.
+Full-window screens shown on top of the frozen game (level complete, transition,
+victory, pause and game over) are composed once into a surface - the dimming layer
+plus all their text - and redrawn with a single alpha blit every frame they are shown.
+They are only composed again when a value they show (score, selection...) changes.
+"""
+
+import collections
+
+import pygame
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK
+from src.text_renderer import text_renderer
+
+
+class CachedOverlay:
+    """
+    Overlay screen composed by a function of the values it shows.
+    The composed surfaces of the most recent values are kept, so screens that
+    alternate between a few states (a blinking prompt, a menu selection) are not
+    composed again each time they switch.
+    """
+
+    def __init__(self, compose, alpha, color=BLACK, size=(WINDOW_WIDTH, WINDOW_HEIGHT), max_cached=2):
+        """
+        Initialize the overlay.
+
+        Args:
+            compose (callable): Function called with the shown values, returning
+                (surface, position) pairs to draw on the dimming layer
+            alpha (int): Opacity of the dimming layer (0-255)
+            color (tuple): RGB color of the dimming layer
+            size (tuple): Overlay size in pixels
+            max_cached (int): Number of composed surfaces kept
+        """
+        self.compose = compose
+        self.alpha = alpha
+        self.color = color
+        self.size = size
+        self.max_cached = max_cached
+        self.surfaces = collections.OrderedDict()  # Shown values -> composed surface
+        self.compose_count = 0  # Times a surface was composed (for tests and profiling)
+
+    def get_surface(self, *values):
+        """
+        Get the composed overlay for some values, composing it if needed.
+
+        Args:
+            *values: Values shown on the overlay (passed to the compose function)
+
+        Returns:
+            pygame.Surface: Overlay with per-pixel alpha
+        """
+        surface = self.surfaces.get(values)
+        if surface is not None:
+            self.surfaces.move_to_end(values)
+            return surface
+
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface.fill((*self.color, self.alpha))
+        for item, position in self.compose(*values):
+            surface.blit(item, position)
+        self.compose_count += 1
+
+        self.surfaces[values] = surface
+        if len(self.surfaces) > self.max_cached:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def draw(self, screen, *values):
+        """
+        Draw the overlay over the whole screen.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            *values: Values shown on the overlay (passed to the compose function)
+
+        Returns:
+            pygame.Rect: Area drawn
+        """
+        return screen.blit(self.get_surface(*values), (0, 0))
+
+    def clear(self):
+        """Forget the composed surfaces."""
+        self.surfaces.clear()
+
+
+def centered(surface, center):
+    """
+    Pair a surface with the rect that centers it on a point.
+
+    Args:
+        surface (pygame.Surface): Surface to place
+        center (tuple): Point to center it on
+
+    Returns:
+        tuple: (surface, rect) pair for a compose function
+    """
+    return surface, surface.get_rect(center=center)
+
+
+def compose_level_complete(score, completion_time):
+    """
+    Text of the level completion screen (US-023).
+
+    Args:
+        score (int): Current score
+        completion_time (float): Time taken to complete the level in seconds
+
+    Returns:
+        list: (surface, rect) pairs
+    """
+    big_font = text_renderer.get_font(72)
+    medium_font = text_renderer.get_font(48)
+    white = (255, 255, 255)
+    return [
+        # "LEVEL COMPLETE!" message in bright green
+        centered(text_renderer.render(big_font, "LEVEL COMPLETE!", (0, 255, 0)),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3)),
+        # Final score and completion time
+        centered(text_renderer.render(medium_font, f"Final Score: {score}", white),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)),
+        centered(text_renderer.render(medium_font, f"Time: {completion_time:.1f}s", white),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60)),
+    ]
+
+
+def compose_transition(level_name, level_number, score_earned, score, completion_time, show_prompt):
+    """
+    Text of the level transition screen (US-029).
+
+    Args:
+        level_name (str): Name of the completed level
+        level_number (int): Number of the completed level
+        score_earned (int): Score earned in the completed level
+        score (int): Total score
+        completion_time (float): Time taken to complete the level in seconds
+        show_prompt (bool): Show the blinking "Press any key to continue" prompt
+
+    Returns:
+        list: (surface, rect) pairs
+    """
+    big_font = text_renderer.get_font(72)
+    medium_font = text_renderer.get_font(48)
+    small_font = text_renderer.get_font(36)
+    white = (255, 255, 255)
+    items = [
+        # "Level Complete!" title in bright green
+        centered(text_renderer.render(big_font, "Level Complete!", (0, 255, 0)),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 6)),
+        # Level name and number
+        centered(text_renderer.render(medium_font, f"{level_name} (Level {level_number})", white),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 6 + 80)),
+        # Score earned in this level (gold), total score and time taken
+        centered(text_renderer.render(medium_font, f"Score Earned: {score_earned}", (255, 215, 0)),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40)),
+        centered(text_renderer.render(small_font, f"Total Score: {score}", white),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20)),
+        centered(text_renderer.render(medium_font, f"Time: {completion_time:.1f}s", white),
+                 (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80)),
+    ]
+    if show_prompt:
+        items.append(centered(text_renderer.render(small_font, "Press any key to continue", (200, 200, 200)),
+                              (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100)))
+    return items
+
+
+def compose_victory(score, total_time):
+    """
+    Text of the victory screen (US-030).
+
+    Args:
+        score (int): Total score
+        total_time (float): Total time played across all levels in seconds
+
+    Returns:
+        list: (surface, rect) pairs
+    """
+    huge_font = text_renderer.get_font(96)  # Extra large for main title
+    big_font = text_renderer.get_font(72)
+    medium_font = text_renderer.get_font(48)
+    small_font = text_renderer.get_font(36)
+
+    # Colombian flag colors for celebration theme
+    yellow_col = (255, 209, 0)  # Colombian yellow
+    gold_col = (255, 215, 0)    # Gold for highlights
+    light_gray = (200, 200, 200)
+
+    return [
+        # Main congratulations message - Spanish for "Congratulations!"
+        centered(text_renderer.render(huge_font, "¡FELICIDADES!", yellow_col), (WINDOW_WIDTH // 2, 80)),
+        centered(text_renderer.render(big_font, "You completed Coffee Bros!", (255, 255, 255)),
+                 (WINDOW_WIDTH // 2, 180)),
+        # Total score and time played
+        centered(text_renderer.render(medium_font, f"Total Score: {score}", gold_col), (WINDOW_WIDTH // 2, 270)),
+        centered(text_renderer.render(medium_font, f"Total Time: {total_time:.1f}s", gold_col),
+                 (WINDOW_WIDTH // 2, 330)),
+        # Colombian-themed celebration message - "You're the best coffee grower!"
+        centered(text_renderer.render(small_font, "¡Eres el mejor cafetero!", yellow_col), (WINDOW_WIDTH // 2, 400)),
+        # Options
+        centered(text_renderer.render(small_font, "Press R to Restart", light_gray), (WINDOW_WIDTH // 2, 460)),
+        centered(text_renderer.render(small_font, "Press M to Return to Menu", light_gray), (WINDOW_WIDTH // 2, 510)),
+        centered(text_renderer.render(small_font, "Press Q or ESC to Quit", light_gray), (WINDOW_WIDTH // 2, 560)),
+    ]
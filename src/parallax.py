@@ -0,0 +1,199 @@
+"""
+Parallax background layers for Coffee Bros.
+Levels can declare several background layers that scroll at different speeds
+to give the scene depth. Each layer is prepared once at level load so drawing
+the whole stack is a handful of blits per frame.
+"""
+
+import pygame
+
+
+class ParallaxLayer:
+    """
+    One background layer, repeated horizontally across the level.
+    The image is converted once and, if narrower than the window, tiled into a
+    strip one window plus one tile wide so any scroll offset needs at most two blits.
+    """
+
+    def __init__(self, image, scroll_factor=1.0, y=0, window_width=800):
+        """
+        Prepare a parallax layer.
+
+        Args:
+            image (pygame.Surface): Layer image (transparent pixels show the layers behind)
+            scroll_factor (float): Fraction of the camera movement the layer follows
+                (0 = fixed to the screen, 1 = moves with the level)
+            y (int): Vertical screen position of the layer's top edge
+            window_width (int): Width of the game window
+        """
+        self.scroll_factor = scroll_factor
+        self.y = y
+        self.tile_width = image.get_width()
+        self.height = image.get_height()
+        self.is_opaque = not image.get_flags() & pygame.SRCALPHA
+
+        # Convert once so every blit is a straight copy instead of a format conversion
+        image = image.convert() if self.is_opaque else image.convert_alpha()
+
+        if self.tile_width >= window_width:
+            self.surface = image
+        else:
+            # Enough whole tiles to cover the window at any scroll offset
+            tile_count = -(-window_width // self.tile_width) + 1
+            flags = 0 if self.is_opaque else pygame.SRCALPHA
+            self.surface = pygame.Surface((self.tile_width * tile_count, self.height), flags)
+            self.surface = self.surface.convert() if self.is_opaque else self.surface.convert_alpha()
+            for i in range(tile_count):
+                self.surface.blit(image, (i * self.tile_width, 0))
+
+        if not self.is_opaque:
+            # Run-length encode transparent layers - blits then skip transparent runs
+            self.surface.set_alpha(255, pygame.RLEACCEL)
+
+    def get_offset(self, camera_x):
+        """
+        Get the layer's scroll offset within one tile for a camera position.
+
+        Args:
+            camera_x (float): Camera horizontal offset
+
+        Returns:
+            int: Horizontal offset into the layer surface (0 to tile_width - 1)
+        """
+        return int(camera_x * self.scroll_factor) % self.tile_width
+
+    def covers(self, window_width, window_height):
+        """Check if the layer fully hides everything behind it."""
+        return self.is_opaque and self.y <= 0 and self.y + self.height >= window_height
+
+    def draw(self, target, offset, window_width):
+        """
+        Draw the layer at a scroll offset.
+
+        Args:
+            target (pygame.Surface): Surface to draw on
+            offset (int): Scroll offset from get_offset()
+            window_width (int): Width of the game window
+
+        Returns:
+            int: Number of blits made
+        """
+        target.blit(self.surface, (0, self.y), (offset, 0, window_width, self.height))
+        blits = 1
+
+        # Wrap around to the start of the surface when the visible span runs past its end
+        surface_width = self.surface.get_width()
+        screen_x = surface_width - offset
+        while screen_x < window_width:
+            target.blit(self.surface, (screen_x, self.y))
+            screen_x += surface_width
+            blits += 1
+        return blits
+
+
+class ParallaxBackground:
+    """
+    Stack of parallax layers drawn back to front.
+
+    Work that does not change between frames is not repeated:
+    - Layers hidden behind an opaque full-window layer are dropped.
+    - The fill color and any leading static layers (scroll factor 0) are baked
+      into one base surface when the background is built.
+    - When the camera stops, the composed stack is kept and reused with a single
+      blit until the camera moves again.
+    """
+
+    def __init__(self, layers, window_width, window_height, fill_color=(0, 0, 0)):
+        """
+        Build a parallax background.
+
+        Args:
+            layers (list): ParallaxLayer objects, back to front
+            window_width (int): Width of the game window
+            window_height (int): Height of the game window
+            fill_color (tuple): RGB color shown where no layer covers the window
+        """
+        self.window_width = window_width
+        self.window_height = window_height
+
+        # Layers behind one that covers the whole window are never visible
+        for index in range(len(layers) - 1, -1, -1):
+            if layers[index].covers(window_width, window_height):
+                layers = layers[index:]
+                break
+
+        # Leading static layers never move - bake them into the base with the fill color
+        static_count = 0
+        while static_count < len(layers) and layers[static_count].scroll_factor == 0:
+            static_count += 1
+        self.moving_layers = layers[static_count:]
+
+        self.base = None
+        if static_count or not (self.moving_layers and self.moving_layers[0].covers(window_width, window_height)):
+            self.base = pygame.Surface((window_width, window_height)).convert()
+            self.base.fill(fill_color)
+            for layer in layers[:static_count]:
+                layer.draw(self.base, 0, window_width)
+
+        self.composite = None  # Composed stack, kept while the camera is still
+        self.composite_offsets = None  # Layer offsets the composite was drawn with
+        self.last_offsets = None  # Layer offsets drawn last frame
+
+    @classmethod
+    def from_level(cls, level, window_width, window_height):
+        """
+        Build the parallax background a level declares.
+
+        Args:
+            level (Level): Loaded level
+            window_width (int): Width of the game window
+            window_height (int): Height of the game window
+
+        Returns:
+            ParallaxBackground: The level's background, or None if it declares no layers
+        """
+        if not level.parallax_layers:
+            return None
+        fill_color = tuple(level.metadata.get("background_color", (0, 0, 0)))
+        return cls(level.parallax_layers, window_width, window_height, fill_color)
+
+    def _compose(self, target, offsets):
+        """Draw the base and every moving layer onto a surface."""
+        blits = 0
+        if self.base is not None:
+            target.blit(self.base, (0, 0))
+            blits += 1
+        for layer, offset in zip(self.moving_layers, offsets):
+            blits += layer.draw(target, offset, self.window_width)
+        return blits
+
+    def draw(self, screen, camera_x):
+        """
+        Draw the background for a camera position.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on
+            camera_x (float): Camera horizontal offset
+
+        Returns:
+            int: Number of blits onto the screen (for debugging)
+        """
+        offsets = tuple(layer.get_offset(camera_x) for layer in self.moving_layers)
+
+        if offsets == self.composite_offsets:
+            # Nothing moved since the stack was composed
+            screen.blit(self.composite, (0, 0))
+            return 1
+
+        if offsets == self.last_offsets:
+            # Camera just stopped - compose once and reuse it until it moves again
+            if self.composite is None:
+                self.composite = pygame.Surface((self.window_width, self.window_height)).convert()
+            self._compose(self.composite, offsets)
+            self.composite_offsets = offsets
+            screen.blit(self.composite, (0, 0))
+            return 1
+
+        self.composite_offsets = None
+        self.last_offsets = offsets
+        return self._compose(screen, offsets)
@@ -1,12 +1,161 @@
 """
 Performance monitoring system for Coffee Bros.
 Tracks FPS, frame time, and memory usage to ensure smooth gameplay.
+Named timing sections break the frame time down by subsystem.
 """
 
+import collections
+import json
 import pygame
+import threading
 import time
 import psutil
 import os
+from array import array
+
+# Frame phases main.py and GameSession time, in frame order (shown in this order in the overlay)
+FRAME_SECTIONS = ("input", "physics", "collisions", "particles", "background", "sprites", "hud", "flip")
+
+
+class RingBuffer:
+    """
+    Fixed-size, array-backed window of float samples with a running sum.
+    Appending is O(1); percentiles sort a copy of the window only when requested.
+    """
+
+    def __init__(self, size):
+        """
+        Args:
+            size (int): Number of samples kept
+        """
+        self.size = size
+        self.values = array('d', bytes(8 * size))  # Zero-filled doubles
+        self.index = 0  # Next slot to write
+        self.count = 0  # Valid samples (up to size)
+        self.total = 0.0  # Running sum of valid samples
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        """Add a sample, replacing the oldest once the window is full."""
+        if self.count == self.size:
+            self.total -= self.values[self.index]
+        else:
+            self.count += 1
+        self.values[self.index] = value
+        self.total += value
+        self.index = (self.index + 1) % self.size
+
+    def clear(self):
+        """Remove all samples."""
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def samples(self):
+        """Valid samples (in storage order, not time order)."""
+        return self.values[:self.count]
+
+    def mean(self):
+        """Average of the window, or 0 when empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def max(self):
+        """Largest sample in the window, or 0 when empty."""
+        return max(self.samples()) if self.count else 0.0
+
+    def percentiles(self, *pcts):
+        """
+        Nearest-rank percentiles of the window.
+
+        Args:
+            *pcts (float): Percentiles between 0 and 100
+
+        Returns:
+            list: One value per requested percentile (0 when empty)
+        """
+        if not self.count:
+            return [0.0 for _ in pcts]
+        ordered = sorted(self.samples())
+        last = self.count - 1
+        return [ordered[min(last, max(0, int(self.count * pct / 100.0 + 0.5) - 1))] for pct in pcts]
+
+
+class MemorySampler(threading.Thread):
+    """
+    Background thread polling the process RSS every interval seconds, so the
+    memory_info() syscall stays off the game loop.
+    """
+
+    def __init__(self, process, interval=1.0):
+        """
+        Args:
+            process (psutil.Process): Process to sample
+            interval (float): Seconds between samples
+        """
+        super().__init__(name="MemorySampler", daemon=True)
+        self.process = process
+        self.interval = interval
+        self.memory_mb = process.memory_info().rss / 1024 / 1024
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.memory_mb = self.process.memory_info().rss / 1024 / 1024
+            except psutil.Error:
+                break
+
+    def stop(self):
+        """Stop sampling (the thread exits within one interval)."""
+        self._stop_event.set()
+
+
+class _Section:
+    """Context manager timing one named section of a PerformanceMonitor."""
+
+    def __init__(self, monitor, name):
+        self.monitor = monitor
+        self.name = name
+
+    def __enter__(self):
+        self.monitor.begin_section(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.monitor.end_section(self.name)
+        return False
+
+
+class NullProfiler:
+    """
+    Stand-in for PerformanceMonitor when sections are not being timed.
+    Lets code call begin_section/end_section unconditionally.
+    """
+
+    def begin_section(self, name):
+        pass
+
+    def end_section(self, name):
+        pass
+
+    def section(self, name):
+        return _NULL_SECTION
+
+
+class _NullSection:
+    """No-op context manager returned by NullProfiler.section()"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+NULL_PROFILER = NullProfiler()
 
 
 class PerformanceMonitor:
@@ -15,24 +164,27 @@ class PerformanceMonitor:
     Helps identify performance bottlenecks and ensure 60 FPS target is maintained.
     """
 
-    def __init__(self, target_fps=60, sample_size=60):
+    def __init__(self, target_fps=60, sample_size=60, memory_interval=1.0):
         """
         Initialize performance monitor.
 
         Args:
             target_fps (int): Target frames per second (default: 60)
             sample_size (int): Number of frames to average for metrics (default: 60)
+            memory_interval (float): Seconds between background memory samples (default: 1.0)
         """
         self.target_fps = target_fps
         self.sample_size = sample_size
 
         # FPS tracking
-        self.frame_times = []  # List of frame times (in milliseconds)
-        self.last_frame_time = time.time()
+        self.frame_times = RingBuffer(sample_size)  # Frame times (in milliseconds)
+        self.last_frame_time = time.perf_counter()
 
-        # Memory tracking
+        # Memory tracking - sampled on a background thread
         self.process = psutil.Process(os.getpid())
-        self.initial_memory = self.process.memory_info().rss / 1024 / 1024  # MB
+        self.memory_sampler = MemorySampler(self.process, memory_interval)
+        self.initial_memory = self.memory_sampler.memory_mb  # MB
+        self.memory_sampler.start()
 
         # Performance statistics
         self.current_fps = 0
@@ -44,33 +196,163 @@ class PerformanceMonitor:
         self.fps_drop_detected = False
         self.memory_leak_detected = False
 
+        # Per-section timing: time spent in each section this frame, and the last
+        # sample_size per-frame totals for every section seen so far
+        self.section_totals = {}  # Section name -> ms accumulated this frame
+        self.section_samples = collections.OrderedDict((name, RingBuffer(sample_size))
+                                                       for name in FRAME_SECTIONS)
+        self._section_starts = {}
+        self._sections = {}  # Cached context managers
+        self._font = None
+
+        # Object pools whose statistics are reported (name -> ObjectPool)
+        self.pools = collections.OrderedDict()
+
+    def begin_section(self, name):
+        """
+        Start timing a named section of the frame.
+        A section may run several times per frame (e.g. one physics pass per
+        simulation step); its time is summed for the frame.
+
+        Args:
+            name (str): Section name (e.g. "physics")
+        """
+        self._section_starts[name] = time.perf_counter()
+
+    def end_section(self, name):
+        """
+        Stop timing a named section started with begin_section().
+
+        Args:
+            name (str): Section name
+        """
+        start = self._section_starts.pop(name, None)
+        if start is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.section_totals[name] = self.section_totals.get(name, 0.0) + elapsed
+
+    def section(self, name):
+        """
+        Time a block of code as a named section.
+
+        Usage:
+            with performance_monitor.section("hud"):
+                draw_hud()
+
+        Args:
+            name (str): Section name
+
+        Returns:
+            Context manager that times the block
+        """
+        timer = self._sections.get(name)
+        if timer is None:
+            timer = self._sections[name] = _Section(self, name)
+        return timer
+
+    def discard_sections(self):
+        """Drop section time accumulated this frame (e.g. on menu frames that are not measured)."""
+        self.section_totals.clear()
+        self._section_starts.clear()
+
+    def _commit_sections(self):
+        """Store this frame's section totals in the per-section sample windows."""
+        for name, total in self.section_totals.items():
+            samples = self.section_samples.get(name)
+            if samples is None:
+                samples = self.section_samples[name] = RingBuffer(self.sample_size)
+            samples.append(total)
+        self.section_totals.clear()
+
+    def get_section_stats(self):
+        """
+        Get per-section timing statistics over the sample window.
+
+        Returns:
+            collections.OrderedDict: Section name -> {"mean_ms", "p95_ms", "max_ms"}
+                for every section with samples, in frame order
+        """
+        stats = collections.OrderedDict()
+        for name, samples in self.section_samples.items():
+            if not samples:
+                continue
+            stats[name] = {
+                "mean_ms": round(samples.mean(), 3),
+                "p95_ms": round(samples.percentiles(95)[0], 3),
+                "max_ms": round(samples.max(), 3),
+            }
+        return stats
+
+    def register_pool(self, name, pool):
+        """
+        Report an object pool's statistics in the overlay and exported stats.
+
+        Args:
+            name (str): Name shown for the pool (e.g. "particles")
+            pool (ObjectPool): Pool to report
+        """
+        self.pools[name] = pool
+
+    def get_pool_stats(self):
+        """
+        Get the statistics of every registered object pool.
+
+        Returns:
+            collections.OrderedDict: Pool name -> ObjectPool.get_stats() dict, in registration order
+        """
+        return collections.OrderedDict((name, pool.get_stats()) for name, pool in self.pools.items())
+
+    def export_stats(self, path):
+        """
+        Write frame and per-section statistics to a JSON file.
+
+        Args:
+            path (str): Output file path
+
+        Returns:
+            bool: True if exported successfully, False otherwise
+        """
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "frame": self.get_stats(),
+            "sections": self.get_section_stats(),
+            "pools": self.get_pool_stats(),
+        }
+        try:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"Performance stats exported to {path}")
+            return True
+        except IOError as e:
+            print(f"Error exporting performance stats: {e}")
+            return False
+
     def update(self):
         """
         Update performance metrics. Call this once per frame.
         """
         # Calculate frame time
-        current_time = time.time()
+        current_time = time.perf_counter()
         frame_time = (current_time - self.last_frame_time) * 1000  # Convert to milliseconds
         self.last_frame_time = current_time
 
-        # Add to frame times list (keep only last sample_size frames)
+        # Add to frame time window (ring buffer keeps only the last sample_size frames)
         self.frame_times.append(frame_time)
-        if len(self.frame_times) > self.sample_size:
-            self.frame_times.pop(0)
 
-        # Calculate average FPS and frame time
-        if len(self.frame_times) > 0:
-            self.average_frame_time = sum(self.frame_times) / len(self.frame_times)
-            self.current_fps = 1000.0 / self.average_frame_time if self.average_frame_time > 0 else 0
+        # Calculate average FPS and frame time from the running sum
+        self.average_frame_time = self.frame_times.mean()
+        self.current_fps = 1000.0 / self.average_frame_time if self.average_frame_time > 0 else 0
 
-        # Update memory usage
-        memory_info = self.process.memory_info()
-        self.current_memory_mb = memory_info.rss / 1024 / 1024  # Convert bytes to MB
+        # Read the latest memory sample from the background thread
+        self.current_memory_mb = self.memory_sampler.memory_mb
         self.memory_delta_mb = self.current_memory_mb - self.initial_memory
 
         # Check for performance issues
         self._check_performance_warnings()
 
+        # Close out this frame's section timings
+        self._commit_sections()
+
     def _check_performance_warnings(self):
         """Check for performance issues and set warning flags."""
         # FPS drop detection (if average FPS is below 55, we have issues)
@@ -86,9 +368,13 @@ class PerformanceMonitor:
         Returns:
             dict: Dictionary containing performance metrics
         """
+        p50, p95, p99 = self.frame_times.percentiles(50, 95, 99)
         return {
             "fps": round(self.current_fps, 1),
             "frame_time_ms": round(self.average_frame_time, 2),
+            "frame_time_p50_ms": round(p50, 2),
+            "frame_time_p95_ms": round(p95, 2),
+            "frame_time_p99_ms": round(p99, 2),
             "memory_mb": round(self.current_memory_mb, 1),
             "memory_delta_mb": round(self.memory_delta_mb, 1),
             "fps_drop": self.fps_drop_detected,
@@ -103,8 +389,13 @@ class PerformanceMonitor:
             screen (pygame.Surface): Game screen surface
             x (int): X position for overlay (default: 10)
             y (int): Y position for overlay (default: 50)
+
+        Returns:
+            pygame.Rect: Area drawn
         """
-        font = pygame.font.Font(None, 24)
+        if self._font is None:
+            self._font = pygame.font.Font(None, 24)
+        font = self._font
         stats = self.get_stats()
 
         # Determine FPS color (green if good, red if bad)
@@ -112,16 +403,37 @@ class PerformanceMonitor:
 
         # Render FPS
         fps_text = font.render(f"FPS: {stats['fps']}", True, fps_color)
-        screen.blit(fps_text, (x, y))
+        drawn = screen.blit(fps_text, (x, y))
 
         # Render frame time
-        frame_time_text = font.render(f"Frame: {stats['frame_time_ms']}ms", True, (255, 255, 255))
-        screen.blit(frame_time_text, (x, y + 25))
+        frame_time_text = font.render(
+            f"Frame: {stats['frame_time_ms']}ms (p50 {stats['frame_time_p50_ms']} / "
+            f"p95 {stats['frame_time_p95_ms']} / p99 {stats['frame_time_p99_ms']})", True, (255, 255, 255))
+        drawn.union_ip(screen.blit(frame_time_text, (x, y + 25)))
 
         # Render memory usage
         memory_color = (0, 255, 0) if not stats["memory_leak"] else (255, 255, 0)
         memory_text = font.render(f"Memory: {stats['memory_mb']}MB (+{stats['memory_delta_mb']}MB)", True, memory_color)
-        screen.blit(memory_text, (x, y + 50))
+        drawn.union_ip(screen.blit(memory_text, (x, y + 50)))
+
+        # Render per-section breakdown (mean / p95 / max in ms)
+        section_y = y + 80
+        for name, section in self.get_section_stats().items():
+            section_text = font.render(
+                f"{name:<10} {section['mean_ms']:.2f} / {section['p95_ms']:.2f} / {section['max_ms']:.2f}ms",
+                True, (200, 200, 200))
+            drawn.union_ip(screen.blit(section_text, (x, section_y)))
+            section_y += 20
+
+        # Render object pool usage (reuse hits / new allocations / peak in use)
+        for name, pool in self.get_pool_stats().items():
+            pool_text = font.render(
+                f"{name:<10} {pool['hits']} hits / {pool['misses']} misses / peak {pool['high_water']}",
+                True, (200, 200, 200))
+            drawn.union_ip(screen.blit(pool_text, (x, section_y)))
+            section_y += 20
+
+        return drawn
 
     def is_performance_good(self):
         """
@@ -135,7 +447,14 @@ class PerformanceMonitor:
     def reset(self):
         """Reset performance statistics."""
         self.frame_times.clear()
-        self.last_frame_time = time.time()
-        self.initial_memory = self.process.memory_info().rss / 1024 / 1024
+        self.section_totals.clear()
+        for samples in self.section_samples.values():
+            samples.clear()
+        self.last_frame_time = time.perf_counter()
+        self.initial_memory = self.memory_sampler.memory_mb
         self.fps_drop_detected = False
         self.memory_leak_detected = False
+
+    def close(self):
+        """Stop the background memory sampler."""
+        self.memory_sampler.stop()
@@ -0,0 +1,180 @@
+"""
+Cached text rendering for Coffee Bros.
+Fonts come from a shared registry (AssetCache.get_font), rendered text is cached by
+(font, text, color), and numbers that change every few frames (score, timers) are
+composed from a cached digit-glyph atlas instead of being rasterized again.
+"""
+
+import collections
+import itertools
+
+import pygame
+
+from src.optimization import AssetCache
+
+DIGITS = "0123456789"
+
+
+class TextRenderer:
+    """
+    Font registry plus render caches.
+    Every font is loaded once and shared, so its surfaces can be cached by font object.
+    """
+
+    def __init__(self, asset_cache=None, max_cached=256):
+        """
+        Initialize the text renderer.
+
+        Args:
+            asset_cache (AssetCache): Cache the fonts are loaded through (a new one if None)
+            max_cached (int): Maximum number of rendered strings kept (least recently used are dropped)
+        """
+        self.asset_cache = asset_cache if asset_cache is not None else AssetCache()
+        self.max_cached = max_cached
+        self.rendered = collections.OrderedDict()  # (font, text, color) -> Surface, oldest first
+        self.composed = collections.OrderedDict()  # Same for text built from digit glyphs
+        self.digit_glyphs = {}  # (font, color) -> {digit: Surface}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+        # Font objects must not outlive pygame (using one after pygame.quit() crashes)
+        pygame.register_quit(self.clear)
+
+    def get_font(self, size, path=None):
+        """
+        Get a shared font.
+
+        Args:
+            size (int): Font size
+            path (str): Path to font file (or None for the default font)
+
+        Returns:
+            pygame.font.Font: Font object, the same one for every call with these arguments
+        """
+        return self.asset_cache.get_font(path, size)
+
+    def render(self, font, text, color):
+        """
+        Render antialiased text, reusing the surface from an earlier call when possible.
+        The returned surface is shared - blit it, don't modify it.
+
+        Args:
+            font (pygame.font.Font): Font from get_font()
+            text (str): Text to render
+            color (tuple): RGB text color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font, text, tuple(color))
+        surface = self._lookup(self.rendered, key)
+        if surface is None:
+            surface = self._store(self.rendered, key, font.render(text, True, color))
+        return surface
+
+    def _lookup(self, cache, key):
+        """Get a cached surface (marking it most recently used), or None."""
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+        return surface
+
+    def _store(self, cache, key, surface):
+        """Cache a new surface, dropping the least recently used one when full."""
+        self.misses += 1
+        cache[key] = surface
+        if len(cache) > self.max_cached:
+            cache.popitem(last=False)
+        return surface
+
+    def get_digit_glyphs(self, font, color):
+        """
+        Get the digit-glyph atlas of a font and color, rendering it on first use.
+
+        Args:
+            font (pygame.font.Font): Font from get_font()
+            color (tuple): RGB text color
+
+        Returns:
+            dict: Digit character -> rendered glyph surface
+        """
+        key = (font, tuple(color))
+        glyphs = self.digit_glyphs.get(key)
+        if glyphs is None:
+            glyphs = self.digit_glyphs[key] = {digit: font.render(digit, True, color) for digit in DIGITS}
+        return glyphs
+
+    def render_number_text(self, font, text, color):
+        """
+        Render text whose numbers change often (e.g. "SCORE: 00120").
+        Runs of digits are copied glyph by glyph from the digit atlas and everything
+        else goes through the render cache, so no text is rasterized when only the
+        numbers change. Digits are placed at their own advance without kerning, so a
+        number's width doesn't jitter as it counts.
+        The result is cached like render() - blit it, don't modify it.
+
+        Args:
+            font (pygame.font.Font): Font from get_font()
+            text (str): Text to render
+            color (tuple): RGB text color
+
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font, text, tuple(color))
+        surface = self._lookup(self.composed, key)
+        if surface is not None:
+            return surface
+
+        glyphs = self.get_digit_glyphs(font, color)
+        pieces = []
+        for is_number, run in itertools.groupby(text, DIGITS.__contains__):
+            if is_number:
+                pieces.extend(glyphs[digit] for digit in run)
+            else:
+                pieces.append(self.render(font, "".join(run), color))
+
+        surface = pygame.Surface((sum(piece.get_width() for piece in pieces), font.get_height()), pygame.SRCALPHA)
+        x = 0
+        for piece in pieces:
+            # MAX keeps the glyph pixels exactly as rendered (plain alpha blending onto
+            # the transparent surface would darken the antialiased edges)
+            surface.blit(piece, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            x += piece.get_width()
+        return self._store(self.composed, key, surface)
+
+    def draw_text(self, surface, font, text, color, **position):
+        """
+        Draw text whose numbers change often, see render_number_text().
+
+        Usage:
+            text_renderer.draw_text(screen, font, f"SCORE: {score:05d}", WHITE, topleft=(10, 10))
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            font (pygame.font.Font): Font from get_font()
+            text (str): Text to draw
+            color (tuple): RGB text color
+            **position: pygame.Rect position attributes for the text (topleft, center, midtop, ...)
+
+        Returns:
+            pygame.Rect: Area the text was drawn in
+        """
+        text_surface = self.render_number_text(font, text, color)
+        rect = text_surface.get_rect(**position)
+        surface.blit(text_surface, rect)
+        return rect
+
+    def clear(self):
+        """Forget every font and rendered surface."""
+        self.rendered.clear()
+        self.composed.clear()
+        self.digit_glyphs.clear()
+        self.asset_cache.fonts.clear()
+
+
+# Shared by the HUD, the overlay screens, the menus and the level name display
+text_renderer = TextRenderer()
@@ -0,0 +1,158 @@
+"""
+Animation Allocation Test for Coffee Bros
+Verifies Player.update and Polocho.update allocate no new surfaces per frame once
+animation reaches steady state (frames come from shared, pre-flipped caches), and
+that spawning and squashing Polochos reuses the shared frame set.
+
+Uses tracemalloc: every image produced during the measured frames is kept alive,
+so any surface created by copy() or transform.flip() shows up in the snapshot diff.
+"""
+
+import collections
+import contextlib
+import io
+import os
+import sys
+import tracemalloc
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.entities.player import Player
+from src.entities.polocho import Polocho
+from src.entities.platform import Platform
+
+WARMUP_FRAMES = 120
+MEASURED_FRAMES = 600
+NUM_POLOCHOS = 10
+ENTITY_FILES = ("player.py", "polocho.py")
+
+
+def player_keys(frame):
+    """Key state that walks right, idles, walks left and jumps so every animation runs"""
+    phase = frame % 240
+    keys = collections.defaultdict(bool)
+    if phase < 80:
+        keys[pygame.K_RIGHT] = True
+    elif 120 <= phase < 200:
+        keys[pygame.K_LEFT] = True
+    if phase in (60, 180):
+        keys[pygame.K_SPACE] = True
+    return keys
+
+
+def run_frames(player, enemies, platforms, frames, start_frame, images=None):
+    """Step the player and enemies, optionally keeping every image they produce"""
+    for frame in range(start_frame, start_frame + frames):
+        player.update(player_keys(frame), platforms, 5000)
+        for enemy in enemies:
+            enemy.update(platforms)
+        if images is not None:
+            images.append(player.image)
+            images.extend(enemy.image for enemy in enemies)
+
+
+def main():
+    """Run all animation allocation tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - ANIMATION ALLOCATION TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    platforms = pygame.sprite.Group(Platform(0, 550, 5000, 50))
+    with contextlib.redirect_stdout(io.StringIO()):
+        player = Player(400, 490)
+        enemies = [Polocho(800 + i * 300, 510, 120) for i in range(NUM_POLOCHOS)]
+
+    # Reach steady state before measuring
+    run_frames(player, enemies, platforms, WARMUP_FRAMES, 0)
+
+    # Test 1: No surfaces allocated by entity update code in steady state
+    print(f"Test 1: No surface allocations over {MEASURED_FRAMES} steady-state frames...")
+    images = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    run_frames(player, enemies, platforms, MEASURED_FRAMES, WARMUP_FRAMES, images)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    entity_filters = [tracemalloc.Filter(True, f"*{name}") for name in ENTITY_FILES]
+    diff = after.filter_traces(entity_filters).compare_to(before.filter_traces(entity_filters), "lineno")
+    new_blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+
+    # Allow a stray number object per entity (e.g. a float velocity), but not one block per frame
+    allowed_blocks = NUM_POLOCHOS + 1
+    if new_blocks <= allowed_blocks:
+        print(f"[PASS] {new_blocks} live blocks allocated by entity code across {MEASURED_FRAMES} frames")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] {new_blocks} live blocks allocated by entity code across {MEASURED_FRAMES} frames")
+        for stat in diff[:5]:
+            print(f"  -> {stat}")
+        tests_failed += 1
+
+    # Test 2: Every displayed image is a shared cached frame
+    print("\nTest 2: Entity images are shared cached frames...")
+    cached_ids = {id(frame) for frames in Player._frame_atlas.values() for frame in frames}
+    cached_ids.update(id(frame) for frames in Polocho._walk_frame_cache.values() for frame in frames)
+    distinct_images = {id(image) for image in images}
+    uncached = distinct_images - cached_ids
+    if not uncached:
+        print(f"[PASS] All {len(distinct_images)} distinct images come from the shared caches")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] {len(uncached)} images were not shared cached frames")
+        tests_failed += 1
+
+    # Test 3: Both facing directions were exercised
+    print("\nTest 3: Left and right facing frames were both used...")
+    left_ids = {id(frame) for frame in Polocho._walk_frame_cache[-1]}
+    left_ids.update(id(frame) for key, frames in Player._frame_atlas.items() if key[1] == -1 for frame in frames)
+    if distinct_images & left_ids and distinct_images - left_ids:
+        print("[PASS] Left-facing and right-facing frames were displayed")
+        tests_passed += 1
+    else:
+        print("[FAIL] Only one facing direction was displayed")
+        tests_failed += 1
+
+    # Test 4: Spawning and squashing Polochos draws nothing new
+    print("\nTest 4: Polochos share one frame set, including the squashed frame...")
+    spawned = [Polocho(100 * i, 300, 150) for i in range(NUM_POLOCHOS)]
+    for enemy in spawned:
+        enemy.squash()
+    instance_surfaces = [name for enemy in spawned for name, value in vars(enemy).items()
+                         if isinstance(value, pygame.Surface) and value is not Polocho.squashed_frame]
+    if (all(enemy.image is Polocho.squashed_frame for enemy in spawned) and not instance_surfaces and
+            Polocho.walk_frames is Polocho._walk_frame_cache[1]):
+        print(f"[PASS] {NUM_POLOCHOS} spawned and squashed Polochos hold no surfaces of their own")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Per-enemy surfaces: {sorted(set(instance_surfaces))}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,170 @@
+"""
+Compiled Level Test for Coffee Bros
+Verifies compiled level files hold exactly the data of their JSON files, are
+rebuilt when the JSON changes or the compiled file is damaged, build the
+same entities as the JSON, and keep non-integer coordinates.
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pygame
+
+# Add parent directory to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+os.chdir(PROJECT_ROOT)
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.compiled_level import (compile_level, load_compiled, load_level_data, split_level_data,
+                                get_compiled_path)
+from src.level import Level
+
+
+def as_lists(tables):
+    """Entity tables as plain lists of rows, for comparison"""
+    return {name: list(table.rows()) for name, table in tables.items()}
+
+
+def entity_state(level):
+    """Positions and types of every entity in a level"""
+    return (sorted((p.rect.topleft, p.rect.size, p.platform_type) for p in level.platforms),
+            sorted((e.rect.topleft, e.patrol_end - e.rect.x) for e in level.enemies if e is not level.boss),
+            sorted(p.rect.center for p in level.powerups))
+
+
+def main():
+    """Run all compiled level tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - COMPILED LEVEL TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+    workspace = tempfile.mkdtemp(prefix="coffee_bros_compiled_")
+
+    # Test 1: Compiled files round-trip every stock level
+    print("Test 1: Compiled levels hold the same data as their JSON...")
+    mismatches = []
+    for level_number in range(1, 6):
+        json_path = os.path.join("assets", "levels", f"level_{level_number}.json")
+        compiled_path = os.path.join(workspace, f"level_{level_number}.cblv")
+        compile_level(json_path, compiled_path)
+        with open(json_path) as f:
+            expected_data, expected_tables = split_level_data(json.load(f))
+        data, tables = load_compiled(compiled_path)
+        if data != expected_data or as_lists(tables) != as_lists(expected_tables):
+            mismatches.append(level_number)
+    if not mismatches:
+        print("[PASS] Levels 1-5 round-trip through the compiled format")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Data differs for levels {mismatches}")
+        tests_failed += 1
+
+    # Test 2: The cache is rebuilt when the JSON is newer or the compiled file is damaged
+    print("\nTest 2: Stale and damaged compiled files are rebuilt...")
+    json_path = os.path.join(workspace, "level_1.json")
+    shutil.copy(os.path.join("assets", "levels", "level_1.json"), json_path)
+    compiled_path = get_compiled_path(json_path)
+    load_level_data(json_path)
+    built = os.path.exists(compiled_path)
+
+    with open(json_path) as f:
+        level_data = json.load(f)
+    level_data["platforms"][0]["x"] += 7
+    with open(json_path, 'w') as f:
+        json.dump(level_data, f)
+    future = time.time() + 10  # Make sure the JSON is newer regardless of timestamp resolution
+    os.utime(json_path, (future, future))
+    _, tables = load_level_data(json_path)
+    picked_up_edit = tables["platforms"].row(0)[0] == level_data["platforms"][0]["x"]
+
+    with open(compiled_path, 'r+b') as f:
+        f.truncate(os.path.getsize(compiled_path) - 4)
+    os.utime(compiled_path, (future + 10, future + 10))
+    _, tables = load_level_data(json_path)
+    repaired = (as_lists(tables) == as_lists(split_level_data(level_data)[1]) and
+                load_compiled(compiled_path) is not None)
+    if built and picked_up_edit and repaired:
+        print("[PASS] Compiled file built on first load, rebuilt after an edit and after damage")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] built {built}, edit picked up {picked_up_edit}, damage repaired {repaired}")
+        tests_failed += 1
+
+    # Test 3: Levels built from compiled data match the JSON entities, also after a reset
+    print("\nTest 3: Compiled levels create the entities described by the JSON...")
+    mismatches = []
+    for level_number in range(1, 6):
+        with open(os.path.join("assets", "levels", f"level_{level_number}.json")) as f:
+            level_data = json.load(f)
+        expected = (sorted(((p["x"], p["y"]), (p["width"], p["height"]), p["type"])
+                           for p in level_data["platforms"]),
+                    sorted(((e["spawn_x"], e["spawn_y"]), e["patrol_distance"]) for e in level_data["enemies"]),
+                    sorted((p["x"], p["y"]) for p in level_data["powerups"]))
+        with contextlib.redirect_stdout(io.StringIO()):
+            level = Level.load_from_file(level_number)
+            loaded = entity_state(level)
+            level.reset_level()
+        if loaded != expected or entity_state(level) != expected:
+            mismatches.append(level_number)
+    if not mismatches:
+        print("[PASS] Platforms, enemies and powerups match on levels 1-5, after load and reset")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Entities differ for levels {mismatches}")
+        tests_failed += 1
+
+    # Test 4: Non-integer coordinates compile to float columns and load exactly as written
+    print("\nTest 4: Float coordinates load like they do from the JSON...")
+    json_path = os.path.join(workspace, "level_floats.json")
+    with open(os.path.join("assets", "levels", "level_1.json")) as f:
+        level_data = json.load(f)
+    level_data["platforms"][0]["x"] = 120.5
+    level_data["enemies"][0]["spawn_x"] = 300.0
+    with open(json_path, 'w') as f:
+        json.dump(level_data, f)
+    error = None
+    try:
+        _, tables = load_level_data(json_path)
+        loaded = as_lists(tables) == as_lists(split_level_data(level_data)[1])
+        column_types = [column.typecode for column in tables["platforms"].columns[:2]]
+    except ValueError as e:
+        error = e
+    if error is None and loaded and column_types == ['d', 'i'] and os.path.exists(get_compiled_path(json_path)):
+        print("[PASS] Platform x 120.5 and enemy spawn_x 300.0 round-trip, integer columns stay int32")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] error {error}" if error else f"[FAIL] values match {loaded}, platform x/y columns {column_types}")
+        tests_failed += 1
+
+    shutil.rmtree(workspace, ignore_errors=True)
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
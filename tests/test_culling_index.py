@@ -0,0 +1,167 @@
+"""
+Culling Index Test for Coffee Bros
+Verifies OptimizedRenderer draws sprite groups through their culling index exactly
+as it draws them walking every sprite, that index queries only return sprites near
+the camera window, and that the player aura is drawn through the draw_behind hook.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.entities import Polocho, GoldenArepa, Laser
+from src.game_session import GameSession
+from src.headless import scripted_keys
+from src.optimization import CullableGroup, OptimizedRenderer
+
+STEPS = 600
+
+
+def draw_both_ways(level_number):
+    """
+    Play a level powered up and draw every step through the index and walking every sprite.
+
+    Returns:
+        tuple: (first differing step or None, sprites drawn, sprites in the group)
+    """
+    session = GameSession()
+    indexed = OptimizedRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    walked = OptimizedRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    random.seed(8)
+    drawn = total = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(level_number)
+        for step in range(STEPS):
+            if not session.player.is_powered_up:
+                session.player.collect_powerup()  # Aura on, lasers flying
+            session.update(scripted_keys(step, session))
+            camera_x = session.get_render_camera_x(0.5)
+            for renderer, sprites in ((indexed, session.all_sprites), (walked, list(session.all_sprites))):
+                renderer.screen.fill((0, 0, 0))
+                count = renderer.draw_sprites_with_offset(sprites, camera_x, session.previous_positions, 0.5)
+            drawn += count
+            total += len(session.all_sprites)
+            if pygame.image.tobytes(indexed.screen, 'RGB') != pygame.image.tobytes(walked.screen, 'RGB'):
+                return step, drawn, total
+    return None, drawn, total
+
+
+def main():
+    """Run all culling index tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - CULLING INDEX TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Drawing through the index matches walking every sprite
+    # (level 3 has the most enemies, level 5 the boss and its projectiles)
+    print("Test 1: Indexed drawing matches drawing every sprite...")
+    results = {level_number: draw_both_ways(level_number) for level_number in (3, 5)}
+    mismatches = {level: step for level, (step, _, _) in results.items() if step is not None}
+    if not mismatches:
+        print("[PASS] Levels 3 and 5 identical for %d steps (%s sprites drawn of those in the group)"
+              % (STEPS, ", ".join(f"{drawn}/{total}" for _, drawn, total in results.values())))
+        tests_passed += 1
+    else:
+        print(f"[FAIL] First differing step per level: {mismatches}")
+        tests_failed += 1
+
+    # Test 2: Queries return every sprite near the window and little else, however long the level,
+    # and the index follows sprites joining and leaving the group without rescanning it
+    print("\nTest 2: Queries only return sprites near the camera window...")
+    group = CullableGroup()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(1000):
+            group.add(Polocho(200 + i * 300, 400), GoldenArepa(350 + i * 300, 300))
+    index = group.culling_index
+    index.sync()
+    sorted_sprites = index.sorted_sprites
+    index.sync()  # Nothing changed - nothing is sorted again
+    unchanged_sync_free = index.sorted_sprites is sorted_sprites
+
+    def check_windows():
+        """Count sprites missed or out of group order, and the most returned for one window"""
+        missed = largest = 0
+        position = {sprite: i for i, sprite in enumerate(group)}
+        index.sync()
+        for camera_x in range(0, 300000, 7919):
+            left, right = camera_x - 50, camera_x + WINDOW_WIDTH + 50
+            found = index.query(left, right)
+            order = [position[sprite] for sprite in found]
+            near = {sprite for sprite in group if sprite.rect.right >= left and sprite.rect.left <= right}
+            missed += len(near - set(found)) + (order != sorted(order)) + len(set(found) - set(group))
+            largest = max(largest, len(found))
+        return missed, largest
+
+    missed, largest = check_windows()
+    # Collect some coffee beans, put one back (it moves to the end of the group) and fire a laser
+    arepas = [sprite for sprite in group if isinstance(sprite, GoldenArepa)]
+    for arepa in arepas[::3]:
+        arepa.kill()
+    group.add(arepas[0])
+    with contextlib.redirect_stdout(io.StringIO()):
+        group.add(Laser(5000, 300, 1))
+    missed_after, largest_after = check_windows()
+    if unchanged_sync_free and missed == missed_after == 0 and max(largest, largest_after) <= 20:
+        print(f"[PASS] At most {max(largest, largest_after)} of {len(group)} sprites returned per window, "
+              "none missed after sprites left and joined")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] {missed}/{missed_after} sprites missed or out of order, up to {largest}/{largest_after} "
+              f"returned, unchanged sync re-sorted {not unchanged_sync_free}")
+        tests_failed += 1
+
+    # Test 3: The aura is drawn through the draw_behind hook, shifted like its sprite
+    print("\nTest 3: Effects behind sprites go through the draw_behind hook...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = GameSession()
+        session.start_new_game(1)
+    player = session.player
+    player.collect_powerup()
+    renderer = OptimizedRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA))
+    renderer.draw_sprites_with_offset([player], 100, {player: (player.rect.x - 10, player.rect.y)}, 0.5)
+    aura = player.get_aura_surface()
+    aura_x, aura_y = player.get_aura_position()
+    expected = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+    aura_rect = expected.blit(aura, (aura_x - 5 - 100, aura_y))  # Interpolated 5px back, camera at 100
+    expected.blit(player.image, (player.rect.x - 5 - 100, player.rect.y))
+    same = pygame.image.tobytes(renderer.screen, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+    if same and renderer.dirty_rects[0] == aura_rect:
+        print(f"[PASS] Aura drawn behind the player at {tuple(aura_rect.topleft)} and tracked as dirty")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] drawing matches {same}, first dirty rect {renderer.dirty_rects[:1]} vs aura {aura_rect}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
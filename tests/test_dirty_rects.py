@@ -0,0 +1,155 @@
+"""
+Dirty Rectangle Rendering Test for Coffee Bros
+Verifies OptimizedRenderer's dirty rectangle mode draws exactly the frames a full
+redraw would, that the updated areas cover every changed pixel, that scrolling
+falls back to whole frames, and that static screens are not redrawn.
+"""
+
+import collections
+import contextlib
+import io
+import os
+import random
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK
+from src.draw_utils import draw_level_background, draw_hearts
+from src.game_session import GameSession
+from src.headless import scripted_keys
+from src.optimization import OptimizedRenderer
+from src.text_renderer import text_renderer
+
+STEPS = 400
+IDLE_STEPS = 150  # Steps standing still at the start, the camera doesn't move
+
+
+def draw_frame(renderer, session):
+    """Draw a gameplay frame the way main.py does"""
+    screen = renderer.screen
+    level = session.level
+    camera_x = session.camera_x
+
+    def draw_background():
+        if not draw_level_background(screen, level, None, camera_x, session.level_width,
+                                     WINDOW_WIDTH, WINDOW_HEIGHT):
+            screen.fill(BLACK)
+        level.platform_chunks.draw(screen, camera_x)
+
+    renderer.begin_frame((level, camera_x), draw_background)
+    renderer.draw_sprites_with_offset(session.all_sprites, camera_x)
+    renderer.draw_sprites_with_offset(session.particles, camera_x)
+    if level.boss:
+        renderer.mark_dirty(level.boss.draw_health_bar(screen, camera_x))
+    font = text_renderer.get_font(36)
+    renderer.mark_dirty(text_renderer.draw_text(screen, font, f"SCORE: {session.score:05d}",
+                                                (255, 255, 255), topleft=(10, 10)))
+    renderer.mark_dirty(draw_hearts(screen, session.player.lives, WINDOW_WIDTH - 10, 10))
+    if session.level_name_display:
+        renderer.mark_dirty(session.level_name_display.draw(screen))
+    renderer.update_display()
+
+
+def main():
+    """Run all dirty rectangle tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - DIRTY RECTANGLE RENDERING TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Play level 1 standing still, then running right, drawing every step both ways
+    session = GameSession()
+    random.seed(4)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(1)
+    dirty = OptimizedRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    full = OptimizedRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)), use_dirty_rects=False)
+    shown = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))  # What the display shows in dirty mode
+    first_mismatch = None
+    first_stale = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for step in range(STEPS):
+            if step < IDLE_STEPS:
+                session.update(collections.defaultdict(bool))
+            else:
+                session.update(scripted_keys(step, session))
+            draw_frame(dirty, session)
+            draw_frame(full, session)
+            if dirty.full_frame:
+                shown.blit(dirty.screen, (0, 0))
+            else:
+                for rect in dirty.previous_rects + dirty.dirty_rects:
+                    shown.blit(dirty.screen, rect, rect)
+            frame = pygame.image.tobytes(full.screen, 'RGB')
+            if first_mismatch is None and pygame.image.tobytes(dirty.screen, 'RGB') != frame:
+                first_mismatch = step
+            if first_stale is None and pygame.image.tobytes(shown, 'RGB') != frame:
+                first_stale = step
+
+    # Test 1: Restoring the background under drawn areas gives the same frames as redrawing
+    print("Test 1: Dirty rectangle frames match full redraws...")
+    if first_mismatch is None:
+        print(f"[PASS] {STEPS} frames pixel identical to full redraws")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Frames differ from step {first_mismatch}")
+        tests_failed += 1
+
+    # Test 2: The updated areas cover every pixel that changed, scrolling flips whole frames
+    print("\nTest 2: Display updates cover every change, scrolling falls back to flips...")
+    if first_stale is None and dirty.partial_frames >= IDLE_STEPS - 2 and dirty.full_frames > 0:
+        print(f"[PASS] {dirty.partial_frames} partial updates, {dirty.full_frames} whole frames while scrolling")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] display stale from step {first_stale}, {dirty.partial_frames} partial / "
+              f"{dirty.full_frames} whole frames")
+        tests_failed += 1
+
+    # Test 3: Static screens are only drawn when they change
+    print("\nTest 3: Static screens are drawn only when they change...")
+    renderer = OptimizedRenderer(pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)))
+    draws = [renderer.begin_static_frame("paused") for _ in range(60)]
+    draws.append(renderer.begin_static_frame("menu"))  # Another screen
+    renderer.invalidate()  # Input arrived
+    draws.append(renderer.begin_static_frame("menu"))
+    draws.append(renderer.begin_static_frame("menu"))
+    # Gameplay after a static screen starts with a whole frame
+    draw_frame(renderer, session)
+    resumed_whole = renderer.full_frame
+    expected = [True] + [False] * 59 + [True, True, False]
+    if draws == expected and renderer.skipped_frames == 60 and resumed_whole:
+        print("[PASS] 63 static frames drawn 3 times, gameplay resumes with a whole frame")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] drawn {draws.count(True)} times ({renderer.skipped_frames} skipped), "
+              f"gameplay resumed whole {resumed_whole}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,165 @@
+"""
+Fixed Timestep Test for Coffee Bros
+Verifies GameSession advances gameplay in deterministic fixed steps and that the
+renderer interpolates sprite positions between the last two steps, except across respawns.
+"""
+
+import collections
+import contextlib
+import io
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, DEATH_DELAY
+from src.game_session import GameSession
+from src.optimization import OptimizedRenderer
+
+STEPS = 600  # 10 seconds of simulated gameplay
+
+
+def session_keys(step):
+    """Key state that runs right, jumps periodically and keeps shooting"""
+    keys = collections.defaultdict(bool)
+    keys[pygame.K_RIGHT] = True
+    keys[pygame.K_x] = True
+    keys[pygame.K_SPACE] = step % 50 < 20
+    return keys
+
+
+def play(level_number, steps):
+    """
+    Run a fresh session for a number of fixed steps.
+
+    Returns:
+        tuple: (GameSession, list of per-step state tuples)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = GameSession()
+        session.start_new_game(level_number)
+        trace = []
+        for step in range(steps):
+            session.update(session_keys(step))
+            trace.append((session.player.rect.topleft, session.player.lives, session.score,
+                          session.camera_x, len(session.enemies)))
+    return session, trace
+
+
+def main():
+    """Run all fixed timestep tests"""
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - FIXED TIMESTEP TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Same inputs give the same simulation on every run
+    print(f"Test 1: {STEPS} fixed steps are deterministic...")
+    _, first = play(1, STEPS)
+    session, second = play(1, STEPS)
+    if first == second:
+        print(f"[PASS] Both runs produced identical state for {STEPS} steps")
+        tests_passed += 1
+    else:
+        mismatch = next(i for i, (a, b) in enumerate(zip(first, second)) if a != b)
+        print(f"[FAIL] Runs diverged at step {mismatch}")
+        tests_failed += 1
+
+    # Test 2: Player actually moved under simulation
+    print("\nTest 2: Simulation advances gameplay...")
+    if first[-1][0] != first[0][0] and session.level_frames == STEPS:
+        print(f"[PASS] Player moved from {first[0][0]} to {first[-1][0]} in {session.level_frames} steps")
+        tests_passed += 1
+    else:
+        print("[FAIL] Player did not move or step count is wrong")
+        tests_failed += 1
+
+    # Test 3: Renderer draws sprites between previous and current positions
+    print("\nTest 3: Renderer interpolates between steps...")
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((10, 10))
+    sprite.image.fill((255, 255, 255))
+    sprite.rect = sprite.image.get_rect(topleft=(120, 200))
+    renderer = OptimizedRenderer(screen)
+    screen.fill((0, 0, 0))
+    renderer.draw_sprites_with_offset([sprite], 0, {sprite: (100, 200)}, 0.5)
+    drawn_at_midpoint = screen.get_at((110, 200))[:3] == (255, 255, 255)
+    not_at_current = screen.get_at((125, 205))[:3] == (0, 0, 0)
+    if drawn_at_midpoint and not_at_current:
+        print("[PASS] Sprite drawn halfway between its last two positions")
+        tests_passed += 1
+    else:
+        print("[FAIL] Sprite was not drawn at the interpolated position")
+        tests_failed += 1
+
+    # Test 4: Camera interpolation stays within the last step
+    print("\nTest 4: Camera interpolation...")
+    session.previous_camera_x = 100
+    session.camera_x = 108
+    cameras = [session.get_render_camera_x(alpha) for alpha in (0.0, 0.5, 1.0)]
+    if cameras == [100, 104, 108]:
+        print(f"[PASS] Camera offsets {cameras} for alpha 0, 0.5, 1")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Camera offsets {cameras}, expected [100, 104, 108]")
+        tests_failed += 1
+
+    # Test 5: Respawning doesn't interpolate the player or camera across the level
+    print("\nTest 5: Respawns are drawn at the spawn point straight away...")
+    idle = collections.defaultdict(bool)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = GameSession()
+        session.start_new_game(1)
+        player = session.player
+        # Fall into a pit far from the spawn point
+        player.rect.topleft = (1500, WINDOW_HEIGHT + 10)
+        player.velocity_y = 0
+        session.update_camera()
+        session.update(idle)
+        pit_camera = (session.previous_camera_x, session.camera_x)
+        pit_forgotten = player not in session.previous_positions
+        pit_respawned = player.rect.x < 400 and player.lives == 2
+        # Lose a life the other way, far from the spawn, and wait for the death timer
+        player.rect.x = 1500
+        session.update_camera()
+        session.is_dead = True
+        session.death_timer = DEATH_DELAY - 1
+        session.update(idle)
+        death_camera = (session.previous_camera_x, session.camera_x)
+    if (pit_respawned and pit_forgotten and pit_camera[0] == pit_camera[1]
+            and death_camera[0] == death_camera[1] == 0):
+        print(f"[PASS] Camera (previous, current) after a pit respawn {pit_camera}, "
+              f"after the death timer {death_camera}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] pit respawn: camera {pit_camera}, player position forgotten {pit_forgotten}, "
+              f"respawned {pit_respawned}; death timer: camera {death_camera}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,116 @@
+"""
+Frame Cache Test for Coffee Bros
+Verifies projectile, power-up and enemy frames are drawn once per process,
+prewarmed by level load, shared by every instance and identical to a fresh draw.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.entities import Laser, GoldenArepa, Mermelada, Polocho
+from src.level import Level
+from src.optimization import shared_frames
+
+
+def surfaces_in(frames):
+    """Flatten a frame set (surface, list or dict of lists) into a list of surfaces"""
+    if isinstance(frames, pygame.Surface):
+        return [frames]
+    if isinstance(frames, dict):
+        return [surface for key in sorted(frames) for surface in frames[key]]
+    return list(frames)
+
+
+def main():
+    """Run all frame cache tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - FRAME CACHE TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Level load prewarms every registered frame set
+    print("Test 1: Level load draws every shared frame set up front...")
+    shared_frames.clear()
+    with contextlib.redirect_stdout(io.StringIO()):
+        Level.load_from_file(1)
+    missing = sorted(set(shared_frames.builders) - set(shared_frames.frames))
+    expected = {"laser", "golden_arepa", "mermelada", "polocho"}
+    if not missing and expected <= set(shared_frames.frames):
+        print(f"[PASS] Prewarmed: {', '.join(sorted(shared_frames.frames))}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Not prewarmed: {missing}, registered: {sorted(shared_frames.builders)}")
+        tests_failed += 1
+
+    # Test 2: Spawning after prewarm draws nothing and shares the frames
+    print("\nTest 2: Spawned entities draw nothing and share their frames...")
+    draw_calls = []
+    original_circle = pygame.draw.circle
+    pygame.draw.circle = lambda *args, **kwargs: draw_calls.append(args) or original_circle(*args, **kwargs)
+    try:
+        lasers = [Laser(100, 300, 1), Laser(200, 300, -1)]
+        arepas = [GoldenArepa(300, -50), GoldenArepa(400, 300)]
+        mermeladas = [Mermelada(400, 300, i * 0.785) for i in range(8)]
+        with contextlib.redirect_stdout(io.StringIO()):
+            enemies = [Polocho(500, 300), Polocho(600, 300)]
+    finally:
+        pygame.draw.circle = original_circle
+    shared = (lasers[0].energy_frames is lasers[1].energy_frames and
+              arepas[0].glow_frames is arepas[1].glow_frames and
+              len({id(m.image) for m in mermeladas}) == 1 and
+              enemies[0].image is enemies[1].image)
+    if not draw_calls and shared:
+        print(f"[PASS] {len(lasers) + len(arepas) + len(mermeladas) + len(enemies)} entities spawned without drawing")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] {len(draw_calls)} draw calls during spawn, frames shared {shared}")
+        tests_failed += 1
+
+    # Test 3: Cached frames look exactly like a fresh draw
+    print("\nTest 3: Cached frames match freshly drawn ones...")
+    mismatches = []
+    for name in ("laser", "golden_arepa", "mermelada"):
+        cached = surfaces_in(shared_frames.get(name))
+        fresh = surfaces_in(shared_frames.builders[name]())
+        if len(cached) != len(fresh) or any(
+                pygame.image.tobytes(a, 'RGBA') != pygame.image.tobytes(b, 'RGBA') for a, b in zip(cached, fresh)):
+            mismatches.append(name)
+    if not mismatches:
+        print("[PASS] Laser, golden arepa and mermelada frames are pixel identical")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Frames differ for {mismatches}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
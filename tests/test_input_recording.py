@@ -0,0 +1,163 @@
+"""
+Input Recording Test for Coffee Bros
+Verifies recordings round-trip through the binary file format and that replaying
+recorded keys with the recorded seed reproduces the same gameplay.
+"""
+
+import collections
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.game_session import GameSession
+from src.input_recording import InputRecorder, InputReplay
+from src.menu import GameOverMenu
+
+FRAMES = 400
+
+
+def live_keys(frame):
+    """Scripted 'live' input: run right, jump and shoot in bursts"""
+    keys = collections.defaultdict(bool)
+    keys[pygame.K_RIGHT] = frame % 200 < 150
+    keys[pygame.K_LEFT] = frame % 200 >= 170
+    keys[pygame.K_SPACE] = frame % 45 < 15
+    keys[pygame.K_x] = frame % 30 < 10
+    return keys
+
+
+def play(seed, key_source):
+    """
+    Seed random and play level 1, one simulation step per frame.
+
+    Returns:
+        list: Per-step (player position, score, lives, particle count)
+    """
+    random.seed(seed)
+    trace = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = GameSession()
+        session.start_new_game(1)
+        for frame in range(FRAMES):
+            session.update(key_source(frame))
+            trace.append((session.player.rect.topleft, session.score, session.player.lives,
+                          len(session.particles)))
+    return trace
+
+
+def main():
+    """Run all input recording tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - INPUT RECORDING TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+    path = os.path.join(tempfile.mkdtemp(), "run.cbir")
+
+    # Record live input alongside a run
+    recorder = InputRecorder(path, seed=1234)
+    for frame in range(FRAMES):
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE)] if frame == 10 else []
+        recorder.record_frame(events)
+        recorder.record_gameplay(live_keys(frame), 1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        recorder.save()
+    live_trace = play(1234, live_keys)
+
+    # Test 1: File round trip
+    print("Test 1: Recording round-trips through the binary file...")
+    replay = InputReplay(path)
+    frames = [replay.next_frame() for _ in range(len(replay))]
+    keys_match = all(frames[i].keys[k] == live_keys(i)[k]
+                     for i in range(FRAMES) for k in (pygame.K_RIGHT, pygame.K_LEFT, pygame.K_SPACE, pygame.K_x))
+    events_match = (len(frames[10].events) == 1 and frames[10].events[0].key == pygame.K_ESCAPE and
+                    all(not f.events for i, f in enumerate(frames) if i != 10))
+    if replay.seed == 1234 and keys_match and events_match and replay.next_frame() is None:
+        print(f"[PASS] Seed, {FRAMES} frames of keys and events restored ({os.path.getsize(path)} bytes)")
+        tests_passed += 1
+    else:
+        print("[FAIL] Recording did not round-trip")
+        tests_failed += 1
+
+    # Test 2: Replay reproduces gameplay
+    print("\nTest 2: Replay reproduces the recorded gameplay...")
+    replay_trace = play(replay.seed, lambda frame: frames[frame].keys)
+    if replay_trace == live_trace:
+        print(f"[PASS] Replay matched the live run for all {FRAMES} steps")
+        tests_passed += 1
+    else:
+        mismatch = next(i for i, (a, b) in enumerate(zip(live_trace, replay_trace)) if a != b)
+        print(f"[FAIL] Replay diverged at step {mismatch}")
+        tests_failed += 1
+
+    # Test 3: Menu animation ticks outside gameplay are replayed as recorded
+    # (the loop sleeps while waiting for input, so frames there advance by varying ticks)
+    print("\nTest 3: Menu ticks are recorded, the game over delay replays identically...")
+    ticks = [0, 6, 6, 1, 0, 7, 6, 6, 12, 6, 6, 6, 3, 6, 0]
+    recorder = InputRecorder(path, seed=99)
+    live_menu = GameOverMenu()
+    live_ready = []
+    for frame, frame_ticks in enumerate(ticks):
+        recorder.record_frame([])
+        recorder.record_menu_ticks(frame_ticks)
+        live_menu.update(frame_ticks)
+        live_ready.append(live_menu.is_input_ready())
+    with contextlib.redirect_stdout(io.StringIO()):
+        recorder.save()
+    replay = InputReplay(path)
+    replayed_menu = GameOverMenu()
+    replay_ready = []
+    for _ in range(len(replay)):
+        replayed_menu.update(replay.next_frame().steps)
+        replay_ready.append(replayed_menu.is_input_ready())
+    if replay_ready == live_ready and live_ready.index(True) == 11:
+        print(f"[PASS] Game over options selectable after {sum(ticks[:12])} ticks, at frame 11 in both runs")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] live {live_ready}, replay {replay_ready}")
+        tests_failed += 1
+
+    # Test 4: Invalid files are rejected
+    print("\nTest 4: Invalid recordings are rejected...")
+    with open(path, 'wb') as f:
+        f.write(b"not a recording")
+    try:
+        InputReplay(path)
+        print("[FAIL] Invalid file was accepted")
+        tests_failed += 1
+    except ValueError:
+        print("[PASS] ValueError raised for invalid file")
+        tests_passed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
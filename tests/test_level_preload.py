@@ -0,0 +1,142 @@
+"""
+Level Preload Test for Coffee Bros
+Verifies the next level's files are read on a background thread as soon as a level
+is completed, that the level created from them matches one loaded directly, and
+that continuing reads nothing from disk on the main thread.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import threading
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+import src.level_preload as level_preload
+from src.game_session import GameSession
+from src.level import Level
+
+
+def describe(level):
+    """Entities and background of a level, for comparison"""
+    sprites = sorted((type(sprite).__name__, tuple(sprite.rect)) for sprite in level.all_sprites)
+    platforms = sorted(tuple(platform.rect) for platform in level.platforms)
+    background = level.background_image and pygame.image.tobytes(level.background_image, 'RGB')
+    return sprites, platforms, background, level.metadata
+
+
+def main():
+    """Run all level preload tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - LEVEL PRELOAD TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Record which threads read level data and decode images
+    reads = []
+    original_load_level_data = level_preload.load_level_data
+    original_image_load = pygame.image.load
+
+    def recording_load_level_data(path):
+        reads.append((threading.current_thread() is threading.main_thread(), path))
+        return original_load_level_data(path)
+
+    def recording_image_load(path):
+        reads.append((threading.current_thread() is threading.main_thread(), path))
+        return original_image_load(path)
+
+    level_preload.load_level_data = recording_load_level_data
+    pygame.image.load = recording_image_load
+
+    # Test 1: Completing a level reads the next one in the background, continuing reads nothing
+    print("Test 1: The next level is read off the main thread...")
+    session = GameSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(2)
+        del reads[:]
+        session._complete_level()
+        preloader = session.preloader
+        preloader.join()
+        background_reads = list(reads)
+        session.advance_from_transition()
+    main_thread_reads = [path for on_main, path in reads if on_main]
+    if (preloader.level_number == 3 and background_reads and not main_thread_reads
+            and session.current_level_number == 3 and session.preloader is None):
+        print(f"[PASS] {len(background_reads)} files read in the background, none when continuing")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] preloaded level {preloader.level_number}, {len(background_reads)} background reads, "
+              f"main thread read {main_thread_reads}")
+        tests_failed += 1
+
+    # Test 2: A preloaded level is the same as one loaded directly
+    print("\nTest 2: Preloaded levels match levels loaded directly...")
+    different = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for level_number in range(1, 6):
+            preloader = level_preload.LevelPreloader(level_number)
+            preloader.start()
+            preloaded = Level.load_from_file(level_number, files=preloader.result())
+            if describe(preloaded) != describe(Level.load_from_file(level_number)):
+                different.append(level_number)
+    if not different:
+        print("[PASS] Levels 1-5 have the same entities, platforms and background either way")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Levels {different} differ when preloaded")
+        tests_failed += 1
+
+    level_preload.load_level_data = original_load_level_data
+    pygame.image.load = original_image_load
+
+    # Test 3: Errors reading in the background surface when continuing; stale preloads are dropped
+    print("\nTest 3: Background errors surface when continuing, stale preloads are ignored...")
+    session = GameSession(max_level_number=6)  # There is no level 6
+    error = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(5)
+        session._complete_level()
+        try:
+            session.advance_from_transition()
+        except FileNotFoundError as e:
+            error = e
+        # Completing level 1 then starting over from the menu loads level 1, not the preloaded 2
+        session.start_new_game(1)
+        session._complete_level()
+        session.start_new_game(1)
+    if error is not None and session.current_level_number == 1 and session.preloader is None:
+        print(f"[PASS] Missing level reported when continuing ({error}), stale preload dropped")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] error {error}, now on level {session.current_level_number}, preloader {session.preloader}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,119 @@
+"""
+Level Reset Test for Coffee Bros
+Verifies resetting a level restores every entity to its loaded state in place:
+a reset level plays exactly like one reloaded from its file and reuses its sprites.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.entities import GoldenArepa
+from src.game_session import GameSession
+from src.headless import scripted_keys
+
+STEPS = 900
+
+
+def play(session, steps):
+    """Step a session with the scripted input and record the state of every entity"""
+    random.seed(7)  # Boss powerup drops are random
+    trace = []
+    for frame in range(steps):
+        session.update(scripted_keys(frame, session))
+        trace.append((session.player.rect.topleft, session.player.lives, session.score,
+                      sorted(sprite.rect.topleft for sprite in session.all_sprites)))
+    return trace
+
+
+def reload_level(session):
+    """Retry by reloading the level file (what retry_level did before resets were snapshot based)"""
+    session.score = 0
+    session.level_start_score = 0
+    session.load_level(session.current_level_number)
+
+
+def main():
+    """Run all level reset tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - LEVEL RESET TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: A reset level plays exactly like a reloaded one
+    print("Test 1: Reset levels replay identically to reloaded levels...")
+    mismatches = []
+    for level_number in range(1, 6):
+        traces = []
+        for retry in (reload_level, GameSession.retry_level):
+            session = GameSession()
+            with contextlib.redirect_stdout(io.StringIO()):
+                session.start_new_game(level_number)
+                play(session, STEPS)
+                retry(session)
+                traces.append(play(session, STEPS))
+        reloaded, reset = traces
+        if reloaded != reset:
+            step = next(i for i, (a, b) in enumerate(zip(reloaded, reset)) if a != b)
+            mismatches.append((level_number, step))
+    if not mismatches:
+        print(f"[PASS] Levels 1-5 play the same {STEPS} steps after a reset")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] (level, first differing step): {mismatches}")
+        tests_failed += 1
+
+    # Test 2: Resets reuse the loaded sprites and drop ones spawned during play
+    print("\nTest 2: Resets reuse sprites and drop spawned powerups...")
+    session = GameSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(5)
+        level = session.level
+        sprites_before = set(level.all_sprites)
+        play(session, 300)
+        spawned = GoldenArepa(400, -50)
+        level.powerups.add(spawned)
+        level.all_sprites.add(spawned)
+        level.boss.take_damage(1)
+        session.retry_level()
+    if (session.level is level and set(level.all_sprites) == sprites_before and
+            spawned not in level.powerups and level.boss.health == level.boss.max_health):
+        print(f"[PASS] {len(sprites_before)} sprites restored in place, boss health back to {level.boss.health}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] same level {session.level is level}, same sprites {set(level.all_sprites) == sprites_before}, "
+              f"spawned powerup kept {spawned in level.powerups}, boss health {level.boss.health}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,192 @@
+"""
+Level Streaming Test for Coffee Bros
+Verifies streamed levels only create and update the chunks near the camera,
+freeze and restore far away entities, play the same as fully loaded levels and
+reset back to their initial state.
+"""
+
+import collections
+import contextlib
+import copy
+import io
+import json
+import os
+import sys
+import tempfile
+
+import pygame
+
+# Add parent directory to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.game_session import GameSession
+from src.level import Level
+
+COPIES = 10  # Level 1 repeated side by side
+STREAMED, LOADED, STREAMED_EMPTY, LOADED_EMPTY = 21, 22, 23, 24  # Level file numbers
+
+
+def tiled_level(level_data, level_number, streaming, with_entities=True):
+    """Level 1 repeated COPIES times horizontally"""
+    width = level_data["metadata"]["width"]
+    tiled = copy.deepcopy(level_data)
+    tiled["metadata"].update(width=width * COPIES, level_number=level_number, streaming=streaming)
+    for key, x_field in (("platforms", "x"), ("enemies", "spawn_x"), ("powerups", "x")):
+        items = level_data.get(key, []) if with_entities or key == "platforms" else []
+        tiled[key] = [dict(item, **{x_field: item.get(x_field, 0) + width * i})
+                      for i in range(COPIES) for item in items]
+    tiled["goal"]["x"] += width * (COPIES - 1)
+    return tiled
+
+
+def make_workspace():
+    """Working directory linking the game assets, with the synthetic levels"""
+    workspace = tempfile.mkdtemp(prefix="coffee_bros_streaming_")
+    levels = os.path.join(workspace, "assets", "levels")
+    os.makedirs(levels)
+    for name in os.listdir(os.path.join(PROJECT_ROOT, "assets")):
+        if name != "levels":
+            os.symlink(os.path.join(PROJECT_ROOT, "assets", name), os.path.join(workspace, "assets", name))
+
+    with open(os.path.join(PROJECT_ROOT, "assets", "levels", "level_1.json")) as f:
+        base = json.load(f)
+    for level_number, streaming, with_entities in ((STREAMED, True, True), (LOADED, False, True),
+                                                   (STREAMED_EMPTY, True, False), (LOADED_EMPTY, False, False)):
+        with open(os.path.join(levels, f"level_{level_number}.json"), 'w') as f:
+            json.dump(tiled_level(base, level_number, streaming, with_entities), f)
+    os.chdir(workspace)
+
+
+def run_right(level_number, steps):
+    """Run right (jumping periodically) and record the player's position every step"""
+    session = GameSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(level_number)
+        trace = []
+        active_enemies = []
+        for step in range(steps):
+            keys = collections.defaultdict(bool)
+            keys[pygame.K_RIGHT] = True
+            keys[pygame.K_SPACE] = step % 50 < 20
+            session.update(keys)
+            trace.append(session.player.rect.topleft)
+            active_enemies.append(len(session.enemies))
+    return session, trace, active_enemies
+
+
+def main():
+    """Run all level streaming tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    make_workspace()
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - LEVEL STREAMING TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        loaded = Level.load_from_file(LOADED)
+        streamed = Level.load_from_file(STREAMED)
+
+    # Test 1: Only the start of a streamed level is created at load
+    print("Test 1: Streamed level only creates the chunks near the start...")
+    stats = streamed.streamer.get_stats()
+    if (0 < len(streamed.platforms) < len(loaded.platforms) and
+            0 < len(streamed.enemies) < len(loaded.enemies) and stats['active_chunks'] == 3):
+        print(f"[PASS] {len(streamed.platforms)}/{len(loaded.platforms)} platforms and "
+              f"{len(streamed.enemies)}/{len(loaded.enemies)} enemies created, {stats['active_chunks']} chunks active")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] platforms {len(streamed.platforms)}/{len(loaded.platforms)}, "
+              f"enemies {len(streamed.enemies)}/{len(loaded.enemies)}, stats {stats}")
+        tests_failed += 1
+
+    # Test 2: Far away entities are frozen and come back as they were
+    print("\nTest 2: Entities freeze when far away and resume where they were...")
+    enemy = next(iter(streamed.enemies))
+    for _ in range(30):
+        enemy.update(streamed.platform_index)
+    position = enemy.rect.topleft
+    squashed = [e for e in streamed.enemies if e is not enemy][0]
+    squashed.kill()
+    streamed.update_streaming(20000)
+    frozen = enemy not in streamed.enemies and enemy not in streamed.all_sprites
+    streamed.update_streaming(0)
+    if (frozen and enemy in streamed.enemies and enemy in streamed.all_sprites and
+            enemy.rect.topleft == position and squashed not in streamed.enemies):
+        print(f"[PASS] Enemy frozen at {position} and restored, killed enemy stayed gone")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] frozen {frozen}, restored {enemy in streamed.enemies}, "
+              f"position {enemy.rect.topleft} vs {position}, killed restored {squashed in streamed.enemies}")
+        tests_failed += 1
+
+    # Test 3: Streaming platforms doesn't change how the level plays
+    print("\nTest 3: Streamed platforms play the same as a fully loaded level...")
+    _, loaded_trace, _ = run_right(LOADED_EMPTY, 2000)
+    _, streamed_trace, _ = run_right(STREAMED_EMPTY, 2000)
+    if streamed_trace == loaded_trace and loaded_trace[-1][0] > 3 * WINDOW_WIDTH:
+        print(f"[PASS] Identical player path over 2000 steps (reached x={loaded_trace[-1][0]})")
+        tests_passed += 1
+    else:
+        mismatch = next((i for i, (a, b) in enumerate(zip(loaded_trace, streamed_trace)) if a != b), None)
+        print(f"[FAIL] Paths diverge at step {mismatch}, reached x={loaded_trace[-1][0]}")
+        tests_failed += 1
+
+    # Test 4: Active entity count stays bounded while crossing the level
+    print("\nTest 4: Active enemies stay bounded while running through the level...")
+    session, trace, active_enemies = run_right(STREAMED, 2000)
+    if max(active_enemies) < len(loaded.enemies) // 2 and trace[-1][0] > 3 * WINDOW_WIDTH:
+        print(f"[PASS] At most {max(active_enemies)} of {len(loaded.enemies)} enemies active "
+              f"(reached x={trace[-1][0]})")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Up to {max(active_enemies)} of {len(loaded.enemies)} enemies active, "
+              f"reached x={trace[-1][0]}")
+        tests_failed += 1
+
+    # Test 5: Resetting a streamed level replays it exactly
+    print("\nTest 5: A reset streamed level plays the same as a fresh one...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.retry_level()
+    _, fresh_trace, fresh_active = run_right(STREAMED, 1000)
+    reset_trace, reset_active = [], []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for step in range(1000):
+            keys = collections.defaultdict(bool)
+            keys[pygame.K_RIGHT] = True
+            keys[pygame.K_SPACE] = step % 50 < 20
+            session.update(keys)
+            reset_trace.append(session.player.rect.topleft)
+            reset_active.append(len(session.enemies))
+    if reset_trace == fresh_trace and reset_active == fresh_active:
+        print("[PASS] Identical path and active enemies over 1000 steps after a reset")
+        tests_passed += 1
+    else:
+        mismatch = next((i for i, (a, b) in enumerate(zip(fresh_trace, reset_trace)) if a != b), None)
+        print(f"[FAIL] Paths diverge at step {mismatch}, active enemies match {reset_active == fresh_active}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
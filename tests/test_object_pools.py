@@ -0,0 +1,191 @@
+"""
+Object Pool Test for Coffee Bros
+Verifies lasers, mermeladas and particles are recycled through pools: reused
+objects are indistinguishable from new ones, pooled gameplay plays exactly
+like unpooled gameplay, and pool statistics reach the PerformanceMonitor.
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.entities import Laser, Mermelada
+from src.entities.particle import Particle
+from src.game_session import GameSession
+from src.headless import scripted_keys
+from src.optimization import ObjectPool
+from src.performance_monitor import PerformanceMonitor
+
+STEPS = 1500
+
+
+def state_of(sprite):
+    """Comparable state of a sprite (rects as tuples, images by content)"""
+    state = {}
+    for name, value in vars(sprite).items():
+        if name in ("pool", "_Sprite__g"):
+            continue
+        if isinstance(value, pygame.Rect):
+            value = tuple(value)
+        elif isinstance(value, pygame.Surface):
+            value = (value.get_size(), value.get_alpha(), pygame.image.tobytes(value, 'RGB'))
+        state[name] = value
+    return state
+
+
+def play_powered_up(level_number, pooled):
+    """Play a level while powered up (shooting all the time) and record every sprite each step"""
+    session = GameSession()
+    if not pooled:
+        for pool in session.pools.values():
+            pool.max_size = 0  # Nothing is kept, every spawn allocates
+    random.seed(11)
+    trace = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(level_number)
+        for frame in range(STEPS):
+            if not session.player.is_powered_up:
+                session.player.collect_powerup()  # Keep shooting at the boss
+            session.update(scripted_keys(frame, session))
+            trace.append((session.player.rect.topleft, session.score,
+                          sorted(sprite.rect.topleft for sprite in session.all_sprites),
+                          sorted(p.rect.topleft for p in session.particles)))
+    return session, trace
+
+
+def main():
+    """Run all object pool tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - OBJECT POOL TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Reused objects are reset to exactly the state of a new one
+    print("Test 1: Reused lasers, mermeladas and particles match new ones...")
+    mismatches = []
+    particle_surface_kept = False
+    group = pygame.sprite.Group()
+    for cls, first, second in ((Laser, (100, 300, 1), (500, 200, -1)),
+                               (Mermelada, (400, 300, 0.0), (300, 250, 2.356)),
+                               (Particle, (50, 60, (255, 0, 0), 2.0, -3.0, 20),
+                                (70, 80, (0, 0, 255), -1.0, -4.0, 30))):
+        pool = ObjectPool(cls)
+        random.seed(5)
+        sprite = pool.acquire(*first)
+        group.add(sprite)
+        for _ in range(10):
+            if cls is Particle:
+                sprite.update()
+            else:
+                sprite.update(2000)  # Level width
+        sprite.kill()
+        image = sprite.image
+        random.seed(6)
+        reused = pool.acquire(*second)
+        random.seed(6)
+        fresh = cls(*second)
+        if reused is not sprite or state_of(reused) != state_of(fresh):
+            mismatches.append(cls.__name__)
+        if cls is Particle:
+            # The surface is reused whatever the new size, and only the particle's square is drawn
+            canvas = pygame.Surface((20, 20))
+            canvas.set_colorkey((0, 0, 0))  # Bounding rect of everything drawn
+            canvas.blit(reused.image, (0, 0))
+            colored = canvas.get_bounding_rect()
+            particle_surface_kept = reused.image is image and colored.size == (reused.size, reused.size)
+    if not mismatches and particle_surface_kept:
+        print("[PASS] Reused sprites are the same objects, in the state of freshly created ones, "
+              "particles keep their surface")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Reuse differs from a new object for {mismatches}, "
+              f"particle surface kept and drawn at its size {particle_surface_kept}")
+        tests_failed += 1
+
+    # Test 2: Pooled gameplay plays exactly like gameplay allocating every sprite
+    # (level 3 has the most enemy hits, level 5 the boss volleys)
+    print("\nTest 2: Pooled gameplay replays identically to unpooled gameplay...")
+    mismatches = []
+    hits = dict.fromkeys(("lasers", "mermeladas", "particles"), 0)
+    for level_number in (3, 5):
+        pooled_session, pooled = play_powered_up(level_number, pooled=True)
+        _, unpooled = play_powered_up(level_number, pooled=False)
+        for name, pool in pooled_session.pools.items():
+            hits[name] += pool.hits
+        if pooled != unpooled:
+            step = next(i for i, (a, b) in enumerate(zip(pooled, unpooled)) if a != b)
+            mismatches.append((level_number, step))
+    if not mismatches and all(hits.values()):
+        print(f"[PASS] Levels 3 and 5 identical for {STEPS} steps; reuse hits: "
+              + ", ".join(f"{name} {count}" for name, count in hits.items()))
+        tests_passed += 1
+    else:
+        print(f"[FAIL] (level, first differing step): {mismatches}, reuse hits {hits}")
+        tests_failed += 1
+
+    # Test 3: Statistics, reuse bookkeeping and PerformanceMonitor reporting
+    print("\nTest 3: Pool statistics are tracked and reported...")
+    session = GameSession()
+    with contextlib.redirect_stdout(io.StringIO()):
+        session.start_new_game(1)
+    pool = session.laser_pool
+    lasers = [pool.acquire(100 + i * 50, 300, 1) for i in range(3)]
+    for laser in lasers:
+        session.lasers.add(laser)
+    session.previous_positions = {laser: laser.rect.topleft for laser in lasers}
+    lasers[0].kill()
+    lasers[0].kill()  # A second kill must not release it twice
+    reused = pool.acquire(700, 300, -1)
+    counts_ok = (reused is lasers[0] and pool.hits == 1 and pool.misses == 3 and
+                 pool.in_use == 3 and pool.high_water == 3 and not pool.free)
+    forgot_position = reused not in session.previous_positions and lasers[1] in session.previous_positions
+    session.lasers.add(reused)
+    session.retry_level()
+    returned = not session.lasers and len(pool.free) == 3 and pool.in_use == 0
+
+    monitor = PerformanceMonitor()
+    for name, session_pool in session.pools.items():
+        monitor.register_pool(name, session_pool)
+    reported = monitor.get_pool_stats()
+    monitor.close()
+    if counts_ok and forgot_position and returned and list(reported) == ["lasers", "mermeladas", "particles"] \
+            and reported["lasers"]["high_water"] == 3:
+        print(f"[PASS] lasers: {reported['lasers']}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] counts {counts_ok} ({pool.get_stats()}), previous position dropped {forgot_position}, "
+              f"returned on retry {returned}, reported {dict(reported)}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,140 @@
+"""
+Overlay Screen Test for Coffee Bros
+Verifies the level complete, transition, victory, pause and game over screens are
+composed once per shown values and look like the screens drawn piece by piece.
+"""
+
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.menu import PauseMenu, GameOverMenu
+from src.overlay import CachedOverlay, compose_level_complete, compose_transition, compose_victory
+
+
+def game_frame():
+    """A busy frame for the overlays to dim"""
+    frame = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    for x in range(0, WINDOW_WIDTH, 40):
+        for y in range(0, WINDOW_HEIGHT, 40):
+            frame.fill(((x * 7) % 256, (y * 5) % 256, (x + y) % 256), (x, y, 40, 40))
+    return frame
+
+
+def draw_piece_by_piece(compose, alpha, values):
+    """Draw a screen the way it was drawn before caching: dim layer, then each text"""
+    screen = game_frame()
+    dim = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    dim.set_alpha(alpha)
+    dim.fill((0, 0, 0))
+    screen.blit(dim, (0, 0))
+    for item, position in compose(*values):
+        screen.blit(item, position)
+    return screen
+
+
+def max_difference(a, b):
+    """Largest per-channel difference between two surfaces"""
+    a_bytes = pygame.image.tobytes(a, 'RGB')
+    b_bytes = pygame.image.tobytes(b, 'RGB')
+    return max(abs(x - y) for x, y in zip(a_bytes, b_bytes))
+
+
+def main():
+    """Run all overlay screen tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - OVERLAY SCREEN TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Screens are composed once per shown values, not once per frame
+    print("Test 1: Overlays are composed only when a shown value changes...")
+    screen = game_frame()
+    transition = CachedOverlay(compose_transition, alpha=200)
+    for frame in range(120):
+        show_prompt = (frame // 30) % 2 == 0  # Blinking prompt
+        transition.draw(screen, "Coffee Hills", 1, 1500, 1500, 42.0, show_prompt)
+    blink_composes = transition.compose_count
+    transition.draw(screen, "Coffee Hills", 1, 1500, 1600, 42.0, True)  # Score changed
+    victory = CachedOverlay(compose_victory, alpha=220)
+    for frame in range(60):
+        victory.draw(screen, 9000, 300.5)
+    if blink_composes == 2 and transition.compose_count == 3 and victory.compose_count == 1:
+        print("[PASS] 120 transition frames composed twice (prompt on/off), 60 victory frames once")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] transition composed {blink_composes} then {transition.compose_count}, "
+              f"victory {victory.compose_count}")
+        tests_failed += 1
+
+    # Test 2: The cached screens look like the screens drawn piece by piece
+    # (only antialiased text edges may differ slightly from blending order)
+    print("\nTest 2: Cached overlays match piece-by-piece drawing...")
+    differences = {}
+    for name, compose, alpha, values in (
+            ("level complete", compose_level_complete, 180, (1500, 42.0)),
+            ("transition", compose_transition, 200, ("Coffee Hills", 1, 1500, 1500, 42.0, True)),
+            ("victory", compose_victory, 220, (9000, 300.5))):
+        screen = game_frame()
+        CachedOverlay(compose, alpha).draw(screen, *values)
+        differences[name] = max_difference(screen, draw_piece_by_piece(compose, alpha, values))
+    if all(difference <= 24 for difference in differences.values()):
+        print(f"[PASS] Largest channel differences: {differences}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Largest channel differences: {differences}")
+        tests_failed += 1
+
+    # Test 3: Pause and game over menus redraw from their cached overlays
+    print("\nTest 3: Pause and game over menus are composed once per selection...")
+    screen = game_frame()
+    pause_menu = PauseMenu()
+    for frame in range(60):
+        if frame == 30:
+            pause_menu.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN))
+        pause_menu.draw(screen)
+    pause_menu.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP))
+    pause_menu.draw(screen)  # Back to the first option, still cached
+    game_over_menu = GameOverMenu()
+    for frame in range(90):
+        game_over_menu.update()
+        game_over_menu.draw(screen, 1200)
+    game_over_menu.draw(screen, 1200)
+    # Options are dim during the input delay, then selectable: two screens
+    if pause_menu.overlay.compose_count == 2 and game_over_menu.overlay.compose_count == 2:
+        print("[PASS] 61 pause frames and 91 game over frames composed twice each")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] pause composed {pause_menu.overlay.compose_count}, "
+              f"game over composed {game_over_menu.overlay.compose_count}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
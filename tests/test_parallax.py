@@ -0,0 +1,127 @@
+"""
+Parallax Background Test for Coffee Bros
+Verifies parallax layers scroll at their own speed, wrap seamlessly, and that the
+cached composite used while the camera stands still matches a full redraw.
+"""
+
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.draw_utils import draw_tiled_background
+from src.parallax import ParallaxLayer, ParallaxBackground
+
+
+def striped_surface(width, height, alpha=False):
+    """Surface with vertical stripes so any misplaced pixel column shows up"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0)
+    for x in range(width):
+        surface.fill(((x * 7) % 256, (x * 13) % 256, 200, 160 if alpha else 255), (x, 0, 1, height // 2))
+    return surface
+
+
+def pixels(surface):
+    """Raw RGB bytes of a surface, for exact comparisons"""
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def main():
+    """Run all parallax tests"""
+    pygame.init()
+    pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - PARALLAX BACKGROUND TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+    cameras = [0, 1, 299, 300, 799, 1234, 3199, 4567]
+
+    # Test 1: A single level-speed layer draws exactly like the tiled background
+    print("Test 1: Level-speed layer matches draw_tiled_background...")
+    mismatches = []
+    for width in (300, 800, 3200):
+        image = striped_surface(width, WINDOW_HEIGHT).convert()
+        background = ParallaxBackground([ParallaxLayer(image, 1.0, 0, WINDOW_WIDTH)], WINDOW_WIDTH, WINDOW_HEIGHT)
+        for camera_x in cameras:
+            expected = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            actual = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            draw_tiled_background(expected, image, camera_x, 5000, WINDOW_WIDTH, WINDOW_HEIGHT)
+            background.draw(actual, camera_x)
+            if pixels(expected) != pixels(actual):
+                mismatches.append((width, camera_x))
+    if not mismatches:
+        print(f"[PASS] Identical for 3 tile widths at {len(cameras)} camera positions")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Mismatch at (tile width, camera): {mismatches}")
+        tests_failed += 1
+
+    # Test 2: Scroll factors and static layers
+    print("\nTest 2: Layers scroll at their own speed...")
+    near = striped_surface(250, 100, alpha=True)
+    half = ParallaxBackground([ParallaxLayer(near, 0.5, 400, WINDOW_WIDTH)], WINDOW_WIDTH, WINDOW_HEIGHT)
+    full = ParallaxBackground([ParallaxLayer(near, 1.0, 400, WINDOW_WIDTH)], WINDOW_WIDTH, WINDOW_HEIGHT)
+    static = ParallaxBackground([ParallaxLayer(near, 0, 400, WINDOW_WIDTH)], WINDOW_WIDTH, WINDOW_HEIGHT)
+    a = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    b = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    half.draw(a, 600)
+    full.draw(b, 300)
+    speed_ok = pixels(a) == pixels(b)
+    static.draw(a, 0)
+    static.draw(b, 999)
+    if speed_ok and pixels(a) == pixels(b) and not static.moving_layers:
+        print("[PASS] Half-speed layer at 600 matches full-speed at 300, static layer baked and fixed")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] speed match {speed_ok}, static layers still moving: {len(static.moving_layers)}")
+        tests_failed += 1
+
+    # Test 3: Cached composite while the camera is still
+    print("\nTest 3: Still camera reuses the composed stack...")
+    layers = [
+        ParallaxLayer(striped_surface(WINDOW_WIDTH, WINDOW_HEIGHT), 0, 0, WINDOW_WIDTH),
+        ParallaxLayer(striped_surface(1000, 300, alpha=True), 0.3, 100, WINDOW_WIDTH),
+        ParallaxLayer(striped_surface(120, 80, alpha=True), 0.9, 500, WINDOW_WIDTH),
+    ]
+    background = ParallaxBackground(layers, WINDOW_WIDTH, WINDOW_HEIGHT, (10, 20, 30))
+    reference = ParallaxBackground(layers, WINDOW_WIDTH, WINDOW_HEIGHT, (10, 20, 30))
+    blit_counts = []
+    matches = True
+    for camera_x in (100, 150, 150, 150, 160, 160, 160):
+        actual = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        expected = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        blit_counts.append(background.draw(actual, camera_x))
+        reference._compose(expected, tuple(layer.get_offset(camera_x) for layer in reference.moving_layers))
+        matches = matches and pixels(actual) == pixels(expected)
+    if matches and blit_counts[2:4] == [1, 1] and blit_counts[5:] == [1, 1] and blit_counts[4] > 1:
+        print(f"[PASS] Output matches a full redraw, blits per frame {blit_counts}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] matches {matches}, blits per frame {blit_counts}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,91 @@
+"""
+Performance Monitor Test for Coffee Bros
+Verifies the ring buffer statistics, per-section timing and background memory
+sampling used by PerformanceMonitor.
+"""
+
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.performance_monitor import PerformanceMonitor, RingBuffer
+
+
+def main():
+    """Run all performance monitor tests"""
+    print("\n" + "="*70)
+    print("COFFEE BROS - PERFORMANCE MONITOR TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Ring buffer keeps the newest samples and a correct running sum
+    print("Test 1: Ring buffer window, mean and percentiles...")
+    buffer = RingBuffer(100)
+    for value in range(1, 251):  # Wraps around 2.5 times
+        buffer.append(float(value))
+    expected = list(range(151, 251))
+    p50, p95, p99 = buffer.percentiles(50, 95, 99)
+    if (sorted(buffer.samples()) == expected and abs(buffer.mean() - 200.5) < 1e-9 and
+            buffer.max() == 250 and (p50, p95, p99) == (200, 245, 249)):
+        print(f"[PASS] Window of {len(buffer)}, mean {buffer.mean()}, p50/p95/p99 {p50}/{p95}/{p99}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] mean {buffer.mean()}, percentiles {p50}/{p95}/{p99}")
+        tests_failed += 1
+
+    # Test 2: Section time is summed per frame and windowed
+    print("\nTest 2: Section timings accumulate per frame...")
+    monitor = PerformanceMonitor(sample_size=10, memory_interval=0.01)
+    for _ in range(15):
+        for _ in range(2):  # Two simulation steps per frame
+            with monitor.section("physics"):
+                time.sleep(0.001)
+        monitor.update()
+    physics = monitor.get_section_stats()["physics"]
+    if len(monitor.section_samples["physics"]) == 10 and physics["mean_ms"] >= 2.0:
+        print(f"[PASS] physics mean {physics['mean_ms']}ms, p95 {physics['p95_ms']}ms over 10 frames")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] physics stats {physics}")
+        tests_failed += 1
+
+    # Test 3: Memory is sampled off the game loop and update() stays cheap
+    print("\nTest 3: Background memory sampling...")
+    time.sleep(0.05)
+    stats = monitor.get_stats()
+    start = time.perf_counter()
+    for _ in range(1000):
+        monitor.update()
+    per_update_ms = (time.perf_counter() - start)
+    monitor.close()
+    monitor.memory_sampler.join(timeout=1.0)
+    if (stats["memory_mb"] > 0 and monitor.memory_sampler.is_alive() is False and
+            per_update_ms < 0.1):
+        print(f"[PASS] {stats['memory_mb']}MB sampled in background, update() {per_update_ms * 1000:.1f}us")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] memory {stats['memory_mb']}MB, update() {per_update_ms * 1000:.1f}us")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
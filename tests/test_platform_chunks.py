@@ -0,0 +1,96 @@
+"""
+Platform Chunk Test for Coffee Bros
+Verifies the pre-rendered platform chunks draw the level geometry exactly like
+drawing each platform sprite, with a constant number of blits per frame.
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.level import Level
+from src.optimization import OptimizedRenderer
+
+
+def main():
+    """Run all platform chunk tests"""
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - PLATFORM CHUNK TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+    renderer = OptimizedRenderer(screen)
+
+    # Test 1: Chunks look exactly like the individual platform sprites
+    print("Test 1: Chunks match per-sprite platform drawing on every level...")
+    mismatches = []
+    max_blits = 0
+    for level_number in range(1, 6):
+        with contextlib.redirect_stdout(io.StringIO()):
+            level = Level.load_from_file(level_number)
+        level_width = level.metadata.get("width", WINDOW_WIDTH)
+        for camera_x in range(0, level_width - WINDOW_WIDTH + 1, 173):
+            expected = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            actual = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+            renderer.screen = expected
+            renderer.draw_sprites_with_offset(level.platforms, camera_x)
+            max_blits = max(max_blits, level.platform_chunks.draw(actual, camera_x))
+            if pygame.image.tobytes(expected, 'RGB') != pygame.image.tobytes(actual, 'RGB'):
+                mismatches.append((level_number, camera_x))
+    if not mismatches and max_blits <= 2:
+        print(f"[PASS] Identical on levels 1-5, at most {max_blits} blits per frame")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Mismatch at (level, camera): {mismatches[:5]}, max blits {max_blits}")
+        tests_failed += 1
+
+    # Test 2: Platforms are drawn only from the chunks, kept across a reset
+    print("\nTest 2: Chunks and platforms are kept when the level resets...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        level = Level.load_from_file(1)
+        chunks_before = level.platform_chunks
+        platforms_before = set(level.platforms)
+        level.reset_level()
+    chunked = {platform for chunk_platforms, _, _ in level.platform_chunks.chunks.values()
+               for platform in chunk_platforms}
+    in_all_sprites = any(platform in level.all_sprites for platform in level.platforms)
+    if (level.platform_chunks is chunks_before and set(level.platforms) == platforms_before and
+            chunked == platforms_before and not in_all_sprites):
+        print(f"[PASS] {len(level.platforms)} platforms in {len(level.platform_chunks)} chunks reused, none in all_sprites")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] same chunks {level.platform_chunks is chunks_before}, "
+              f"same platforms {set(level.platforms) == platforms_before}, "
+              f"all platforms chunked {chunked == platforms_before}, in all_sprites {in_all_sprites}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,136 @@
+"""
+Spatial Grid Test for Coffee Bros
+Verifies the persistent SpatialGrid used by main.py's collision phase returns the
+same collisions as pygame.sprite.spritecollide while sprites move, die and spawn.
+"""
+
+import random
+import sys
+import os
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.optimization import SpatialGrid, optimize_collision_detection
+
+
+class Box(pygame.sprite.Sprite):
+    """Minimal moving sprite for grid tests"""
+
+    def __init__(self, x, y, width, height, velocity_x, velocity_y):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, width, height)
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+
+    def update(self):
+        self.rect.x += self.velocity_x
+        self.rect.y += self.velocity_y
+
+
+def main():
+    """Run all spatial grid tests"""
+    rng = random.Random(7)
+    tests_passed = 0
+    tests_failed = 0
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - SPATIAL GRID TESTING")
+    print("="*70 + "\n")
+
+    # Build two groups sharing one grid (like enemies and lasers in main.py)
+    enemies = pygame.sprite.Group()
+    lasers = pygame.sprite.Group()
+    for _ in range(200):
+        enemies.add(Box(rng.randint(0, 5000), rng.randint(0, 600), 40, 40,
+                        rng.choice([-2, 2]), rng.choice([-1, 0, 1])))
+    for _ in range(30):
+        lasers.add(Box(rng.randint(0, 5000), rng.randint(0, 600), 32, 32,
+                       rng.choice([-10, 10]), 0))
+    probes = [Box(rng.randint(0, 5000), rng.randint(0, 600), 40, 60, 5, 0) for _ in range(50)]
+
+    grid = SpatialGrid(cell_size=100)
+
+    # Test 1: Grid collisions match spritecollide over many frames
+    print("Test 1: Grid collisions match spritecollide while sprites move...")
+    mismatches = 0
+    rebuckets = 0
+    for frame in range(300):
+        enemies.update()
+        lasers.update()
+        for probe in probes:
+            probe.update()
+
+        # Kill and spawn sprites to exercise removal and insertion
+        if frame % 10 == 0:
+            rng.choice(enemies.sprites()).kill()
+            enemies.add(Box(rng.randint(0, 5000), rng.randint(0, 600), 40, 40, 2, 0))
+
+        before = dict(grid.sprite_cells)
+        grid.refresh(enemies, lasers)
+        rebuckets += sum(1 for s, cells in grid.sprite_cells.items() if s in before and before[s] != cells)
+
+        for probe in probes:
+            for group in (enemies, lasers):
+                expected = pygame.sprite.spritecollide(probe, group, False)
+                actual = optimize_collision_detection(probe, group, grid)
+                if expected != actual:
+                    mismatches += 1
+    if mismatches == 0:
+        print("[PASS] Grid and spritecollide agree on every query")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] {mismatches} queries disagreed with spritecollide")
+        tests_failed += 1
+
+    # Test 2: Killed sprites are dropped from the grid
+    print("\nTest 2: Killed sprites are removed from the grid...")
+    tracked_ok = set(grid.sprite_cells) == set(enemies) | set(lasers)
+    if tracked_ok:
+        print("[PASS] Grid tracks exactly the live sprites")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Grid tracks {len(grid.sprite_cells)} sprites, expected {len(enemies) + len(lasers)}")
+        tests_failed += 1
+
+    # Test 3: Sprites are only re-bucketed when they cross a cell boundary
+    print("\nTest 3: Sprites only re-bucket on cell boundary crossings...")
+    moves = 300 * (len(enemies) + len(lasers))
+    if 0 < rebuckets < moves // 2:
+        print(f"[PASS] {rebuckets} re-buckets for ~{moves} sprite moves")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] {rebuckets} re-buckets for ~{moves} sprite moves")
+        tests_failed += 1
+
+    # Test 4: Emptying groups (level change) clears the grid on next refresh
+    print("\nTest 4: Emptied groups clear the grid...")
+    enemies.empty()
+    lasers.empty()
+    grid.refresh(enemies, lasers)
+    if not grid.sprite_cells and not grid.grid:
+        print("[PASS] Grid is empty after groups are emptied")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] Grid still holds {len(grid.sprite_cells)} sprites")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,120 @@
+"""
+Text Renderer Test for Coffee Bros
+Verifies fonts are shared, rendered text is cached by (font, text, color), and
+changing numbers are drawn from the digit-glyph atlas without rendering new text.
+"""
+
+import os
+import sys
+
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.chdir(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.level_name_display import LevelNameDisplay
+from src.menu import MainMenu, PauseMenu, GameOverMenu
+from src.text_renderer import TextRenderer, text_renderer
+
+
+def pixels(surface):
+    """Raw RGBA bytes of a surface, for comparison"""
+    return pygame.image.tobytes(surface, 'RGBA')
+
+
+def main():
+    """Run all text renderer tests"""
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    print("\n" + "="*70)
+    print("COFFEE BROS - TEXT RENDERER TESTING")
+    print("="*70 + "\n")
+
+    tests_passed = 0
+    tests_failed = 0
+
+    # Test 1: Menus and the level name display share fonts and rendered text
+    print("Test 1: Fonts and rendered text are shared...")
+    main_menu, pause_menu, game_over_menu = MainMenu(), PauseMenu(), GameOverMenu()
+    first, retry = LevelNameDisplay(1, "Coffee Hills"), LevelNameDisplay(1, "Coffee Hills")
+    shared_fonts = (main_menu.option_font is pause_menu.option_font is game_over_menu.option_font and
+                    main_menu.title_font is text_renderer.get_font(96))
+    if shared_fonts and first.text_surface is retry.text_surface:
+        print(f"[PASS] {len(text_renderer.asset_cache.fonts)} shared fonts, level name rendered once")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] fonts shared {shared_fonts}, level name shared {first.text_surface is retry.text_surface}")
+        tests_failed += 1
+
+    # Test 2: The render cache returns identical surfaces and drops the least recently used
+    print("\nTest 2: Rendered text is cached and evicted least recently used first...")
+    renderer = TextRenderer(max_cached=2)
+    font = renderer.get_font(36)
+    hello = renderer.render(font, "Hello", (255, 255, 255))
+    same = renderer.render(font, "Hello", (255, 255, 255)) is hello
+    identical = pixels(hello) == pixels(font.render("Hello", True, (255, 255, 255)))
+    renderer.render(font, "World", (255, 255, 255))
+    renderer.render(font, "Hello", (255, 255, 255))  # Hello is now the most recently used
+    renderer.render(font, "!", (255, 255, 255))
+    kept = [text for _, text, _ in renderer.rendered]
+    if same and identical and kept == ["Hello", "!"] and renderer.hits == 2:
+        print(f"[PASS] Cached surfaces are pixel identical to font.render, kept {kept}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] same {same}, identical {identical}, kept {kept}, hits {renderer.hits}")
+        tests_failed += 1
+
+    # Test 3: Changing numbers are drawn from the glyph atlas without rendering new text
+    print("\nTest 3: Scores and timers are composed from cached digit glyphs...")
+    renderer = TextRenderer()
+    font = renderer.get_font(36)
+    renderer.draw_text(screen, font, "SCORE: 00000", (255, 255, 255), topleft=(10, 10))
+    renderer.draw_text(screen, font, "POWERUP: 0.0s", (255, 215, 0), midtop=(WINDOW_WIDTH // 2, 10))
+    rendered = set(renderer.rendered)
+    rects = []
+    for value in range(0, 1000, 7):
+        rects.append(renderer.draw_text(screen, font, f"SCORE: {value:05d}", (255, 255, 255), topleft=(10, 10)))
+        renderer.draw_text(screen, font, f"POWERUP: {value / 100:.1f}s", (255, 215, 0),
+                           midtop=(WINDOW_WIDTH // 2, 10))
+    # Digits alone are exactly the atlas glyphs side by side
+    digits = pygame.Surface((200, 40), pygame.SRCALPHA)
+    renderer.draw_text(digits, font, "0123", (255, 255, 255))
+    expected = pygame.Surface((200, 40), pygame.SRCALPHA)
+    x = 0
+    for digit in "0123":
+        glyph = font.render(digit, True, (255, 255, 255))
+        expected.blit(glyph, (x, 0))
+        x += glyph.get_width()
+    # Digits sit at fixed advances (no kerning), so the score never changes width
+    label_width = font.size("SCORE: ")[0]
+    width_ok = all(rect.width == label_width + sum(font.size(digit)[0] for digit in f"{value:05d}")
+                   for rect, value in zip(rects, range(0, 1000, 7)))
+    if set(renderer.rendered) == rendered and pixels(digits) == pixels(expected) and width_ok:
+        print(f"[PASS] {2 * len(rects)} HUD updates drawn without rendering text, only {sorted(text for _, text, _ in rendered)}")
+        tests_passed += 1
+    else:
+        print(f"[FAIL] new renders {sorted(set(renderer.rendered) - rendered)}, digits match {pixels(digits) == pixels(expected)}, "
+              f"widths from glyph advances {width_ok}")
+        tests_failed += 1
+
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    total = tests_passed + tests_failed
+    print(f"Total Tests: {total}")
+    print(f"Passed: {tests_passed}")
+    print(f"Failed: {tests_failed}")
+    print(f"Success Rate: {(tests_passed/total*100):.1f}%")
+    print("="*70 + "\n")
+
+    pygame.quit()
+    return tests_failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)